@@ -7,11 +7,32 @@ and benchmarks their performance on large datasets.
 
 Features:
 - Bubble Sort, Insertion Sort, Merge Sort implementations
-- CSV data loading with validation
-- Column-based sorting (ID, FirstName, LastName)
-- Scalability testing with different dataset sizes
-- Performance tracking and progress visualization
+- Bottom-Up Merge Sort with two reusable buffers
+- Adaptive Hybrid Sort (natural runs + galloping merges)
+- Radix Sort (LSD for integer IDs, MSD for name strings)
+- Parallel Merge Sort across CPU cores (process pool)
+- Partial sort (bounded-heap top-k selection) with keyset paging
+- Optional NumPy backend: stable argsort reference and vectorized verification
+- CSV data loading with validation into a compact columnar store
+- Background, chunked loading; benchmarks start once their rows are in
+- Binary dataset cache so unchanged CSVs are not re-parsed on startup
+- LRU cache of sorted permutations, reused for repeated and smaller sorts
+- Incremental sorting: new rows are merged into an existing sorted order
+- Sorted-column indexes: ID lookup, ID ranges and name prefix search
+- SQLite benchmark history with significance-tested regression checks
+- Column-based sorting (ID, FirstName, LastName), including multi-column
+  sort specs with per-column direction
+- Scalability testing with different dataset sizes, plus scaling sweeps that
+  fit t(n) ≈ c·n^b and predict run times before long sorts start
+- Performance tracking and rate-limited progress visualization
+- Timing harness: warmup runs, repeated timed runs, GC control, median/IQR
+- Opt-in operation counts: comparisons, moves, allocations, recursion depth
+- Peak memory per run: tracemalloc peak, bytes/record and RSS growth
 - Cancel operation support for long-running sorts
+- Process-isolated benchmarks with instant cancel and wall-clock time limits
+- External merge sort of CSV files larger than memory
+- Headless command-line runner with JSON/CSV result export
+- Seeded synthetic data generator with adversarial distributions
 - Portable - auto-detects file paths
 """
 
@@ -19,13 +40,46 @@ from compileall import compile_file
 import os
 import sys
 import csv
+import io
+import json
+import sqlite3
 import time
 import math
+import random
+import gc
+import statistics
+import heapq
+import itertools
+import bisect
+import shutil
+import signal
+import tempfile
 import threading
-import tkinter as tk
-from tkinter import ttk, scrolledtext, messagebox
+import tracemalloc
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, wait
+from collections import OrderedDict
+from array import array
+import argparse
+import platform
 from datetime import datetime
 
+try:
+    import tkinter as tk
+    from tkinter import ttk, scrolledtext, messagebox, filedialog
+except ImportError:  # Headless boxes without Tk can still run --headless
+    tk = None
+
+try:
+    import psutil  # Optional: resident set size where /proc is not available
+except ImportError:
+    psutil = None
+
+try:
+    import numpy as np  # Optional: vectorized reference sort and verification
+except ImportError:
+    np = None
+
 # ============================================================================
 # PATH CONFIGURATION - Auto-detect directory
 # ============================================================================
@@ -69,228 +123,3138 @@ def get_application_paths():
 BASE_DIR, DATA_DIR, DATA_FILE_PATH = get_application_paths()
 
 # ============================================================================
-# SORTING ALGORITHMS - Implemented from scratch
+# COLUMNAR DATASET - Array-backed record store
 # ============================================================================
 
-def bubble_sort(data, key, descending=False, progress_callback=None, cancel_event=None):
+REQUIRED_COLUMNS = ['ID', 'FirstName', 'LastName']
+
+class StringColumn:
+    """Dictionary-encoded string column.
+    
+    Every distinct string is stored once in `values`; each row only keeps a
+    4-byte code into that list.
     """
-    Bubble Sort implementation.
-    Time Complexity: O(n²) worst/average, O(n) best (already sorted)
-    Space Complexity: O(1)
-    Stable: Yes
+    
+    def __init__(self):
+        self.values = []
+        self.codes = array('i')
+        self._code_of = {}
+    
+    @classmethod
+    def from_parts(cls, values, codes):
+        """Rebuild a column from its dictionary and code array."""
+        column = cls()
+        column.values = values
+        column.codes = codes
+        column._code_of = {value: code for code, value in enumerate(values)}
+        return column
+    
+    def append(self, value):
+        code = self._code_of.get(value)
+        if code is None:
+            code = len(self.values)
+            self._code_of[value] = code
+            self.values.append(value)
+        self.codes.append(code)
+    
+    def __len__(self):
+        return len(self.codes)
+    
+    def __getitem__(self, row):
+        return self.values[self.codes[row]]
+
+class ColumnarDataset:
+    """Column-oriented store for the ID/FirstName/LastName schema.
+    
+    IDs live in a typed array('q') and names are dictionary-encoded, which
+    costs roughly 16 bytes per row instead of a dict per row. Rows are
+    addressed by integer index; slicing returns a DatasetView that shares
+    the underlying columns instead of copying them.
+    """
+    
+    def __init__(self):
+        self.ids = array('q')
+        self.first_names = StringColumn()
+        self.last_names = StringColumn()
+        self.skipped_rows = 0  # Input rows dropped for a missing field or non-integer ID
+    
+    def append(self, record_id, first_name, last_name):
+        """Append one row. `record_id` must be an integer."""
+        self.ids.append(record_id)
+        self.first_names.append(first_name)
+        self.last_names.append(last_name)
+    
+    def __len__(self):
+        return len(self.ids)
+    
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return DatasetView(self, range(*item.indices(len(self))))
+        return self.row(item)
+    
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self.row(i)
+    
+    def row(self, i):
+        """Return row `i` as a plain dict (for display only)."""
+        return {
+            'ID': self.ids[i],
+            'FirstName': self.first_names[i],
+            'LastName': self.last_names[i]
+        }
+    
+    def column_values(self, name, rows):
+        """Return the values of column `name` for the given row indices."""
+        if name == 'ID':
+            column = self.ids
+            if isinstance(rows, range) and rows.step == 1:
+                return column[rows.start:rows.stop].tolist()
+            return [column[r] for r in rows]
+        
+        if name == 'FirstName':
+            column = self.first_names
+        elif name == 'LastName':
+            column = self.last_names
+        else:
+            raise KeyError(f"Unknown column: {name}")
+        
+        values = column.values
+        if isinstance(rows, range) and rows.step == 1:
+            return [values[code] for code in column.codes[rows.start:rows.stop]]
+        codes = column.codes
+        return [values[codes[r]] for r in rows]
+    
+    def column(self, name):
+        return self.column_values(name, range(len(self)))
+    
+    def take(self, order):
+        return DatasetView(self, range(len(self))).take(order)
+
+class DatasetView:
+    """A sequence of row indices into a ColumnarDataset.
+    
+    Slicing a view with a contiguous range is O(1); sorted results are views
+    holding the permuted row indices in an array('q').
+    """
+    
+    def __init__(self, dataset, rows):
+        self.dataset = dataset
+        self.rows = rows
+    
+    def __len__(self):
+        return len(self.rows)
+    
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return DatasetView(self.dataset, self.rows[item])
+        return self.dataset.row(self.rows[item])
+    
+    def __iter__(self):
+        row = self.dataset.row
+        for r in self.rows:
+            yield row(r)
+    
+    def column(self, name):
+        return self.dataset.column_values(name, self.rows)
+    
+    def take(self, order):
+        """Return a new view with this view's rows rearranged by `order`."""
+        rows = self.rows
+        if isinstance(rows, range) and rows.start == 0 and rows.step == 1:
+            return DatasetView(self.dataset, array('q', order))
+        return DatasetView(self.dataset, array('q', [rows[i] for i in order]))
+
+# ============================================================================
+# DATASET CACHE - Binary snapshot of the parsed CSV
+# ============================================================================
+
+CACHE_MAGIC = b"DAASORT\x01"
+
+def dataset_cache_path(csv_path):
+    """Sidecar cache file stored next to the CSV."""
+    return csv_path + ".cache"
+
+def csv_signature(csv_path):
+    """Identify a CSV file by path, size and modification time."""
+    stat = os.stat(csv_path)
+    return {
+        'path': os.path.abspath(csv_path),
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns
+    }
+
+def save_dataset_cache(dataset, csv_path, cache_path=None, signature=None):
+    """Write `dataset` as a binary snapshot keyed on the CSV's signature.
+    
+    Pass the `signature` taken before the CSV was parsed; it defaults to
+    the file's current one.
+    
+    Layout: magic, 4-byte header length, JSON header, then the raw ID array,
+    both code arrays and the two NUL-separated name dictionaries. The file is
+    written to a temp name and renamed, so a crash never leaves half a cache.
+    """
+    cache_path = cache_path or dataset_cache_path(csv_path)
+    first_blob = "\0".join(dataset.first_names.values).encode('utf-8')
+    last_blob = "\0".join(dataset.last_names.values).encode('utf-8')
+    header = dict(signature or csv_signature(csv_path),
+                  byteorder=sys.byteorder,
+                  rows=len(dataset),
+                  skipped_rows=dataset.skipped_rows,
+                  first_values=len(dataset.first_names.values),
+                  last_values=len(dataset.last_names.values),
+                  first_bytes=len(first_blob),
+                  last_bytes=len(last_blob))
+    header_bytes = json.dumps(header).encode('utf-8')
+    
+    temp_path = cache_path + ".tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(CACHE_MAGIC)
+        f.write(len(header_bytes).to_bytes(4, 'little'))
+        f.write(header_bytes)
+        dataset.ids.tofile(f)
+        dataset.first_names.codes.tofile(f)
+        dataset.last_names.codes.tofile(f)
+        f.write(first_blob)
+        f.write(last_blob)
+    os.replace(temp_path, cache_path)
+
+def load_dataset_cache(csv_path, cache_path=None):
+    """Bulk-read the snapshot for `csv_path`.
+    
+    Returns None when there is no cache or it is stale (the CSV's path, size
+    or mtime changed) or unreadable; the caller then re-parses the CSV.
+    """
+    cache_path = cache_path or dataset_cache_path(csv_path)
+    if not os.path.exists(cache_path):
+        return None
+    
+    try:
+        with open(cache_path, 'rb') as f:
+            if f.read(len(CACHE_MAGIC)) != CACHE_MAGIC:
+                return None
+            header_len = int.from_bytes(f.read(4), 'little')
+            header = json.loads(f.read(header_len).decode('utf-8'))
+            
+            signature = csv_signature(csv_path)
+            if any(header.get(k) != v for k, v in signature.items()):
+                return None
+            if header['byteorder'] != sys.byteorder:
+                return None
+            
+            rows = header['rows']
+            dataset = ColumnarDataset()
+            dataset.ids.fromfile(f, rows)
+            first_codes = array('i')
+            first_codes.fromfile(f, rows)
+            last_codes = array('i')
+            last_codes.fromfile(f, rows)
+            first_values = f.read(header['first_bytes']).decode('utf-8').split("\0")
+            last_values = f.read(header['last_bytes']).decode('utf-8').split("\0")
+    except (OSError, EOFError, ValueError, KeyError):
+        return None
+    
+    if header['first_values'] == 0:
+        first_values = []
+    if header['last_values'] == 0:
+        last_values = []
+    if len(first_values) != header['first_values'] or len(last_values) != header['last_values']:
+        return None
+    
+    dataset.first_names = StringColumn.from_parts(first_values, first_codes)
+    dataset.last_names = StringColumn.from_parts(last_values, last_codes)
+    dataset.skipped_rows = header.get('skipped_rows', 0)
+    return dataset
+
+# ============================================================================
+# DATA LOADING - Chunked CSV ingestion
+# ============================================================================
+
+LOAD_CHUNK_BYTES = 256 * 1024
+CSV_BATCH_ROWS = 1024   # Rows parsed per islice() call
+
+def open_csv_chunks(path, chunk_bytes=LOAD_CHUNK_BYTES):
+    """Open a CSV file, check its header and read it in chunks of rows.
+    
+    Returns (header, chunks); `chunks` yields (rows, bytes_read) for about
+    `chunk_bytes` of input at a time, skipping blank lines, and closes the
+    file when exhausted or closed. The bytes are decoded by a TextIOWrapper
+    with newline='', so only the csv module decides where a row ends:
+    quoted fields may span lines, and separators that str.splitlines()
+    would also break on (\x85, \u2028, \x1c-\x1e) stay inside their field.
+    Raises ValueError for an empty file or missing columns.
     """
-    # Create a copy to avoid modifying original data
-    arr = data[:]
-    n = len(arr)
+    file = open(path, 'rb')
+    try:
+        text = io.TextIOWrapper(file, encoding='utf-8-sig', newline='')
+        reader = csv.reader(text)
+        header = next(reader, None)
+        if header is None:
+            raise ValueError("CSV file is empty.")
+        if not all(col in header for col in REQUIRED_COLUMNS):
+            missing = [col for col in REQUIRED_COLUMNS if col not in header]
+            raise ValueError(f"Missing required columns: {', '.join(missing)}")
+    except BaseException:
+        file.close()
+        raise
+    return header, _csv_chunks(text, reader, chunk_bytes)
+
+def _csv_chunks(text, reader, chunk_bytes):
+    file = text.buffer
+    with text:
+        rows = []
+        chunk_end = file.tell() + chunk_bytes
+        while True:
+            # islice() keeps the per-row loop in C; the raw file position
+            # moves in read-ahead blocks, close enough for sizing chunks
+            batch = list(itertools.islice(reader, CSV_BATCH_ROWS))
+            if not batch:
+                break
+            if not all(batch):
+                batch = [row for row in batch if row]
+            rows += batch
+            if file.tell() >= chunk_end:
+                yield rows, file.tell()
+                rows = []
+                chunk_end = file.tell() + chunk_bytes
+        if rows:
+            yield rows, file.tell()
+
+def stream_csv_into_dataset(path, dataset, progress_callback=None, cancel_event=None,
+                            chunk_bytes=LOAD_CHUNK_BYTES):
+    """Parse a CSV file into `dataset` one chunk of rows at a time.
+    
+    After every chunk the rows are already usable, and
+    progress_callback(rows_loaded, bytes_read, total_bytes) is called so a
+    caller can start work on the first N rows before the whole file is in.
+    Rows with a missing field or a non-integer ID cannot be stored and are
+    only counted, in dataset.skipped_rows. Returns False if cancelled, True
+    otherwise. Raises ValueError for an empty file or missing columns.
+    """
+    total_bytes = os.path.getsize(path)
+    if total_bytes == 0:
+        raise ValueError("CSV file is empty.")
     
-    # Pre-fetch cancellation check for performance
     is_cancelled = cancel_event.is_set if cancel_event else (lambda: False)
     
+    header, chunks = open_csv_chunks(path, chunk_bytes)
+    id_pos, first_pos, last_pos = (header.index(col) for col in REQUIRED_COLUMNS)
+    append = dataset.append
+    
+    try:
+        if is_cancelled():
+            return False
+        for rows, bytes_read in chunks:
+            for row in rows:
+                try:
+                    append(int(row[id_pos]), row[first_pos], row[last_pos])
+                except (ValueError, IndexError):
+                    dataset.skipped_rows += 1
+            
+            if progress_callback:
+                progress_callback(len(dataset), bytes_read, total_bytes)
+            if is_cancelled():
+                return False
+    finally:
+        chunks.close()
+    
+    return True
+
+# ============================================================================
+# KEY EXTRACTION - Pull the sort column out once per run
+# ============================================================================
+
+def extract_sort_keys(data, key, counter=None):
+    """Extract the chosen column from every record into a flat key list.
+    
+    Done once per sort so the algorithms compare plain values instead of
+    calling record.get() on both operands of every comparison. Columnar
+    datasets and views read the column arrays directly. `key` may also be a
+    multi-column sort spec, compiled into composite keys. With an
+    OperationCounter the keys are wrapped so comparisons are counted.
+    """
+    if not isinstance(key, str):
+        keys = compile_composite_keys(data, key)
+    elif hasattr(data, 'column'):
+        keys = data.column(key)
+    else:
+        keys = [record.get(key, "") for record in data]
+    return counter.wrap(keys) if counter is not None else keys
+
+def apply_order(data, order):
+    """Rebuild the record sequence from a sorted index permutation."""
+    if hasattr(data, 'take'):
+        return data.take(order)
+    return [data[i] for i in order]
+
+# ============================================================================
+# SORT SPECIFICATIONS - Multi-column composite keys
+# ============================================================================
+#
+# A sort spec is a list of (column, descending) pairs, e.g.
+# [("LastName", False), ("FirstName", False), ("ID", True)]. Every sort
+# function accepts one in place of a single column name.
+
+def parse_sort_spec(text):
+    """Parse "LastName, FirstName, -ID" into a sort spec.
+    
+    A leading '-' marks a descending column ('+' or nothing is ascending).
+    Raises ValueError for unknown or repeated columns.
+    """
+    spec = []
+    for part in text.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        descending = part.startswith("-")
+        column = part.lstrip("+-").strip()
+        if column not in REQUIRED_COLUMNS:
+            raise ValueError(f"Unknown sort column: {column}")
+        if any(column == existing for existing, _ in spec):
+            raise ValueError(f"Column listed twice in sort spec: {column}")
+        spec.append((column, descending))
+    if not spec:
+        raise ValueError("Sort spec is empty")
+    return spec
+
+def describe_sort_spec(key, descending=False):
+    """Readable form of a column name or sort spec, e.g. "LastName ↑, ID ↓"."""
+    if isinstance(key, str):
+        return f"{key} {'↓' if descending else '↑'}"
+    return ", ".join(f"{column} {'↓' if (desc != descending) else '↑'}" for column, desc in key)
+
+def compile_composite_keys(data, spec):
+    """Compile a sort spec into one integer key per record.
+    
+    Each column becomes a dense rank (integers are offset by their minimum,
+    strings are ranked by sorting their distinct values once), inverted for
+    descending columns, and the ranks are packed into a single mixed-radix
+    integer. Comparing two packed keys then costs the same no matter how
+    many columns the spec has.
+    """
+    composite = None
+    for column, descending in spec:
+        values = extract_sort_keys(data, column)
+        
+        if values and all(type(value) is int for value in values):
+            low = min(values)
+            ranks = [value - low for value in values]
+            width = max(values) - low + 1
+        else:
+            distinct = list(dict.fromkeys(values))
+            distinct_order = _merge_sort_order(distinct, False, ExecutionControl())
+            sorted_distinct = [distinct[i] for i in distinct_order]
+            rank_of = {value: rank for rank, value in enumerate(sorted_distinct)}
+            ranks = [rank_of[value] for value in values]
+            width = max(len(distinct), 1)
+        
+        if descending:
+            top = width - 1
+            ranks = [top - rank for rank in ranks]
+        
+        if composite is None:
+            composite = ranks
+        else:
+            composite = [packed * width + rank for packed, rank in zip(composite, ranks)]
+    
+    return composite if composite is not None else []
+
+# ============================================================================
+# EXECUTION CONTROL - Rate-limited progress and cancellation checkpoints
+# ============================================================================
+#
+# Kernels call checkpoint() after every CHECKPOINT_WORK or so units of work
+# rather than per element. A checkpoint is one Event check and one clock
+# read; progress goes out at most every PROGRESS_INTERVAL seconds, so a
+# fast sort sends the GUI a handful of updates instead of thousands.
+
+PROGRESS_INTERVAL = 0.1   # Seconds between progress reports
+CHECKPOINT_WORK = 4096    # Elements (or comparisons) of work between checkpoints
+
+class ExecutionControl:
+    """Cancellation and progress reporting shared by the sort kernels."""
+    
+    def __init__(self, progress_callback=None, cancel_event=None, interval=PROGRESS_INTERVAL):
+        self.progress_callback = progress_callback
+        self.cancel_event = cancel_event
+        self.interval = interval
+        self.total_work = 1
+        self._next_report = 0.0
+    
+    def start(self, total_work):
+        """Set the amount of work that corresponds to 100%."""
+        self.total_work = max(total_work, 1)
+        self._next_report = time.perf_counter() + self.interval
+    
+    def cancelled(self):
+        return self.cancel_event is not None and self.cancel_event.is_set()
+    
+    def report(self, work_done):
+        """Report progress if at least `interval` seconds passed since the last report."""
+        if self.progress_callback is None:
+            return
+        now = time.perf_counter()
+        if now >= self._next_report:
+            self._next_report = now + self.interval
+            self.progress_callback(min(work_done / self.total_work * 100, 99.9))
+    
+    def checkpoint(self, work_done):
+        """Report progress (rate-limited); returns False once cancelled."""
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            return False
+        self.report(work_done)
+        return True
+
+# ============================================================================
+# OPERATION COUNTERS - Opt-in comparison / move / allocation counting
+# ============================================================================
+#
+# Sorts take an optional OperationCounter. Comparisons are counted by
+# wrapping the extracted keys in _CountingKey, so comparison loops stay
+# untouched; moves, allocations and depth are tallied in bulk per pass or
+# per merge. With no counter the only cost is a few `is not None` checks.
+
+class OperationCounter:
+    """What a sort run actually did.
+    
+    comparisons: key comparisons (==, <, <=, >, >=)
+    moves:       element writes into working buffers (a swap is two)
+    allocations: working buffers (lists) created by the algorithm
+    max_depth:   deepest recursion, or explicit stack, reached
+    """
+    __slots__ = ('comparisons', 'moves', 'allocations', 'max_depth')
+    
+    FIELDS = ('comparisons', 'moves', 'allocations', 'max_depth')
+    
+    def __init__(self):
+        self.comparisons = 0
+        self.moves = 0
+        self.allocations = 0
+        self.max_depth = 0
+    
+    def wrap(self, keys):
+        """Wrap keys so every comparison between them is counted."""
+        return [_CountingKey(value, self) for value in keys]
+    
+    def reach(self, depth):
+        if depth > self.max_depth:
+            self.max_depth = depth
+    
+    def add(self, counts):
+        """Fold in counts from another run (e.g. a worker process)."""
+        self.comparisons += counts['comparisons']
+        self.moves += counts['moves']
+        self.allocations += counts['allocations']
+        self.reach(counts['max_depth'])
+    
+    def as_dict(self):
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+class _CountingKey:
+    """Sort key wrapper that counts comparisons on its OperationCounter."""
+    __slots__ = ('value', 'counter')
+    
+    def __init__(self, value, counter):
+        self.value = value
+        self.counter = counter
+    
+    def __lt__(self, other):
+        self.counter.comparisons += 1
+        return self.value < other.value
+    
+    def __le__(self, other):
+        self.counter.comparisons += 1
+        return self.value <= other.value
+    
+    def __gt__(self, other):
+        self.counter.comparisons += 1
+        return self.value > other.value
+    
+    def __ge__(self, other):
+        self.counter.comparisons += 1
+        return self.value >= other.value
+    
+    def __eq__(self, other):
+        self.counter.comparisons += 1
+        return self.value == other.value
+    
+    __hash__ = None
+
+# ============================================================================
+# SORTING ALGORITHMS - Implemented from scratch
+# ============================================================================
+#
+# Each public sort extracts the keys once and hands them to a kernel that
+# moves keys together with the original record indices. The kernel returns
+# the sorted index order (or None when cancelled), which is then applied to
+# the records, so results and stability are the same as sorting the records.
+# Kernels report progress and check for cancellation through an
+# ExecutionControl, at checkpoints between passes, merges or runs.
+
+def _bubble_sort_order(keys, descending, control, counter=None):
+    """Bubble Sort kernel: returns the sorted index order or None."""
+    keys = keys[:]
+    n = len(keys)
+    order = list(range(n))
+    
     # Total comparisons for progress calculation
-    total_comparisons = n * (n - 1) // 2 if n > 1 else 1
+    control.start(n * (n - 1) // 2)
     comparisons_done = 0
+    total_swaps = 0
     
     for i in range(n):
-        if is_cancelled():
+        # One checkpoint per pass keeps the inner loop free of bookkeeping
+        if not control.checkpoint(comparisons_done):
             return None
             
-        swapped = False
+        swaps = 0
         comparisons_in_pass = n - i - 1
         
         for j in range(comparisons_in_pass):
-            val1 = arr[j].get(key, "")
-            val2 = arr[j + 1].get(key, "")
+            val1 = keys[j]
+            val2 = keys[j + 1]
             
             # Determine if swap is needed
-            swap_needed = False
             if descending:
-                if val1 < val2:
-                    swap_needed = True
+                swap_needed = val1 < val2
             else:
-                if val1 > val2:
-                    swap_needed = True
+                swap_needed = val1 > val2
             
             if swap_needed:
-                arr[j], arr[j + 1] = arr[j + 1], arr[j]
-                swapped = True
-            
-            # Update progress periodically
-            comparisons_done += 1
-            if progress_callback and comparisons_done % 1000 == 0:
-                p = (comparisons_done / total_comparisons) * 100
-                progress_callback(min(p, 99.9))
-                
-            if j % 1000 == 0 and is_cancelled():
-                return None
+                keys[j], keys[j + 1] = val2, val1
+                order[j], order[j + 1] = order[j + 1], order[j]
+                swaps += 1
         
         # Early exit if already sorted
-        if not swapped:
+        comparisons_done += comparisons_in_pass
+        total_swaps += swaps
+        if not swaps:
             break
     
-    if progress_callback:
-        progress_callback(100)
-    return arr
+    if counter is not None:
+        counter.moves += 2 * total_swaps
+        counter.allocations += 2  # Key and index working copies
+    return order
 
-def insertion_sort(data, key, descending=False, progress_callback=None, cancel_event=None):
+def bubble_sort(data, key, descending=False, progress_callback=None, cancel_event=None,
+                counter=None):
     """
-    Insertion Sort implementation.
-    Time Complexity: O(n²) worst/average, O(n) best
+    Bubble Sort implementation.
+    Time Complexity: O(n²) worst/average, O(n) best (already sorted)
     Space Complexity: O(1)
     Stable: Yes
     """
-    arr = data[:]
-    n = len(arr)
+    keys = extract_sort_keys(data, key, counter)
+    order = _bubble_sort_order(keys, descending, ExecutionControl(progress_callback, cancel_event),
+                               counter)
+    if order is None:
+        return None
     
-    is_cancelled = cancel_event.is_set if cancel_event else (lambda: False)
+    if progress_callback:
+        progress_callback(100)
+    return apply_order(data, order)
+
+def _insertion_sort_order(keys, descending, control, counter=None):
+    """Insertion Sort kernel: returns the sorted index order or None."""
+    keys = keys[:]
+    n = len(keys)
+    order = list(range(n))
+    
+    control.start(n * n)
+    shifts = 0
+    next_check = 0
     
     for i in range(1, n):
-        if is_cancelled():
-            return None
+        # Checkpoint after every CHECKPOINT_WORK shifts or elements
+        if shifts + i >= next_check:
+            # Progress scales quadratically, like the running time
+            if not control.checkpoint(i * i):
+                return None
+            next_check = shifts + i + CHECKPOINT_WORK
             
-        current = arr[i]
-        current_val = current.get(key, "")
+        current_val = keys[i]
+        current_idx = order[i]
         j = i - 1
         
         while j >= 0:
-            compare_val = arr[j].get(key, "")
-            move_needed = False
+            compare_val = keys[j]
             
             if descending:
-                if compare_val < current_val:
-                    move_needed = True
+                move_needed = compare_val < current_val
             else:
-                if compare_val > current_val:
-                    move_needed = True
+                move_needed = compare_val > current_val
             
             if move_needed:
-                arr[j + 1] = arr[j]
+                keys[j + 1] = compare_val
+                order[j + 1] = order[j]
                 j -= 1
             else:
                 break
         
-        arr[j + 1] = current
-        
-        # Update progress (quadratic scaling for accurate time representation)
-        if progress_callback and i % 10 == 0:
-            p = (i / n) ** 2 * 100
-            progress_callback(p)
+        keys[j + 1] = current_val
+        order[j + 1] = current_idx
+        shifts += i - 1 - j
     
-    if progress_callback:
-        progress_callback(100)
-    return arr
+    if counter is not None:
+        counter.moves += shifts + max(n - 1, 0)  # Shifts plus one placement per element
+        counter.allocations += 2
+    return order
 
-def merge_sort(data, key, descending=False, progress_callback=None, cancel_event=None):
+def insertion_sort(data, key, descending=False, progress_callback=None, cancel_event=None,
+                   counter=None):
     """
-    Merge Sort implementation.
-    Time Complexity: O(n log n) all cases
-    Space Complexity: O(n)
+    Insertion Sort implementation.
+    Time Complexity: O(n²) worst/average, O(n) best
+    Space Complexity: O(1)
     Stable: Yes
     """
-    if len(data) <= 1:
-        return data[:]
-    
-    is_cancelled = cancel_event.is_set if cancel_event else (lambda: False)
+    keys = extract_sort_keys(data, key, counter)
+    order = _insertion_sort_order(keys, descending, ExecutionControl(progress_callback, cancel_event),
+                                  counter)
+    if order is None:
+        return None
     
+    if progress_callback:
+        progress_callback(100)
+    return apply_order(data, order)
+
+def _merge_sort_order(keys, descending, control, counter=None):
+    """Merge Sort kernel: returns the sorted index order or None."""
     # Track progress
-    total_elements = len(data)
-    total_work = total_elements * math.log2(total_elements) if total_elements > 1 else 1
-    work_done = [0]  # Mutable container for nested function
+    total_elements = len(keys)
+    control.start(total_elements * math.log2(total_elements) if total_elements > 1 else 1)
+    work_done = [0, CHECKPOINT_WORK]  # Work done, next checkpoint (mutable for nested functions)
     
-    def merge(left, right):
-        """Merge two sorted lists."""
-        result = []
+    def merge(left_keys, left_idx, right_keys, right_idx):
+        """Merge two sorted runs of (keys, indices)."""
+        result_keys = []
+        result_idx = []
         i = j = 0
+        len_left = len(left_keys)
+        len_right = len(right_keys)
         
-        while i < len(left) and j < len(right):
-            if is_cancelled():
-                return None
-                
-            val1 = left[i].get(key, "")
-            val2 = right[j].get(key, "")
+        while i < len_left and j < len_right:
+            val1 = left_keys[i]
+            val2 = right_keys[j]
             
-            pick_left = False
             if descending:
-                if val1 >= val2:
-                    pick_left = True
+                pick_left = val1 >= val2
             else:
-                if val1 <= val2:
-                    pick_left = True
+                pick_left = val1 <= val2
             
             if pick_left:
-                result.append(left[i])
+                result_keys.append(val1)
+                result_idx.append(left_idx[i])
                 i += 1
             else:
-                result.append(right[j])
+                result_keys.append(val2)
+                result_idx.append(right_idx[j])
                 j += 1
         
-        result.extend(left[i:])
-        result.extend(right[j:])
-        return result
+        result_keys.extend(left_keys[i:])
+        result_idx.extend(left_idx[i:])
+        result_keys.extend(right_keys[j:])
+        result_idx.extend(right_idx[j:])
+        return result_keys, result_idx
     
-    def recursive_sort(arr):
+    def recursive_sort(run_keys, run_idx, depth=1):
         """Recursively sort using merge sort."""
-        if is_cancelled():
-            return None
-            
-        if len(arr) <= 1:
-            return arr
+        if len(run_keys) <= 1:
+            if counter is not None:
+                counter.reach(depth)
+            return run_keys, run_idx
         
-        mid = len(arr) // 2
-        left = recursive_sort(arr[:mid])
+        if counter is not None:
+            # Four slices copy the run, merge() writes it into two new lists
+            counter.moves += 2 * len(run_keys)
+            counter.allocations += 6
+        
+        mid = len(run_keys) // 2
+        left = recursive_sort(run_keys[:mid], run_idx[:mid], depth + 1)
         if left is None:
             return None
             
-        right = recursive_sort(arr[mid:])
+        right = recursive_sort(run_keys[mid:], run_idx[mid:], depth + 1)
         if right is None:
             return None
         
-        result = merge(left, right)
+        result = merge(left[0], left[1], right[0], right[1])
         
-        # Update progress
-        work_done[0] += len(arr)
-        if progress_callback:
-            p = (work_done[0] / total_work) * 100
-            progress_callback(min(p, 99.9))
+        # Amortized cancellation / progress checkpoint
+        work_done[0] += len(run_keys)
+        if work_done[0] >= work_done[1]:
+            if not control.checkpoint(work_done[0]):
+                return None
+            work_done[1] = work_done[0] + CHECKPOINT_WORK
         
         return result
     
-    result = recursive_sort(data[:])
+    if counter is not None:
+        counter.allocations += 2
+    result = recursive_sort(keys[:], list(range(total_elements)))
     if result is None:
         return None
+    return result[1]
+
+def merge_sort(data, key, descending=False, progress_callback=None, cancel_event=None,
+               counter=None):
+    """
+    Merge Sort implementation.
+    Time Complexity: O(n log n) all cases
+    Space Complexity: O(n)
+    Stable: Yes
+    """
+    if len(data) <= 1:
+        return data[:]
+    
+    keys = extract_sort_keys(data, key, counter)
+    order = _merge_sort_order(keys, descending, ExecutionControl(progress_callback, cancel_event),
+                              counter)
+    if order is None:
+        return None
         
     if progress_callback:
         progress_callback(100)
-    return result
+    return apply_order(data, order)
+
+def _bottom_up_merge_sort_order(keys, descending, control, counter=None):
+    """Bottom-Up Merge Sort kernel: returns the sorted index order or None.
+    
+    Merges runs of width 1, 2, 4, ... from one preallocated key/index buffer
+    pair into the other and swaps their roles after each pass, so no slices
+    or per-merge result lists are created.
+    """
+    n = len(keys)
+    src_keys = keys[:]
+    src_idx = list(range(n))
+    dst_keys = [None] * n
+    dst_idx = [None] * n
+    
+    control.start(n * (math.ceil(math.log2(n)) if n > 1 else 1))
+    passes_done = 0
+    next_check = CHECKPOINT_WORK
+    
+    width = 1
+    while width < n:
+        merged = 0
+        for lo in range(0, n, 2 * width):
+            mid = min(lo + width, n)
+            hi = min(lo + 2 * width, n)
+            i, j, k = lo, mid, lo
+            
+            while i < mid and j < hi:
+                val1 = src_keys[i]
+                val2 = src_keys[j]
+                
+                if descending:
+                    pick_left = val1 >= val2
+                else:
+                    pick_left = val1 <= val2
+                
+                if pick_left:
+                    dst_keys[k] = val1
+                    dst_idx[k] = src_idx[i]
+                    i += 1
+                else:
+                    dst_keys[k] = val2
+                    dst_idx[k] = src_idx[j]
+                    j += 1
+                k += 1
+            
+            # Copy whichever side is left over
+            while i < mid:
+                dst_keys[k] = src_keys[i]
+                dst_idx[k] = src_idx[i]
+                i += 1
+                k += 1
+            while j < hi:
+                dst_keys[k] = src_keys[j]
+                dst_idx[k] = src_idx[j]
+                j += 1
+                k += 1
+            
+            # Amortized cancellation / progress checkpoint
+            merged += hi - lo
+            if merged >= next_check or hi == n:
+                if not control.checkpoint(passes_done * n + merged):
+                    return None
+                next_check = merged + CHECKPOINT_WORK
+        
+        src_keys, dst_keys = dst_keys, src_keys
+        src_idx, dst_idx = dst_idx, src_idx
+        passes_done += 1
+        if counter is not None:
+            counter.moves += n  # Every pass writes each element once
+        next_check = CHECKPOINT_WORK
+        width *= 2
+    
+    if counter is not None:
+        counter.allocations += 4  # Two key/index buffer pairs
+    return src_idx
+
+def bottom_up_merge_sort(data, key, descending=False, progress_callback=None, cancel_event=None,
+                         counter=None):
+    """
+    Bottom-Up Merge Sort implementation.
+    Iterative merge sort that ping-pongs between two preallocated buffers
+    instead of slicing and building new lists at every recursion level.
+    Time Complexity: O(n log n) all cases
+    Space Complexity: O(n) (two buffers, allocated once)
+    Stable: Yes
+    """
+    if len(data) <= 1:
+        return data[:]
+    
+    keys = extract_sort_keys(data, key, counter)
+    order = _bottom_up_merge_sort_order(keys, descending, ExecutionControl(progress_callback, cancel_event),
+                                        counter)
+    if order is None:
+        return None
+    
+    if progress_callback:
+        progress_callback(100)
+    return apply_order(data, order)
 
 # ============================================================================
-# MAIN APPLICATION CLASS
+# ADAPTIVE HYBRID SORT - Natural runs, binary insertion and galloping merges
 # ============================================================================
 
-class SortingBenchmarkApp:
-    """Main application class for the Sorting Algorithm Stress Test."""
+MIN_GALLOP = 7
+
+def _min_run_length(n):
+    """Run length (32-64) that makes n / minrun close to a power of two."""
+    r = 0
+    while n >= 64:
+        r |= n & 1
+        n >>= 1
+    return n + r
+
+def _adaptive_sort_order(keys, descending, control, counter=None):
+    """Adaptive Hybrid Sort kernel: returns the sorted index order or None."""
+    keys = keys[:]
+    n = len(keys)
+    order = list(range(n))
+    if n < 2:
+        return order
     
-    def __init__(self, root):
-        self.root = root
-        self.root.title("Sorting Algorithm Stress Test - Prelim Exam")
-        self.root.geometry("1200x800")
-        self.root.configure(bg="#F0F0F0")
+    # before(a, b): a must be placed strictly before b
+    if descending:
+        before = lambda a, b: a > b
+    else:
+        before = lambda a, b: a < b
+    
+    min_run = _min_run_length(n)
+    control.start(n * (1 + math.log2(max(n // min_run, 1))))
+    work_done = [0]
+    
+    def gallop_left(key, arr, lo, hi):
+        """First index in arr[lo:hi] whose value is not before `key`."""
+        # Exponential search from lo, then binary search in the last step
+        offset, last = 1, 0
+        while lo + offset - 1 < hi and before(arr[lo + offset - 1], key):
+            last = offset
+            offset = offset * 2 + 1
+        left, right = lo + last, min(lo + offset, hi)
+        while left < right:
+            mid = (left + right) // 2
+            if before(arr[mid], key):
+                left = mid + 1
+            else:
+                right = mid
+        return left
+    
+    def gallop_right(key, arr, lo, hi):
+        """First index in arr[lo:hi] whose value `key` must come before."""
+        offset, last = 1, 0
+        while lo + offset - 1 < hi and not before(key, arr[lo + offset - 1]):
+            last = offset
+            offset = offset * 2 + 1
+        left, right = lo + last, min(lo + offset, hi)
+        while left < right:
+            mid = (left + right) // 2
+            if before(key, arr[mid]):
+                right = mid
+            else:
+                left = mid + 1
+        return left
+    
+    def binary_insertion_sort(lo, hi, start):
+        """Sort keys[lo:hi] given that keys[lo:start] is already sorted."""
+        for i in range(start, hi):
+            key = keys[i]
+            idx = order[i]
+            pos = gallop_right(key, keys, lo, i)
+            if pos < i:
+                if counter is not None:
+                    counter.moves += i - pos + 1
+                keys[pos + 1:i + 1] = keys[pos:i]
+                order[pos + 1:i + 1] = order[pos:i]
+                keys[pos] = key
+                order[pos] = idx
+    
+    def count_run_and_make_ascending(lo):
+        """Length of the natural run at lo; strictly descending runs are reversed."""
+        hi = lo + 1
+        if hi == n:
+            return 1
+        if before(keys[hi], keys[lo]):
+            # Strictly descending, so reversing it keeps equal keys in order
+            while hi + 1 < n and before(keys[hi + 1], keys[hi]):
+                hi += 1
+            if counter is not None:
+                counter.moves += hi + 1 - lo
+            keys[lo:hi + 1] = keys[lo:hi + 1][::-1]
+            order[lo:hi + 1] = order[lo:hi + 1][::-1]
+        else:
+            while hi + 1 < n and not before(keys[hi + 1], keys[hi]):
+                hi += 1
+        return hi + 1 - lo
+    
+    def merge_runs(lo, mid, hi):
+        """Stable merge of the adjacent runs keys[lo:mid] and keys[mid:hi]."""
+        # Leading elements of the left run that are already in place
+        lo = gallop_right(keys[mid], keys, lo, mid)
+        if lo == mid:
+            return
+        # Trailing elements of the right run that are already in place
+        hi = gallop_left(keys[mid - 1], keys, mid, hi)
         
-        # Application state
-        self.full_data = []
-        self.data_loaded = False
-        self.total_records = 0
-        self.cancel_event = threading.Event()
-        self.sort_thread = None
-        self.is_sorting = False
+        tmp_keys = keys[lo:mid]
+        tmp_idx = order[lo:mid]
+        len_tmp = mid - lo
+        i, j, k = 0, mid, lo
+        min_gallop = MIN_GALLOP
+        
+        while i < len_tmp and j < hi:
+            # One element at a time until one side keeps winning
+            wins_left = wins_right = 0
+            while i < len_tmp and j < hi:
+                if before(keys[j], tmp_keys[i]):
+                    keys[k] = keys[j]
+                    order[k] = order[j]
+                    j += 1
+                    wins_right += 1
+                    wins_left = 0
+                    if wins_right >= min_gallop:
+                        k += 1
+                        break
+                else:
+                    keys[k] = tmp_keys[i]
+                    order[k] = tmp_idx[i]
+                    i += 1
+                    wins_left += 1
+                    wins_right = 0
+                    if wins_left >= min_gallop:
+                        k += 1
+                        break
+                k += 1
+            
+            # Galloping: copy whole blocks found by exponential search
+            while i < len_tmp and j < hi:
+                x = gallop_right(keys[j], tmp_keys, i, len_tmp)
+                count_left = x - i
+                if count_left:
+                    keys[k:k + count_left] = tmp_keys[i:x]
+                    order[k:k + count_left] = tmp_idx[i:x]
+                    k += count_left
+                    i = x
+                    if i == len_tmp:
+                        break
+                
+                y = gallop_left(tmp_keys[i], keys, j, hi)
+                count_right = y - j
+                if count_right:
+                    keys[k:k + count_right] = keys[j:y]
+                    order[k:k + count_right] = order[j:y]
+                    k += count_right
+                    j = y
+                    if j == hi:
+                        break
+                
+                # The next element comes from the left run
+                keys[k] = tmp_keys[i]
+                order[k] = tmp_idx[i]
+                k += 1
+                i += 1
+                
+                if count_left < MIN_GALLOP and count_right < MIN_GALLOP:
+                    min_gallop += 1  # Galloping is not paying off
+                    break
+                min_gallop = max(1, min_gallop - 1)
+        
+        # Whatever is left of the right run is already in place
+        if i < len_tmp:
+            keys[k:k + len_tmp - i] = tmp_keys[i:]
+            order[k:k + len_tmp - i] = tmp_idx[i:]
+        
+        if counter is not None:
+            # Left run copied out and back, plus the right elements that moved
+            counter.moves += 2 * len_tmp + (j - mid)
+            counter.allocations += 2
+    
+    runs = []  # Stack of (start, length)
+    
+    def merge_at(i):
+        start_a, len_a = runs[i]
+        _, len_b = runs[i + 1]
+        merge_runs(start_a, start_a + len_a, start_a + len_a + len_b)
+        runs[i] = (start_a, len_a + len_b)
+        del runs[i + 1]
+        work_done[0] += len_a + len_b
+    
+    def merge_collapse():
+        """Merge until run lengths shrink fast enough to stay O(n log n)."""
+        while len(runs) > 1:
+            m = len(runs) - 2
+            if ((m > 0 and runs[m - 1][1] <= runs[m][1] + runs[m + 1][1]) or
+                    (m > 1 and runs[m - 2][1] <= runs[m - 1][1] + runs[m][1])):
+                if runs[m - 1][1] < runs[m + 1][1]:
+                    m -= 1
+            elif runs[m][1] > runs[m + 1][1]:
+                break
+            merge_at(m)
+    
+    # Runs hold at most a few dozen elements before merging, so a
+    # checkpoint per run is already amortized
+    lo = 0
+    while lo < n:
+        if not control.checkpoint(work_done[0]):
+            return None
+        
+        run_len = count_run_and_make_ascending(lo)
+        if run_len < min_run:
+            # Extend short runs to min_run with binary insertion sort
+            forced = min(min_run, n - lo)
+            binary_insertion_sort(lo, lo + forced, lo + run_len)
+            run_len = forced
+        
+        runs.append((lo, run_len))
+        work_done[0] += run_len
+        if counter is not None:
+            counter.reach(len(runs))
+        merge_collapse()
+        lo += run_len
+    
+    while len(runs) > 1:
+        if not control.checkpoint(work_done[0]):
+            return None
+        m = len(runs) - 2
+        if m > 0 and runs[m - 1][1] < runs[m + 1][1]:
+            m -= 1
+        merge_at(m)
+    
+    if counter is not None:
+        counter.allocations += 2
+    return order
+
+def adaptive_sort(data, key, descending=False, progress_callback=None, cancel_event=None,
+                  counter=None):
+    """
+    Adaptive Hybrid Sort implementation (Timsort-style).
+    Finds ascending and strictly descending natural runs, extends short runs
+    with binary insertion sort and merges them with galloping, so already
+    sorted or reversed input takes close to linear time.
+    Time Complexity: O(n log n) worst, O(n) best (presorted input)
+    Space Complexity: O(n)
+    Stable: Yes
+    """
+    keys = extract_sort_keys(data, key, counter)
+    order = _adaptive_sort_order(keys, descending, ExecutionControl(progress_callback, cancel_event),
+                                 counter)
+    if order is None:
+        return None
+    
+    if progress_callback:
+        progress_callback(100)
+    return apply_order(data, order)
+
+# ============================================================================
+# RADIX SORTS - Linear-time, non-comparison sorting
+# ============================================================================
+
+RADIX_MAX_BITS = 16        # Widest digit for LSD radix sort (65,536 buckets)
+RADIX_CHUNK = 65536        # Elements distributed between cancellation checks
+MSD_INSERTION_CUTOFF = 32  # MSD segments this small finish with insertion sort
+
+def _lsd_radix_sort_order(keys, descending, control, counter=None):
+    """LSD Radix Sort kernel for integer keys: returns the index order or None.
+    
+    Keys are offset by their minimum so negative values work, then
+    distributed into buckets one digit at a time from the least significant
+    end. Each pass is stable; descending order walks the buckets backwards.
+    """
+    n = len(keys)
+    order = list(range(n))
+    if n < 2:
+        return order
+    
+    low = high = keys[0]
+    new_lows = 0
+    for value in keys:
+        if value < low:
+            low = value
+            new_lows += 1
+        elif value > high:
+            high = value
+    offsets = [value - low for value in keys]
+    
+    # Split the key width into as few, equally wide digits as possible
+    total_bits = max((high - low).bit_length(), 1)
+    passes = -(-total_bits // RADIX_MAX_BITS)
+    bits = -(-total_bits // passes)
+    mask = (1 << bits) - 1
+    control.start(n * passes)
+    
+    for p in range(passes):
+        shift = p * bits
+        buckets = [[] for _ in range(1 << bits)]
+        
+        for start in range(0, n, RADIX_CHUNK):
+            if not control.checkpoint(p * n + start):
+                return None
+            for i in order[start:start + RADIX_CHUNK]:
+                buckets[(offsets[i] >> shift) & mask].append(i)
+        
+        if descending:
+            buckets.reverse()
+        order = [i for bucket in buckets for i in bucket]
+    
+    if counter is not None:
+        # The min/max scan is the only place keys are compared
+        counter.comparisons += 2 * n - new_lows
+        counter.moves += 2 * n * passes  # Into the buckets and back
+        counter.allocations += 2 + passes * ((1 << bits) + 1)
+    return order
+
+def _msd_radix_sort_order(keys, descending, control, counter=None):
+    """MSD Radix Sort kernel for string keys: returns the index order or None.
+    
+    Segments are split into buckets by the character at the current depth,
+    with strings that end at that depth in their own bucket. Small segments
+    are finished with insertion sort. An explicit stack is used instead of
+    recursion, so long common prefixes cannot hit the recursion limit.
+    """
+    n = len(keys)
+    order = list(range(n))
+    if n < 2:
+        return order
+    
+    control.start(n)
+    done = 0
+    
+    def insertion_sort_segment(lo, hi):
+        shifts = stops = 0
+        for i in range(lo + 1, hi):
+            current = order[i]
+            current_val = keys[current]
+            j = i - 1
+            while j >= lo:
+                compare_val = keys[order[j]]
+                if (compare_val < current_val) if descending else (compare_val > current_val):
+                    order[j + 1] = order[j]
+                    j -= 1
+                else:
+                    break
+            order[j + 1] = current
+            shifts += i - 1 - j
+            stops += j >= lo
+        if counter is not None:
+            counter.comparisons += shifts + stops
+            counter.moves += shifts + max(hi - lo - 1, 0)
+    
+    stack = [(0, n, 0)]
+    while stack:
+        if not control.checkpoint(done):
+            return None
+        
+        lo, hi, depth = stack.pop()
+        if counter is not None:
+            counter.reach(depth + 1)
+        if hi - lo <= MSD_INSERTION_CUTOFF:
+            insertion_sort_segment(lo, hi)
+            done += hi - lo
+            continue
+        
+        # Character code at this depth, or -1 where the string has ended
+        segment = order[lo:hi]
+        codes = [ord(keys[i][depth]) if len(keys[i]) > depth else -1 for i in segment]
+        
+        low = high = None
+        for code in codes:
+            if code < 0:
+                continue
+            if low is None or code < low:
+                low = code
+            if high is None or code > high:
+                high = code
+        
+        if low is None:
+            # Every string in the segment ended: they are all equal
+            done += hi - lo
+            continue
+        
+        ended = []
+        buckets = [[] for _ in range(high - low + 1)]
+        if counter is not None:
+            counter.moves += 2 * (hi - lo)  # Into the buckets and back
+            counter.allocations += 3 + len(buckets)
+        for i, code in zip(segment, codes):
+            if code < 0:
+                ended.append(i)
+            else:
+                buckets[code - low].append(i)
+        
+        # Shorter strings sort first when ascending, last when descending
+        if descending:
+            buckets.reverse()
+            groups = buckets + [ended]
+        else:
+            groups = [ended] + buckets
+        
+        pos = lo
+        for group in groups:
+            size = len(group)
+            if not size:
+                continue
+            order[pos:pos + size] = group
+            if group is ended or size == 1:
+                done += size
+            else:
+                stack.append((pos, pos + size, depth + 1))
+            pos += size
+    
+    if counter is not None:
+        counter.allocations += 1
+    return order
+
+def radix_sort(data, key, descending=False, progress_callback=None, cancel_event=None,
+               counter=None):
+    """
+    Radix Sort implementation.
+    LSD radix sort for integer columns (ID), MSD radix sort for string
+    columns (FirstName, LastName).
+    Time Complexity: O(n·k), k = digits or characters per key
+    Space Complexity: O(n + buckets)
+    Stable: Yes
+    """
+    keys = extract_sort_keys(data, key)
+    if all(type(value) is int for value in keys):
+        kernel = _lsd_radix_sort_order
+    elif all(type(value) is str for value in keys):
+        kernel = _msd_radix_sort_order
+    else:
+        raise ValueError(f"Radix Sort needs all-integer or all-string keys in column '{key}'")
+    
+    order = kernel(keys, descending, ExecutionControl(progress_callback, cancel_event), counter)
+    if order is None:
+        return None
+    
+    if progress_callback:
+        progress_callback(100)
+    return apply_order(data, order)
+
+# ============================================================================
+# EXTERNAL MERGE SORT - Out-of-core sorting of CSV files
+# ============================================================================
+
+DEFAULT_MEMORY_BUDGET = 64 * 1024 * 1024
+EXTERNAL_ROW_OVERHEAD = 200        # Estimated Python overhead per buffered row
+EXTERNAL_READ_BUFFER = 64 * 1024   # Read buffer per open run during a merge
+MAX_MERGE_FAN_IN = 64
+
+class _Descending:
+    """Key wrapper that makes heapq (a min-heap) pop the largest key first."""
+    __slots__ = ('key',)
+    
+    def __init__(self, key):
+        self.key = key
+    
+    def __lt__(self, other):
+        return other.key < self.key
+    
+    def __le__(self, other):
+        return other.key <= self.key
+    
+    def __eq__(self, other):
+        return self.key == other.key
+
+def _read_csv_run(path):
+    """Yield the rows of a spilled run file."""
+    with open(path, 'r', encoding='utf-8', newline='',
+              buffering=EXTERNAL_READ_BUFFER) as f:
+        yield from csv.reader(f)
+
+def _merge_csv_runs(run_paths, output_path, key_pos, key_is_int, descending,
+                    header=None, on_row=None, is_cancelled=None):
+    """Stream a stable k-way heap merge of sorted run files into output_path.
+    
+    Ties are broken by run number, and runs hold consecutive slices of the
+    input, so equal keys keep their input order. Returns the number of rows
+    written, or None if cancelled.
+    """
+    readers = [_read_csv_run(path) for path in run_paths]
+    heap = []
+    
+    def push(run_index):
+        row = next(readers[run_index], None)
+        if row is None:
+            return
+        value = int(row[key_pos]) if key_is_int else row[key_pos]
+        heapq.heappush(heap, (_Descending(value) if descending else value, run_index, row))
+    
+    try:
+        with open(output_path, 'w', encoding='utf-8', newline='') as out:
+            writer = csv.writer(out)
+            if header is not None:
+                writer.writerow(header)
+            
+            for run_index in range(len(readers)):
+                push(run_index)
+            
+            merged = 0
+            while heap:
+                _, run_index, row = heapq.heappop(heap)
+                writer.writerow(row)
+                push(run_index)
+                
+                merged += 1
+                if merged % 4096 == 0:
+                    if is_cancelled and is_cancelled():
+                        return None
+                    if on_row:
+                        on_row(merged)
+    finally:
+        for reader in readers:
+            reader.close()
+    
+    if on_row:
+        on_row(merged)
+    return merged
+
+def external_merge_sort(input_path, output_path, key, descending=False,
+                        memory_budget=DEFAULT_MEMORY_BUDGET, progress_callback=None,
+                        cancel_event=None, temp_dir=None):
+    """
+    External (out-of-core) Merge Sort of a CSV file.
+    
+    Reads the input in runs that fit in `memory_budget` bytes, sorts each run
+    with the merge sort kernel and spills it to a temp file, then streams a
+    k-way heap merge of the runs into `output_path`. Memory use depends on
+    the budget, not on the input size. If there are more runs than can be
+    open at once, intermediate merge passes are made first.
+    
+    Time Complexity: O(n log n)
+    Space Complexity: O(memory_budget) in RAM, O(n) on disk
+    Stable: Yes
+    
+    Returns a dict of run statistics, or None if cancelled.
+    """
+    control = ExecutionControl(progress_callback, cancel_event)
+    control.start(100)
+    is_cancelled = control.cancelled
+    total_bytes = max(os.path.getsize(input_path), 1)
+    fan_in = max(2, min(MAX_MERGE_FAN_IN, memory_budget // (2 * EXTERNAL_READ_BUFFER)))
+    
+    work_dir = tempfile.mkdtemp(prefix="extsort_", dir=temp_dir)
+    run_paths = []
+    total_rows = 0
+    skipped_rows = 0
+    
+    report = control.report
+    
+    try:
+        # Phase 1: sort bounded-size runs and spill them (0-50% progress)
+        header, chunks = open_csv_chunks(input_path)
+        try:
+            key_pos = header.index(key)
+            key_is_int = key == 'ID'
+            
+            run_rows = []
+            run_keys = []
+            run_bytes = 0
+            
+            def spill():
+                order = _merge_sort_order(run_keys, descending, ExecutionControl(cancel_event=cancel_event))
+                if order is None:
+                    return False
+                path = os.path.join(work_dir, f"run_{len(run_paths):05d}.csv")
+                with open(path, 'w', encoding='utf-8', newline='') as out:
+                    csv.writer(out).writerows(run_rows[i] for i in order)
+                run_paths.append(path)
+                return True
+            
+            if is_cancelled():
+                return None
+            for rows, bytes_read in chunks:
+                for row in rows:
+                    try:
+                        value = int(row[key_pos]) if key_is_int else row[key_pos]
+                    except (ValueError, IndexError):
+                        skipped_rows += 1
+                        continue
+                    run_rows.append(row)
+                    run_keys.append(value)
+                    run_bytes += EXTERNAL_ROW_OVERHEAD + sum(len(field) for field in row)
+                    
+                    if run_bytes >= memory_budget:
+                        if not spill():
+                            return None
+                        total_rows += len(run_rows)
+                        run_rows, run_keys, run_bytes = [], [], 0
+                
+                report(bytes_read / total_bytes * 50)
+                if is_cancelled():
+                    return None
+            
+            if run_rows or not run_paths:
+                if not spill():
+                    return None
+                total_rows += len(run_rows)
+                run_rows, run_keys = [], []
+        finally:
+            chunks.close()
+        
+        # Phase 2: merge passes until one run is left (50-100% progress)
+        merge_passes = 0
+        runs = run_paths
+        passes_needed, remaining = 1, len(runs)
+        while remaining > fan_in:
+            remaining = -(-remaining // fan_in)
+            passes_needed += 1
+        
+        while True:
+            rows_before = merge_passes * total_rows
+            
+            def on_row(merged):
+                work = (rows_before + merged) / (passes_needed * max(total_rows, 1))
+                report(50 + work * 50)
+            
+            if len(runs) <= fan_in:
+                merged = _merge_csv_runs(runs, output_path, key_pos, key_is_int, descending,
+                                         header=header, on_row=on_row, is_cancelled=is_cancelled)
+                if merged is None:
+                    os.remove(output_path)
+                    return None
+                merge_passes += 1
+                break
+            
+            next_runs = []
+            merged_in_pass = 0
+            for group_start in range(0, len(runs), fan_in):
+                group = runs[group_start:group_start + fan_in]
+                path = os.path.join(work_dir, f"pass{merge_passes}_{len(next_runs):05d}.csv")
+                base = merged_in_pass
+                merged = _merge_csv_runs(group, path, key_pos, key_is_int, descending,
+                                         on_row=lambda m: on_row(base + m),
+                                         is_cancelled=is_cancelled)
+                if merged is None:
+                    return None
+                merged_in_pass += merged
+                for old_run in group:
+                    os.remove(old_run)
+                next_runs.append(path)
+            runs = next_runs
+            merge_passes += 1
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    
+    if progress_callback:
+        progress_callback(100)
+    return {
+        'rows': total_rows,
+        'skipped_rows': skipped_rows,
+        'runs': len(run_paths),
+        'merge_passes': merge_passes,
+        'fan_in': fan_in
+    }
+
+# ============================================================================
+# PARALLEL MERGE SORT - Chunks sorted in worker processes
+# ============================================================================
+
+PARALLEL_MIN_CHUNK = 10000   # Below this per-worker size, process startup dominates
+
+# Per-chunk progress (0-100) shared with the workers; set by the pool initializer
+_worker_progress = None
+
+def _init_parallel_worker(progress_slots):
+    global _worker_progress
+    _worker_progress = progress_slots
+
+def _parallel_sort_chunk(chunk_index, keys, descending, count_operations=False):
+    """Worker entry point: sort one chunk and return its local index order.
+    
+    With count_operations, returns (order, operation counts) instead.
+    """
+    def report(p):
+        _worker_progress[chunk_index] = p
+    control = ExecutionControl(report)
+    if not count_operations:
+        return _merge_sort_order(keys, descending, control)
+    counter = OperationCounter()
+    order = _merge_sort_order(counter.wrap(keys), descending, control, counter)
+    return order, counter.as_dict()
+
+def _terminate_pool(executor):
+    """Stop a ProcessPoolExecutor right away, killing busy workers."""
+    terminate_workers = getattr(executor, 'terminate_workers', None)  # Python 3.14+
+    if terminate_workers:
+        terminate_workers()
+        return
+    for process in list((executor._processes or {}).values()):
+        process.terminate()
+    executor.shutdown(wait=False, cancel_futures=True)
+
+def _parallel_merge_sort_order(keys, descending, control, counter=None, workers=None):
+    """Parallel Merge Sort kernel: returns the sorted index order or None."""
+    n = len(keys)
+    workers = workers or os.cpu_count() or 1
+    chunks = max(1, min(workers, n // PARALLEL_MIN_CHUNK))
+    if chunks == 1:
+        if counter is not None:
+            keys = counter.wrap(keys)
+        return _merge_sort_order(keys, descending, control, counter)
+    
+    # Progress is counted in percent: 80 for the workers, 20 for the merge
+    control.start(100)
+    
+    # Contiguous chunks, so ties across chunks resolve by chunk number
+    bounds = [n * c // chunks for c in range(chunks + 1)]
+    
+    # Spawn (not fork) so workers never inherit the Tk or loader threads
+    context = multiprocessing.get_context('spawn')
+    progress_slots = context.Array('d', chunks, lock=False)
+    executor = ProcessPoolExecutor(max_workers=chunks, mp_context=context,
+                                   initializer=_init_parallel_worker,
+                                   initargs=(progress_slots,))
+    try:
+        futures = [
+            executor.submit(_parallel_sort_chunk, c, keys[bounds[c]:bounds[c + 1]], descending,
+                            counter is not None)
+            for c in range(chunks)
+        ]
+        
+        # Phase 1: workers sort their chunks (0-80% progress)
+        pending = set(futures)
+        while pending:
+            if not control.checkpoint(sum(progress_slots) / chunks * 0.8):
+                _terminate_pool(executor)
+                return None
+            _, pending = wait(pending, timeout=PROGRESS_INTERVAL)
+        chunk_orders = [future.result() for future in futures]
+    finally:
+        executor.shutdown(wait=False)
+    
+    if counter is not None:
+        # Worker counts come back with the orders; count the merge's comparisons too
+        for c, (local_order, counts) in enumerate(chunk_orders):
+            chunk_orders[c] = local_order
+            counter.add(counts)
+        counter.moves += n
+        counter.allocations += 1
+        keys = counter.wrap(keys)
+    
+    # Phase 2: stable k-way merge in the parent (80-100% progress)
+    heap = []
+    for c, local_order in enumerate(chunk_orders):
+        if local_order:
+            value = keys[bounds[c] + local_order[0]]
+            heap.append((_Descending(value) if descending else value, c, 0))
+    heapq.heapify(heap)
+    
+    order = []
+    while heap:
+        _, c, pos = heap[0]
+        start = bounds[c]
+        order.append(start + chunk_orders[c][pos])
+        pos += 1
+        if pos < len(chunk_orders[c]):
+            value = keys[start + chunk_orders[c][pos]]
+            heapq.heapreplace(heap, (_Descending(value) if descending else value, c, pos))
+        else:
+            heapq.heappop(heap)
+        
+        if len(order) % CHECKPOINT_WORK == 0:
+            if not control.checkpoint(80 + len(order) / n * 20):
+                return None
+    
+    return order
+
+def parallel_merge_sort(data, key, descending=False, progress_callback=None, cancel_event=None,
+                        counter=None):
+    """
+    Parallel Merge Sort implementation.
+    Splits the keys into one contiguous chunk per CPU core, sorts the chunks
+    in a process pool with the merge sort kernel and k-way merges them in
+    the parent. Cancelling terminates the worker processes.
+    Time Complexity: O((n/p) log(n/p)) per worker + O(n log p) merge
+    Space Complexity: O(n)
+    Stable: Yes (same output as merge_sort)
+    """
+    if len(data) <= 1:
+        return data[:]
+    
+    keys = extract_sort_keys(data, key)
+    order = _parallel_merge_sort_order(keys, descending, ExecutionControl(progress_callback, cancel_event),
+                                       counter)
+    if order is None:
+        return None
+    
+    if progress_callback:
+        progress_callback(100)
+    return apply_order(data, order)
+
+# ============================================================================
+# PARTIAL SORT - Top-k selection with a bounded heap, and keyset paging
+# ============================================================================
+
+PAGE_SIZE = 10   # Records per page of results
+
+def _top_k_order(keys, k, descending, control, counter=None, after=None):
+    """Top-k kernel: indices of the first k positions of the stable sorted order.
+    
+    A heap holds the k best (key, index) pairs seen so far with the worst
+    on top, so each record costs one comparison against the worst key and
+    only improvements pay O(log k). With `after` = (key, index), selection
+    starts right after that position, which is how pages are fetched.
+    Returns the indices best-first, or None if cancelled.
+    """
+    n = len(keys)
+    if k <= 0:
+        return []
+    control.start(n)
+    
+    # Ascending keeps (largest key, latest index) on top, descending the smallest key
+    wrap = (lambda value: value) if descending else _Descending
+    heap = []
+    insertions = 0
+    
+    for start in range(0, n, CHECKPOINT_WORK):
+        if not control.checkpoint(start):
+            return None
+        for i in range(start, min(start + CHECKPOINT_WORK, n)):
+            value = keys[i]
+            if after is not None:
+                after_value, after_index = after
+                if descending:
+                    if value > after_value or (value == after_value and i <= after_index):
+                        continue
+                elif value < after_value or (value == after_value and i <= after_index):
+                    continue
+            
+            if len(heap) < k:
+                heapq.heappush(heap, (wrap(value), -i, value))
+                insertions += 1
+                continue
+            # Replace the worst only if strictly better: on equal keys the
+            # earlier index wins, which keeps the selection stable
+            worst = heap[0][2]
+            if (value > worst) if descending else (value < worst):
+                heapq.heapreplace(heap, (wrap(value), -i, value))
+                insertions += 1
+    
+    selected = []
+    while heap:
+        selected.append(-heapq.heappop(heap)[1])
+    
+    if counter is not None:
+        counter.moves += insertions
+        counter.allocations += 2
+    return selected[::-1]
+
+def partial_sort(data, key, k, descending=False, progress_callback=None, cancel_event=None,
+                 counter=None):
+    """
+    Partial Sort (top-k selection) implementation.
+    Returns only the first k records of the sorted order, e.g. for
+    "show me the top N" queries, without sorting the rest.
+    Time Complexity: O(n log k)
+    Space Complexity: O(k)
+    Stable: Yes (same records and order as the first k of a full sort)
+    """
+    keys = extract_sort_keys(data, key, counter)
+    order = _top_k_order(keys, k, descending, ExecutionControl(progress_callback, cancel_event),
+                         counter)
+    if order is None:
+        return None
+    
+    if progress_callback:
+        progress_callback(100)
+    return apply_order(data, order)
+
+class SortedPager:
+    """Pages through the sorted order of `data` without sorting all of it.
+    
+    Each page is an O(n log page_size) top-k selection of the records after
+    the last one returned, so page 50 costs the same as page 2. Starting at
+    `start_page` makes the first next_page() one
+    O(n log(start_page · page_size)) selection longer. Selections report to
+    `progress_callback` and stop at `cancel_event`.
+    """
+    
+    def __init__(self, data, key, page_size=PAGE_SIZE, descending=False, start_page=0,
+                 progress_callback=None, cancel_event=None):
+        self.data = data
+        self.keys = extract_sort_keys(data, key)
+        self.page_size = page_size
+        self.descending = descending
+        self.start_page = start_page
+        self.control = ExecutionControl(progress_callback, cancel_event)
+        self.page = 0
+        self.after = None  # (key, index) of the last record returned
+    
+    def _advance(self, count):
+        order = _top_k_order(self.keys, count, self.descending, self.control, after=self.after)
+        if order:
+            self.after = (self.keys[order[-1]], order[-1])
+        return order
+    
+    def next_page(self):
+        """The next page of records; empty once the data is exhausted, or
+        None if cancelled (the pager stays where it was)."""
+        if self.page < self.start_page:
+            if self._advance(self.start_page * self.page_size) is None:
+                return None
+            self.page = self.start_page
+        order = self._advance(self.page_size)
+        if order is None:
+            return None
+        if order:
+            self.page += 1
+        return apply_order(self.data, order)
+
+# ============================================================================
+# INCREMENTAL SORTING - Merge newly added rows into an existing sorted order
+# ============================================================================
+
+INCREMENTAL_INSERT_LIMIT = 32   # Up to this many new rows are placed by binary search
+
+class IncrementalSortedView:
+    """The sorted order of a growing dataset, updated without re-sorting.
+    
+    Rows are only ever appended to a ColumnarDataset, so a sorted order of
+    its first n rows stays valid as it grows. extend_to() sorts just the k
+    new rows with the merge sort kernel and merges them in with one linear
+    pass, O(k log k + n); a handful of new rows are placed by binary search
+    instead. Equal keys keep row order, so the view always matches a stable
+    sort of the whole prefix. `key` is a column name or a sort spec.
+    """
+    
+    def __init__(self, dataset, key, descending=False, rows=None):
+        self.dataset = dataset
+        self.key = key
+        self.descending = descending
+        # Sort spec keys are tuples that carry each column's direction
+        self._reverse = descending if isinstance(key, str) else False
+        self.rows = array('q', rows) if rows is not None else array('q')
+        self.keys = self._keys_for(self.rows)
+    
+    def __len__(self):
+        return len(self.rows)
+    
+    def _keys_for(self, rows):
+        """Sort keys of the given rows (tuples for a sort spec)."""
+        if isinstance(self.key, str):
+            return self.dataset.column_values(self.key, rows)
+        
+        columns = []
+        for column, column_descending in self.key:
+            values = self.dataset.column_values(column, rows)
+            if column_descending != self.descending:
+                values = [_Descending(value) for value in values]
+            columns.append(values)
+        return list(zip(*columns))
+    
+    def extend_to(self, size, progress_callback=None, cancel_event=None):
+        """Bring rows len(self)..size-1 into the order. Returns False if cancelled."""
+        new_rows = range(len(self.rows), size)
+        if not new_rows:
+            return True
+        new_keys = self._keys_for(new_rows)
+        
+        if len(new_rows) <= INCREMENTAL_INSERT_LIMIT:
+            for row, value in zip(new_rows, new_keys):
+                self._insert(row, value)
+            return True
+        
+        order = _merge_sort_order(new_keys, self._reverse,
+                                  ExecutionControl(progress_callback, cancel_event))
+        if order is None:
+            return False
+        self._merge([new_keys[i] for i in order], [new_rows[i] for i in order])
+        return True
+    
+    def _insert(self, row, value):
+        """Binary-search insertion of one new row after all equal keys.
+        
+        New rows have the highest index so far, so this keeps ties stable.
+        """
+        keys, descending = self.keys, self._reverse
+        lo, hi = 0, len(keys)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if (keys[mid] < value) if descending else (value < keys[mid]):
+                hi = mid
+            else:
+                lo = mid + 1
+        keys.insert(lo, value)
+        self.rows.insert(lo, row)
+    
+    def _merge(self, new_keys, new_rows):
+        """Linear merge of the sorted new rows into the current order."""
+        old_keys, old_rows = self.keys, self.rows
+        keys, rows = [], array('q')
+        descending = self._reverse
+        i = j = 0
+        len_old, len_new = len(old_keys), len(new_keys)
+        
+        while i < len_old and j < len_new:
+            # Strictly before: on equal keys the older (lower) row goes first
+            if descending:
+                take_new = old_keys[i] < new_keys[j]
+            else:
+                take_new = new_keys[j] < old_keys[i]
+            
+            if take_new:
+                keys.append(new_keys[j])
+                rows.append(new_rows[j])
+                j += 1
+            else:
+                keys.append(old_keys[i])
+                rows.append(old_rows[i])
+                i += 1
+        
+        keys.extend(old_keys[i:])
+        rows.extend(old_rows[i:])
+        keys.extend(new_keys[j:])
+        rows.extend(new_rows[j:])
+        self.keys, self.rows = keys, rows
+    
+    def append(self, record_id, first_name, last_name):
+        """Append a row to the dataset and place it in the order.
+        
+        The view must already cover the whole dataset.
+        """
+        self.dataset.append(record_id, first_name, last_name)
+        self.extend_to(len(self.dataset))
+    
+    def view(self):
+        """Snapshot of the current order as a DatasetView."""
+        return DatasetView(self.dataset, array('q', self.rows))
+
+# ============================================================================
+# COLUMN INDEXES - Binary-search lookups over sorted columns
+# ============================================================================
+
+SEARCH_DISPLAY_LIMIT = 50   # Matches listed in the GUI; the API returns all of them
+
+class ColumnIndexes:
+    """Per-column sorted indexes for point, range and prefix queries.
+    
+    Each index is an ascending IncrementalSortedView of one column, so a
+    query is two binary searches plus the k matching rows, O(log n + k).
+    An index is built on first use, or adopted from a benchmark that
+    already sorted the whole dataset by that column, and is extended in
+    place as rows are appended. Name prefixes are matched case-sensitively,
+    in the same order the sorts use.
+    """
+    
+    def __init__(self, dataset):
+        self.dataset = dataset
+        self._indexes = {}
+    
+    def adopt(self, column, rows):
+        """Use an ascending sort of the whole dataset by `column` as its index."""
+        if column in REQUIRED_COLUMNS and len(rows) == len(self.dataset):
+            self._indexes[column] = IncrementalSortedView(self.dataset, column, rows=rows)
+    
+    def has_index(self, column):
+        return column in self._indexes
+    
+    def index(self, column, progress_callback=None, cancel_event=None):
+        """The up-to-date index of `column`, or None if building it was cancelled."""
+        if column not in REQUIRED_COLUMNS:
+            raise KeyError(f"Unknown column: {column}")
+        
+        view = self._indexes.get(column)
+        if view is None:
+            view = IncrementalSortedView(self.dataset, column)
+        if not view.extend_to(len(self.dataset), progress_callback, cancel_event):
+            return None
+        self._indexes[column] = view
+        return view
+    
+    def _matches(self, view, lo, hi):
+        return DatasetView(self.dataset, view.rows[lo:hi])
+    
+    def lookup_id(self, record_id):
+        """All rows whose ID equals `record_id`."""
+        return self.id_range(record_id, record_id)
+    
+    def id_range(self, low=None, high=None):
+        """Rows with low <= ID <= high, in ID order. None leaves a side open."""
+        view = self.index('ID')
+        keys = view.keys
+        lo = 0 if low is None else bisect.bisect_left(keys, low)
+        hi = len(keys) if high is None else bisect.bisect_right(keys, high, lo)
+        return self._matches(view, lo, hi)
+    
+    def prefix_search(self, column, prefix):
+        """Rows whose FirstName or LastName starts with `prefix`, in name order."""
+        if column not in ('FirstName', 'LastName'):
+            raise ValueError("Prefix search needs FirstName or LastName")
+        
+        view = self.index(column)
+        keys = view.keys
+        lo = bisect.bisect_left(keys, prefix)
+        # Every match sorts before the prefix with its last character bumped;
+        # U+10FFFF cannot be bumped, so trailing ones are dropped first, and
+        # a prefix of only those (or none) matches through to the end
+        stem = prefix.rstrip(chr(sys.maxunicode))
+        if not stem:
+            return self._matches(view, lo, len(keys))
+        upper = stem[:-1] + chr(ord(stem[-1]) + 1)
+        return self._matches(view, lo, bisect.bisect_left(keys, upper, lo))
+
+# ============================================================================
+# NUMPY BACKEND - Optional vectorized reference sort and verification
+# ============================================================================
+
+# Everything here needs NumPy and a columnar dataset; callers fall back to
+# the pure-Python paths when `np` is None.
+
+NUMPY_SORT_NAME = "NumPy Argsort (Reference)"
+NUMPY_VERIFY_MIN_SIZE = 10000   # Below this the Python is_sorted() loop is as fast
+
+def _numpy_rows(rows):
+    """Row indices of a view as an int64 ndarray (copied, never a live buffer)."""
+    if isinstance(rows, range):
+        return np.arange(rows.start, rows.stop, rows.step, dtype=np.int64)
+    return np.array(rows, dtype=np.int64)
+
+def _array_from_numpy(values):
+    rows = array('q')
+    rows.frombytes(values.astype(np.int64).tobytes())
+    return rows
+
+def _numpy_source(data, name):
+    """Raw ndarray of IDs or dictionary codes for a view's rows, and the
+    StringColumn the codes belong to (None for IDs).
+    
+    The column arrays are copied first, so the background loader can keep
+    appending to them.
+    """
+    dataset, rows = data.dataset, data.rows
+    if name == 'ID':
+        source, dtype = dataset.ids, np.int64
+    elif name in ('FirstName', 'LastName'):
+        column = dataset.first_names if name == 'FirstName' else dataset.last_names
+        source, dtype = column.codes, np.intc
+    else:
+        raise KeyError(f"Unknown column: {name}")
+    
+    if isinstance(rows, range) and rows.step == 1:
+        values = np.frombuffer(source[rows.start:rows.stop], dtype=dtype)
+    else:
+        values = np.frombuffer(source[:], dtype=dtype)[_numpy_rows(rows)]
+    return values, (column if name != 'ID' else None)
+
+def _numpy_keys(data, name):
+    """Integer keys that order like column `name`.
+    
+    Names are replaced by the rank of their dictionary entry, so only the
+    distinct values are string-sorted and the per-row work stays on ints.
+    """
+    values, column = _numpy_source(data, name)
+    if column is None:
+        return values
+    names = np.array(column.values[:] or [""])
+    rank_of_code = np.empty(len(names), dtype=np.int64)
+    rank_of_code[np.argsort(names, kind='stable')] = np.arange(len(names))
+    return rank_of_code[values]
+
+def _numpy_order(data, key, descending=False):
+    """Stable sort order of a DatasetView by a column or sort spec."""
+    if isinstance(key, str):
+        values = _numpy_keys(data, key)
+        if not descending:
+            return np.argsort(values, kind='stable')
+        # Stable descending: sort the reversed column, then reverse back
+        return (len(values) - 1 - np.argsort(values[::-1], kind='stable'))[::-1]
+    
+    # Keys are negated for columns that sort descending; np.lexsort is
+    # stable and takes the primary key last
+    columns = []
+    for column, column_descending in key:
+        values = _numpy_keys(data, column)
+        columns.append(-values if column_descending != descending else values)
+    return np.lexsort(columns[::-1])
+
+def numpy_sort(data, key, descending=False, progress_callback=None, cancel_event=None,
+               counter=None):
+    """Reference sort with NumPy's stable argsort, a throughput ceiling.
+    
+    Gives the same order as the stable pure-Python sorts. It is one
+    vectorized call, so it is not cancellable part-way and does not count
+    operations.
+    """
+    if isinstance(data, ColumnarDataset):
+        data = data[:]
+    elif not isinstance(data, DatasetView):
+        raise TypeError("numpy_sort needs a ColumnarDataset or DatasetView, "
+                        f"not {type(data).__name__}")
+    if cancel_event is not None and cancel_event.is_set():
+        return None
+    order = _numpy_order(data, key, descending)
+    if progress_callback:
+        progress_callback(100)
+    return DatasetView(data.dataset, _array_from_numpy(_numpy_rows(data.rows)[order]))
+
+def verify_sorted(sorted_data, key, descending=False):
+    """is_sorted() for a sorted view, vectorized with NumPy on large inputs.
+    
+    Compares neighbouring rows column by column in O(n); a later column
+    only matters where all earlier ones tie.
+    """
+    if (np is None or not isinstance(sorted_data, DatasetView)
+            or len(sorted_data) < NUMPY_VERIFY_MIN_SIZE):
+        return is_sorted(extract_sort_keys(sorted_data, key), descending)
+    
+    spec = [(key, False)] if isinstance(key, str) else key
+    undecided = np.ones(len(sorted_data) - 1, dtype=bool)
+    for column, column_descending in spec:
+        values = _numpy_keys(sorted_data, column)
+        before, after = values[:-1], values[1:]
+        if column_descending != descending:
+            before, after = after, before
+        if np.any(undecided & (before > after)):
+            return False
+        undecided &= before == after
+    return True
+
+def matches_reference(sorted_data, data, key, descending=False):
+    """Whether `sorted_data` holds exactly the rows of a stable sort of `data`.
+    
+    Checks stability and lost or duplicated rows, not just order. For a
+    top-k result the first k rows are compared. Returns None without NumPy
+    or for non-columnar data.
+    """
+    if np is None or not isinstance(sorted_data, DatasetView) or not isinstance(data, DatasetView):
+        return None
+    expected = _numpy_rows(data.rows)[_numpy_order(data, key, descending)][:len(sorted_data)]
+    return bool(np.array_equal(expected, _numpy_rows(sorted_data.rows)))
+
+# ============================================================================
+# ALGORITHM REGISTRY
+# ============================================================================
+
+SORT_ALGORITHMS = {
+    "Bubble Sort": bubble_sort,
+    "Insertion Sort": insertion_sort,
+    "Merge Sort": merge_sort,
+    "Merge Sort (Bottom-Up)": bottom_up_merge_sort,
+    "Adaptive Hybrid Sort": adaptive_sort,
+    "Radix Sort": radix_sort,
+    "Parallel Merge Sort": parallel_merge_sort
+}
+
+# Only offered when NumPy is installed
+if np is not None:
+    SORT_ALGORITHMS[NUMPY_SORT_NAME] = numpy_sort
+
+# Run through run_single_benchmark(top_k=...) rather than registered above,
+# since it returns only the first k records
+PARTIAL_SORT_NAME = "Partial Sort (Top-K)"
+
+QUADRATIC_ALGORITHMS = ("Bubble Sort", "Insertion Sort")
+LINEAR_ALGORITHMS = ("Radix Sort",)
+
+# ============================================================================
+# MEMORY MEASUREMENT
+# ============================================================================
+
+def measure_peak_memory(func, *args, **kwargs):
+    """Call func(*args, **kwargs) under tracemalloc.
+    
+    Returns (result, peak_bytes) where peak_bytes is the highest amount of
+    memory traced while the call ran. Tracing slows Python down, so only use
+    this when memory is being measured rather than time.
+    """
+    already_tracing = tracemalloc.is_tracing()
+    if not already_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline = tracemalloc.get_traced_memory()[0]
+    try:
+        result = func(*args, **kwargs)
+        peak = tracemalloc.get_traced_memory()[1] - baseline
+    finally:
+        if not already_tracing:
+            tracemalloc.stop()
+    return result, max(peak, 0)
+
+RSS_SAMPLE_INTERVAL = 0.005   # Seconds between resident-set samples
+
+def current_rss():
+    """Resident set size of this process in bytes, or None if unknown.
+    
+    Reads /proc/self/statm on Linux and falls back to psutil when it is
+    installed.
+    """
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    if psutil is not None:
+        return psutil.Process().memory_info().rss
+    return None
+
+def measure_rss_growth(func, *args, **kwargs):
+    """Call func(*args, **kwargs) while a thread samples the resident set.
+    
+    Returns (result, growth_bytes): how far the RSS rose above its level at
+    the start of the call, or None where the RSS cannot be read. Memory the
+    allocator already holds from earlier runs is reused without growing the
+    RSS, so this shows what the process had to request from the OS.
+    """
+    baseline = current_rss()
+    if baseline is None:
+        return func(*args, **kwargs), None
+    
+    peak = [baseline]
+    done = threading.Event()
+    
+    def sample():
+        while not done.wait(RSS_SAMPLE_INTERVAL):
+            peak[0] = max(peak[0], current_rss())
+    
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    try:
+        result = func(*args, **kwargs)
+    finally:
+        done.set()
+        sampler.join()
+    peak[0] = max(peak[0], current_rss())
+    return result, peak[0] - baseline
+
+# ============================================================================
+# TIMING HARNESS - Warmup, repetitions and GC control
+# ============================================================================
+
+def time_repeated(func, warmup=0, repeats=1, disable_gc=False, on_run=None):
+    """Call func() `warmup` times untimed, then `repeats` times timed.
+    
+    Each timed call is measured with perf_counter_ns. With disable_gc the
+    collector runs before each timed call and is switched off during it, so
+    GC pauses left over from earlier work do not land in the samples.
+    on_run(run_index, total_runs) is called before every call. Returns
+    (last_result, samples_ns), or (None, samples_so_far) as soon as func()
+    returns None (i.e. the sort was cancelled).
+    """
+    total_runs = warmup + repeats
+    samples_ns = []
+    result = None
+    gc_was_enabled = gc.isenabled()
+    
+    try:
+        for run in range(total_runs):
+            if on_run:
+                on_run(run, total_runs)
+            if disable_gc:
+                gc.collect()
+                gc.disable()
+            
+            start = time.perf_counter_ns()
+            result = func()
+            elapsed = time.perf_counter_ns() - start
+            
+            if disable_gc and gc_was_enabled:
+                gc.enable()
+            if result is None:
+                return None, samples_ns
+            if run >= warmup:
+                samples_ns.append(elapsed)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    
+    return result, samples_ns
+
+def summarize_timings(samples_ns, records):
+    """Median, min, max, quartiles and IQR (in seconds) plus throughput.
+    
+    Throughput is records per second at the median time.
+    """
+    samples = [ns / 1e9 for ns in samples_ns]
+    median = statistics.median(samples)
+    if len(samples) > 1:
+        q1, _, q3 = statistics.quantiles(samples, n=4, method='inclusive')
+    else:
+        q1 = q3 = samples[0]
+    return {
+        'sort_time': median,
+        'min_time': min(samples),
+        'max_time': max(samples),
+        'q1_time': q1,
+        'q3_time': q3,
+        'iqr': q3 - q1,
+        'repeats': len(samples),
+        'records_per_second': records / median if median > 0 else None,
+        'samples': samples
+    }
+
+# ============================================================================
+# BENCHMARK ENGINE - Shared by the GUI and the headless runner
+# ============================================================================
+
+QUADRATIC_SIZE_LIMIT = 10000   # O(n²) runs above this need confirmation / are skipped
+
+def load_dataset(csv_path, dataset=None, progress_callback=None, cancel_event=None, use_cache=True):
+    """Load `csv_path` from its binary cache, or parse it and refresh the cache.
+    
+    When parsing, rows are streamed into `dataset` (a new ColumnarDataset if
+    None) so callers can watch it fill. Returns (dataset, load_source), where
+    load_source is "cache hit" or "parsed CSV", or (None, None) if cancelled.
+    """
+    if use_cache:
+        cached = load_dataset_cache(csv_path)
+        if cached is not None:
+            return cached, "cache hit"
+    
+    # Taken before parsing: a file changed mid-parse must not be cached under
+    # its new signature with rows read from the old contents
+    signature = csv_signature(csv_path)
+    dataset = dataset if dataset is not None else ColumnarDataset()
+    if not stream_csv_into_dataset(csv_path, dataset, progress_callback, cancel_event):
+        return None, None
+    
+    if use_cache and csv_signature(csv_path) == signature:
+        try:
+            save_dataset_cache(dataset, csv_path, signature=signature)
+        except OSError as e:
+            print(f"Warning: Could not write dataset cache: {e}")
+    return dataset, "parsed CSV"
+
+def is_sorted(values, descending=False):
+    """Check that `values` is in ascending (or descending) order."""
+    if descending:
+        return all(values[i] >= values[i + 1] for i in range(len(values) - 1))
+    return all(values[i] <= values[i + 1] for i in range(len(values) - 1))
+
+def benchmark_result(algorithm, key, descending, size, samples_ns, warmup=0,
+                     disable_gc=False, top_k=None):
+    """Flat result dict for display and export; measurements not taken are None."""
+    result = {
+        'algorithm': algorithm,
+        'sort_key': describe_sort_spec(key, descending),
+        'descending': descending,
+        'size': size,
+        'warmup': warmup,
+        'gc_disabled': disable_gc,
+        'top_k': top_k
+    }
+    result.update(summarize_timings(samples_ns, size))
+    result.update(peak_memory=None, rss_growth=None, bytes_per_record=None)
+    result.update(dict.fromkeys(OperationCounter.FIELDS))
+    return result
+
+def run_single_benchmark(data, algorithm, key, descending=False, progress_callback=None,
+                         cancel_event=None, warmup=0, repeats=1, disable_gc=False,
+                         track_memory=False, count_operations=False, top_k=None):
+    """Sort `data` with one registered algorithm and measure the run.
+    
+    With top_k, partial_sort() selects only the first top_k records instead
+    and `algorithm` is ignored.
+    The sort runs `warmup` untimed and `repeats` timed times through
+    time_repeated(). With track_memory, two extra untimed runs measure the
+    resident-set growth and the tracemalloc peak (separately, since tracing
+    itself uses memory), and with count_operations one more run uses an
+    OperationCounter, so none of them inflate the timings. Returns
+    (sorted_data, result), where result is a flat dict of settings and
+    measurements suitable for display and export, or (None, None) if the
+    run was cancelled.
+    """
+    if top_k is not None:
+        algorithm = PARTIAL_SORT_NAME
+        sort_function = lambda data, key, **kwargs: partial_sort(data, key, top_k, **kwargs)
+    else:
+        sort_function = SORT_ALGORITHMS[algorithm]
+    total_runs = warmup + repeats + (2 if track_memory else 0) + (1 if count_operations else 0)
+    current_run = [0]
+    
+    def run_progress(p):
+        # Spread the progress bar over all runs instead of restarting it
+        progress_callback(min((current_run[0] + p / 100) / total_runs * 100, 99.9))
+    
+    def on_run(run, _):
+        current_run[0] = run
+    
+    sort_kwargs = dict(descending=descending,
+                       progress_callback=run_progress if progress_callback else None,
+                       cancel_event=cancel_event)
+    
+    sorted_data, samples_ns = time_repeated(
+        lambda: sort_function(data, key, **sort_kwargs),
+        warmup=warmup, repeats=repeats, disable_gc=disable_gc, on_run=on_run
+    )
+    if sorted_data is None:
+        return None, None
+    
+    peak_memory = rss_growth = None
+    if track_memory:
+        gc.collect()
+        current_run[0] = warmup + repeats
+        sampled, rss_growth = measure_rss_growth(sort_function, data, key, **sort_kwargs)
+        if sampled is None:
+            return None, None
+        del sampled
+        current_run[0] += 1
+        traced, peak_memory = measure_peak_memory(sort_function, data, key, **sort_kwargs)
+        if traced is None:
+            return None, None
+    
+    counter = None
+    if count_operations:
+        current_run[0] = total_runs - 1
+        counter = OperationCounter()
+        if sort_function(data, key, counter=counter, **sort_kwargs) is None:
+            return None, None
+    
+    if progress_callback:
+        progress_callback(100)
+    
+    size = len(data)
+    result = benchmark_result(algorithm, key, descending, size, samples_ns,
+                              warmup, disable_gc, top_k)
+    result['peak_memory'] = peak_memory
+    result['rss_growth'] = rss_growth
+    result['bytes_per_record'] = peak_memory / size if peak_memory is not None and size else None
+    if counter is not None:
+        result.update(counter.as_dict())
+    return sorted_data, result
+
+# ============================================================================
+# ISOLATED EXECUTION - Benchmarks in a child process that can be killed
+# ============================================================================
+
+ISOLATION_POLL_INTERVAL = 0.05   # Seconds between cancel, timeout and progress checks
+
+class BenchmarkTimeout(Exception):
+    """A benchmark ran past its wall-clock time limit and was killed."""
+
+def _share_rows(data, context):
+    """Copy the rows of a DatasetView into shared memory for a child process.
+    
+    IDs and name codes go into RawArrays, which a spawned child maps instead
+    of unpickling; only the two name dictionaries are pickled. The codes
+    are copied before the dictionaries, so a loader appending to the
+    dataset meanwhile cannot leave a code without its name.
+    """
+    dataset, rows = data.dataset, data.rows
+    n = len(rows)
+    columns = []
+    for source, typecode in ((dataset.ids, 'q'), (dataset.first_names.codes, 'i'),
+                             (dataset.last_names.codes, 'i')):
+        if isinstance(rows, range) and rows.step == 1:
+            values = source[rows.start:rows.stop]
+        else:
+            values = array(typecode, [source[r] for r in rows])
+        shared = context.RawArray(typecode, max(n, 1))
+        memoryview(shared).cast('B')[:n * values.itemsize] = memoryview(values).cast('B')
+        columns.append(shared)
+    return n, columns, dataset.first_names.values[:], dataset.last_names.values[:]
+
+def _unshare_rows(shared):
+    """Rebuild the rows copied by _share_rows() as a ColumnarDataset."""
+    n, (ids, first_codes, last_codes), first_values, last_values = shared
+    dataset = ColumnarDataset()
+    columns = []
+    for source, typecode in ((ids, 'q'), (first_codes, 'i'), (last_codes, 'i')):
+        values = array(typecode)
+        values.frombytes(memoryview(source).cast('B')[:n * values.itemsize])
+        columns.append(values)
+    dataset.ids = columns[0]
+    dataset.first_names = StringColumn.from_parts(first_values, columns[1])
+    dataset.last_names = StringColumn.from_parts(last_values, columns[2])
+    return dataset
+
+def _isolated_benchmark_worker(connection, order_buffer, progress, shared, algorithm, key,
+                               descending, options):
+    """Child process entry point for run_isolated_benchmark().
+    
+    Sorts the rows shared by _share_rows(), writes their sorted order
+    (indices into those rows) into the shared `order_buffer` and sends
+    ("ok", row count, result) or ("error", message, None) back.
+    """
+    if hasattr(os, 'setsid'):
+        os.setsid()  # Own process group, so a kill also stops parallel sort workers
+    
+    def report(p):
+        progress.value = p
+    
+    try:
+        data = _unshare_rows(shared)[:]
+        sorted_data, result = run_single_benchmark(data, algorithm, key, descending,
+                                                   progress_callback=report, **options)
+        rows = sorted_data.rows
+        if not isinstance(rows, array):
+            rows = array('q', rows)
+        memoryview(order_buffer).cast('B')[:len(rows) * rows.itemsize] = memoryview(rows).cast('B')
+        connection.send(("ok", len(rows), result))
+    except Exception as e:
+        connection.send(("error", f"{type(e).__name__}: {e}", None))
+    finally:
+        connection.close()
+
+def _kill_process_group(process):
+    """Kill a child at once, together with any worker processes it started."""
+    if hasattr(os, 'killpg'):
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+            return
+        except OSError:  # Not yet a group leader, or already gone
+            pass
+    process.kill()
+
+def run_isolated_benchmark(data, algorithm, key, descending=False, progress_callback=None,
+                           cancel_event=None, time_limit=None, **options):
+    """run_single_benchmark() in a child process, so it can be stopped at once.
+    
+    The sort runs outside this process's GIL, so a GUI waiting on it stays
+    responsive. The child is spawned, not forked: forking a process with
+    live Tk and loader threads can leave the child stuck on a lock one of
+    them held. The rows go to the child through shared memory
+    (_share_rows()), it writes the sorted order into a shared
+    array('q')-sized buffer and only the small result dict is pickled back.
+    Progress comes through a shared value. Cancelling, or running past
+    `time_limit` seconds, kills the child within ISOLATION_POLL_INTERVAL
+    instead of waiting for the sort's next checkpoint.
+    
+    Returns (sorted_data, result) like run_single_benchmark(), or
+    (None, None) if cancelled. Raises BenchmarkTimeout when the time limit
+    passes first and RuntimeError if the child fails.
+    """
+    if isinstance(data, ColumnarDataset):
+        data = data[:]
+    context = multiprocessing.get_context('spawn')
+    order_buffer = context.RawArray('q', max(len(data), 1))
+    progress = context.RawValue('d', 0.0)
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(
+        target=_isolated_benchmark_worker,
+        args=(sender, order_buffer, progress, _share_rows(data, context), algorithm, key,
+              descending, options)
+    )
+    deadline = time.perf_counter() + time_limit if time_limit else None
+    process.start()
+    sender.close()
+    finished = False
+    
+    try:
+        while not receiver.poll(ISOLATION_POLL_INTERVAL):
+            if cancel_event is not None and cancel_event.is_set():
+                return None, None
+            if deadline is not None and time.perf_counter() > deadline:
+                raise BenchmarkTimeout(f"Benchmark exceeded its {time_limit:g} s time limit")
+            if progress_callback:
+                progress_callback(progress.value)
+        
+        try:
+            status, count, result = receiver.recv()
+        except EOFError:
+            process.join()
+            raise RuntimeError(f"Benchmark process exited with code {process.exitcode}")
+        if status != "ok":
+            raise RuntimeError(count)
+        finished = True
+    finally:
+        if not finished and process.is_alive():
+            _kill_process_group(process)
+        process.join()
+        receiver.close()
+    
+    order = array('q')
+    order.frombytes(memoryview(order_buffer).cast('B')[:count * order.itemsize])
+    if progress_callback:
+        progress_callback(100)
+    return data.take(order), result
+
+# ============================================================================
+# SORT CACHE - LRU cache of sorted permutations
+# ============================================================================
+
+SORT_CACHE_BUDGET = 64 * 1024 * 1024   # Bytes of cached row permutations
+
+def dataset_fingerprint(csv_path):
+    """Identify the dataset loaded from `csv_path` (path, size, mtime)."""
+    signature = csv_signature(csv_path)
+    return (signature['path'], signature['size'], signature['mtime_ns'])
+
+class SortCache:
+    """Memory-bounded LRU cache of sorted row permutations.
+    
+    Entries are keyed on (dataset fingerprint, sort key, size), where the
+    sort key is describe_sort_spec() of the columns and directions and size
+    is the length of the dataset prefix that was sorted. Every algorithm is
+    stable, so the permutation does not depend on which one produced it.
+    A permutation of a longer prefix also answers a shorter one: keeping
+    the rows below the new size, in order, is the stable sorted order of
+    that prefix.
+    """
+    
+    def __init__(self, max_bytes=SORT_CACHE_BUDGET):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.prefix_hits = 0
+        self.misses = 0
+        self.extensions = 0
+        self.evictions = 0
+    
+    def get(self, fingerprint, sort_key, size):
+        """Return (rows, "hit" | "prefix hit"), or (None, "miss")."""
+        entry_key = (fingerprint, sort_key, size)
+        rows = self._entries.get(entry_key)
+        if rows is not None:
+            self._entries.move_to_end(entry_key)
+            self.hits += 1
+            return rows, "hit"
+        
+        # Smallest cached longer prefix of the same dataset and sort key
+        best = None
+        for fp, key, cached_size in self._entries:
+            if fp == fingerprint and key == sort_key and cached_size > size:
+                if best is None or cached_size < best:
+                    best = cached_size
+        if best is not None:
+            self._entries.move_to_end((fingerprint, sort_key, best))
+            rows = array('q', [r for r in self._entries[(fingerprint, sort_key, best)] if r < size])
+            self.put(fingerprint, sort_key, size, rows)
+            self.prefix_hits += 1
+            return rows, "prefix hit"
+        
+        self.misses += 1
+        return None, "miss"
+    
+    def nearest_shorter(self, fingerprint, sort_key, size):
+        """(cached_size, rows) of the longest cached shorter prefix, or None.
+        
+        Used to extend a permutation incrementally instead of re-sorting.
+        """
+        best = None
+        for fp, key, cached_size in self._entries:
+            if fp == fingerprint and key == sort_key and cached_size < size:
+                if best is None or cached_size > best:
+                    best = cached_size
+        if best is None:
+            return None
+        self.extensions += 1
+        self._entries.move_to_end((fingerprint, sort_key, best))
+        return best, self._entries[(fingerprint, sort_key, best)]
+    
+    def put(self, fingerprint, sort_key, size, rows):
+        """Store a permutation, evicting least recently used entries to fit."""
+        rows = rows if isinstance(rows, array) else array('q', rows)
+        entry_bytes = len(rows) * rows.itemsize
+        if entry_bytes > self.max_bytes:
+            return
+        entry_key = (fingerprint, sort_key, size)
+        if entry_key in self._entries:
+            self._remove(entry_key)
+        self._entries[entry_key] = rows
+        self.bytes += entry_bytes
+        while self.bytes > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+    
+    def _remove(self, entry_key):
+        rows = self._entries.pop(entry_key)
+        self.bytes -= len(rows) * rows.itemsize
+    
+    def invalidate(self, keep=None):
+        """Drop every entry whose dataset fingerprint is not `keep`."""
+        for entry_key in [k for k in self._entries if k[0] != keep]:
+            self._remove(entry_key)
+    
+    def __len__(self):
+        return len(self._entries)
+    
+    def stats(self):
+        lookups = self.hits + self.prefix_hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'bytes': self.bytes,
+            'hits': self.hits,
+            'prefix_hits': self.prefix_hits,
+            'misses': self.misses,
+            'extensions': self.extensions,
+            'evictions': self.evictions,
+            'hit_rate': (self.hits + self.prefix_hits) / lookups if lookups else None
+        }
+
+def run_cached_benchmark(cache, fingerprint, data, algorithm, key, descending=False,
+                         reuse=True, runner=None, **options):
+    """run_single_benchmark() backed by a SortCache.
+    
+    `data` must be the first len(data) rows of the dataset identified by
+    `fingerprint`. With reuse, a cached permutation (or one for a longer
+    prefix) is applied instead of sorting, and a cached shorter prefix is
+    extended with an IncrementalSortedView; the lookup or extension is what
+    gets timed. Otherwise the benchmark runs and its permutation is stored.
+    result['cache'] is "hit", "prefix hit", "extended", "miss" or "off".
+    Sorts run through `runner` (default run_single_benchmark()).
+    """
+    size = len(data)
+    sort_key = describe_sort_spec(key, descending)
+    
+    if reuse:
+        start = time.perf_counter_ns()
+        rows, status = cache.get(fingerprint, sort_key, size)
+        if rows is None:
+            shorter = cache.nearest_shorter(fingerprint, sort_key, size)
+            if shorter is not None:
+                view = IncrementalSortedView(data.dataset, key, descending, rows=shorter[1])
+                if not view.extend_to(size, options.get('progress_callback'),
+                                      options.get('cancel_event')):
+                    return None, None
+                rows, status = view.rows, "extended"
+                cache.put(fingerprint, sort_key, size, rows)
+        if rows is not None:
+            sorted_data = DatasetView(data.dataset, rows)
+            result = benchmark_result(algorithm, key, descending, size,
+                                      [time.perf_counter_ns() - start])
+            result['cache'] = status
+            return sorted_data, result
+    
+    sorted_data, result = (runner or run_single_benchmark)(data, algorithm, key, descending,
+                                                           **options)
+    if sorted_data is None:
+        return None, None
+    cache.put(fingerprint, sort_key, size, sorted_data.rows)
+    result['cache'] = "miss" if reuse else "off"
+    return sorted_data, result
+
+# ============================================================================
+# SCALING ANALYSIS - Empirical complexity fitting and runtime prediction
+# ============================================================================
+
+SCALING_MIN_SIZE = 250
+SCALING_TIME_BUDGET = 5.0      # Seconds of sorting per algorithm in a sweep
+CALIBRATION_TIME_BUDGET = 0.5  # Seconds spent estimating a run before it starts
+SLOPE_TOLERANCE = 0.35         # Allowed gap between measured and expected slope
+
+def expected_exponent(algorithm):
+    """Log-log slope an algorithm should show: 2 for O(n²), 1 otherwise.
+    
+    O(n log n) measures slightly above 1 (about 1.1 for these sizes).
+    """
+    return 2.0 if algorithm in QUADRATIC_ALGORITHMS else 1.0
+
+def geometric_sizes(max_size, min_size=SCALING_MIN_SIZE, factor=2):
+    """Sizes min_size, min_size·factor, ... up to and including max_size."""
+    sizes = []
+    size = min(min_size, max_size)
+    while size < max_size:
+        sizes.append(size)
+        size *= factor
+    sizes.append(max_size)
+    return sizes
+
+def fit_power_law(points):
+    """Least-squares fit of time = c · n^b on a log-log scale.
+    
+    `points` are (size, seconds) pairs. Returns (b, c, r_squared).
+    """
+    xs = [math.log(size) for size, _ in points]
+    ys = [math.log(max(seconds, 1e-9)) for _, seconds in points]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    sxx = sum((x - mean_x) ** 2 for x in xs)
+    sxy = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    slope = sxy / sxx if sxx > 0 else 0.0
+    intercept = mean_y - slope * mean_x
+    
+    ss_total = sum((y - mean_y) ** 2 for y in ys)
+    ss_resid = sum((y - (intercept + slope * x)) ** 2 for x, y in zip(xs, ys))
+    r_squared = 1 - ss_resid / ss_total if ss_total > 0 else 1.0
+    return slope, math.exp(intercept), r_squared
+
+def predict_time(fit, size):
+    """Predicted seconds for `size` records from a fit_power_law() result."""
+    slope, constant, _ = fit
+    return constant * size ** slope
+
+def format_duration(seconds):
+    if seconds < 60:
+        return f"{seconds:.2f} s"
+    if seconds < 3600:
+        return f"{seconds / 60:.1f} min"
+    return f"{seconds / 3600:.1f} h"
+
+def run_scaling_sweep(dataset, algorithm, key, descending=False, max_size=None,
+                      time_budget=SCALING_TIME_BUDGET, repeats=3, cancel_event=None,
+                      progress_callback=None):
+    """Time `algorithm` over a geometric ladder of sizes and fit its growth.
+    
+    Larger sizes are skipped once the fit so far predicts they would push
+    the sweep past `time_budget`. Returns a dict with the measured points,
+    the fitted slope/constant/R², the expected slope, whether the
+    algorithm scales as expected and the predicted time for `max_size`.
+    Returns None if cancelled.
+    """
+    max_size = len(dataset) if max_size is None else min(max_size, len(dataset))
+    sizes = geometric_sizes(max_size)
+    points = []
+    spent = 0.0
+    
+    for number, size in enumerate(sizes):
+        if len(points) >= 3:
+            if spent + predict_time(fit_power_law(points), size) * repeats > time_budget:
+                break
+        
+        sorted_data, result = run_single_benchmark(dataset[:size], algorithm, key, descending,
+                                                   cancel_event=cancel_event, repeats=repeats)
+        if sorted_data is None:
+            return None
+        points.append((size, result['sort_time']))
+        spent += result['sort_time'] * repeats
+        if progress_callback:
+            progress_callback(min((number + 1) / len(sizes) * 100, 99.9))
+    
+    sweep = {
+        'algorithm': algorithm,
+        'sort_key': describe_sort_spec(key, descending),
+        'points': points,
+        'target_size': max_size,
+        'expected_slope': expected_exponent(algorithm)
+    }
+    if len(points) >= 2:
+        slope, constant, r_squared = fit_power_law(points)
+        sweep.update(slope=slope, constant=constant, r_squared=r_squared,
+                     predicted_time=predict_time((slope, constant, r_squared), max_size),
+                     scales_as_expected=abs(slope - sweep['expected_slope']) <= SLOPE_TOLERANCE)
+    else:
+        sweep.update(slope=None, constant=None, r_squared=None,
+                     predicted_time=points[0][1] if points else None,
+                     scales_as_expected=None)
+    return sweep
+
+# ============================================================================
+# BENCHMARK HISTORY - SQLite run log and regression detection
+# ============================================================================
+
+HISTORY_PATH = os.path.join(DATA_DIR, "benchmark_history.sqlite3")
+REGRESSION_ALPHA = 0.05          # One-sided significance level for a slowdown
+REGRESSION_MIN_SLOWDOWN = 0.05   # Significant changes smaller than 5% are not flagged
+MANN_WHITNEY_EXACT_LIMIT = 400  # Up to this many sample pairs the p-value is exact
+
+HISTORY_FIELDS = ['algorithm', 'sort_key', 'descending', 'size', 'top_k', 'status', 'verified',
+                  'cache', 'sort_time', 'min_time', 'iqr', 'repeats', 'warmup', 'gc_disabled',
+                  'records_per_second', 'peak_memory', 'bytes_per_record', 'rss_growth',
+                  'comparisons', 'moves', 'allocations', 'max_depth']
+
+def mann_whitney_p(baseline, candidate):
+    """One-sided p-value that `candidate` times tend to be larger than `baseline`.
+    
+    Mann-Whitney U test; it makes no assumption about the shape of the
+    timing distribution. Up to MANN_WHITNEY_EXACT_LIMIT pairs
+    (n_base · n_cand) the p-value is exact, counted over every way of
+    splitting the pooled ranks, so 3 runs a side can never score below
+    1/C(6, 3) = 0.05. Larger samples use the normal approximation with tie
+    and continuity corrections. Returns None with fewer than two samples
+    on either side.
+    
+    PRELIM-EXAM/src/main.py and PRELIM-LAB-WORK-2/main.py keep identical
+    copies of this function on purpose: both scripts are standalone.
+    """
+    n_base, n_cand = len(baseline), len(candidate)
+    if n_base < 2 or n_cand < 2:
+        return None
+    
+    # Doubled average ranks over the pooled samples: ties share their mean
+    # rank, and doubling keeps those means whole for the exact count
+    pooled = sorted([(value, 0) for value in baseline] + [(value, 1) for value in candidate])
+    n = len(pooled)
+    ranks = []
+    tie_term = 0
+    i = 0
+    while i < n:
+        j = i
+        while j + 1 < n and pooled[j + 1][0] == pooled[i][0]:
+            j += 1
+        ties = j - i + 1
+        tie_term += ties ** 3 - ties
+        ranks.extend([i + j + 2] * ties)
+        i = j + 1
+    rank_sum = sum(rank for rank, (_, side) in zip(ranks, pooled) if side)
+    
+    if n_base * n_cand <= MANN_WHITNEY_EXACT_LIMIT:
+        return _rank_sum_tail(ranks, n_cand, rank_sum)
+    
+    u = rank_sum / 2 - n_cand * (n_cand + 1) / 2
+    mean = n_base * n_cand / 2
+    variance = n_base * n_cand / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (u - mean - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+def _rank_sum_tail(ranks, size, observed):
+    """Share of the ways to pick `size` of `ranks` whose sum is `observed` or more."""
+    total = sum(ranks)
+    upper = size <= len(ranks) - size
+    if not upper:
+        # Count the smaller complement, whose sum is then at most total - observed
+        size, observed = len(ranks) - size, total - observed
+    
+    # counts[k][s]: number of k-rank subsets summing to s
+    counts = [{0: 1}] + [{} for _ in range(size)]
+    for rank in ranks:
+        for k in range(size, 0, -1):
+            target = counts[k]
+            for s, ways in counts[k - 1].items():
+                target[s + rank] = target.get(s + rank, 0) + ways
+    
+    hits = sum(ways for s, ways in counts[size].items()
+               if (s >= observed if upper else s <= observed))
+    return hits / math.comb(len(ranks), size)
+
+def _config_key(result):
+    return (result.get('algorithm'), result.get('sort_key'), bool(result.get('descending')),
+            result.get('size'), result.get('top_k'))
+
+def compare_results(baseline, candidate, alpha=REGRESSION_ALPHA,
+                    min_slowdown=REGRESSION_MIN_SLOWDOWN):
+    """Compare two lists of results configuration by configuration.
+    
+    Each candidate result is matched with the baseline result of the same
+    algorithm, sort key, size and top-k. Its verdict is "regression" when it
+    is both significantly slower (one-sided p < alpha) and at least
+    `min_slowdown` slower at the median, and "improvement" for the reverse.
+    A significant change smaller than `min_slowdown` is "below threshold";
+    otherwise the verdict is "no change", "not enough runs" or "no baseline".
+    """
+    baseline_by_config = {_config_key(r): r for r in baseline if r.get('samples')}
+    comparisons = []
+    
+    for result in candidate:
+        if not result.get('samples'):
+            continue
+        row = {
+            'algorithm': result['algorithm'],
+            'sort_key': result['sort_key'],
+            'size': result['size'],
+            'top_k': result.get('top_k'),
+            'candidate_time': result['sort_time'],
+            'baseline_time': None,
+            'change': None,
+            'p_value': None,
+            'verdict': "no baseline"
+        }
+        comparisons.append(row)
+        base = baseline_by_config.get(_config_key(result))
+        if base is None:
+            continue
+        
+        row['baseline_time'] = base['sort_time']
+        row['change'] = result['sort_time'] / base['sort_time'] - 1 if base['sort_time'] else None
+        p_slower = mann_whitney_p(base['samples'], result['samples'])
+        if p_slower is None or row['change'] is None:
+            row['verdict'] = "not enough runs"
+            continue
+        p_faster = mann_whitney_p(result['samples'], base['samples'])
+        
+        if p_slower < alpha and row['change'] >= min_slowdown:
+            row['p_value'], row['verdict'] = p_slower, "regression"
+        elif p_faster < alpha and row['change'] <= -min_slowdown:
+            row['p_value'], row['verdict'] = p_faster, "improvement"
+        else:
+            row['p_value'] = min(p_slower, p_faster)
+            row['verdict'] = "below threshold" if row['p_value'] < alpha else "no change"
+    
+    return comparisons
+
+def format_comparison(comparisons, baseline_label, candidate_label):
+    """Plain-text regression report, one line per configuration."""
+    regressions = sum(1 for c in comparisons if c['verdict'] == "regression")
+    lines = [f"Regression check: {candidate_label} against baseline {baseline_label}",
+             f"{regressions} regression{'s' if regressions != 1 else ''} in "
+             f"{len(comparisons)} configuration{'s' if len(comparisons) != 1 else ''}"]
+    marks = {"regression": "✗", "improvement": "✓"}
+    
+    for c in comparisons:
+        label = f"{c['algorithm']} | {c['sort_key']} | {c['size']:,} rows"
+        if c['top_k'] is not None:
+            label += f" | top {c['top_k']}"
+        if c['baseline_time'] is None:
+            lines.append(f"    {label}: {c['candidate_time']:.6f}s (no baseline)")
+            continue
+        change = f"{c['change']:+.1%}" if c['change'] is not None else "n/a"
+        p_text = f", p={c['p_value']:.3f}" if c['p_value'] is not None else ""
+        lines.append(f"  {marks.get(c['verdict'], ' ')} {label}: {c['baseline_time']:.6f}s -> "
+                     f"{c['candidate_time']:.6f}s ({change}{p_text}) {c['verdict']}")
+    return "\n".join(lines)
+
+class BenchmarkHistory:
+    """Local SQLite log of benchmark sessions and their results.
+    
+    A session is one GUI benchmark or one headless matrix. It stores when
+    and where it ran (machine info) and the fingerprint of the dataset;
+    each result row keeps the HISTORY_FIELDS plus its raw timing samples,
+    which compare_results() needs for the significance test.
+    """
+    
+    def __init__(self, path=HISTORY_PATH):
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.row_factory = sqlite3.Row
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS sessions (id INTEGER PRIMARY KEY, "
+                "recorded_at TEXT NOT NULL, source TEXT NOT NULL, label TEXT, "
+                "machine TEXT, fingerprint TEXT)"
+            )
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS results (id INTEGER PRIMARY KEY, "
+                "session_id INTEGER NOT NULL REFERENCES sessions(id), "
+                + ", ".join(HISTORY_FIELDS) + ", samples TEXT)"
+            )
+    
+    def close(self):
+        self.connection.close()
+    
+    def record(self, results, source, fingerprint=None, label=None, machine=None):
+        """Store `results` as one new session and return its id."""
+        with self.connection:
+            cursor = self.connection.execute(
+                "INSERT INTO sessions (recorded_at, source, label, machine, fingerprint) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (datetime.now().isoformat(timespec='seconds'), source, label,
+                 json.dumps(machine or machine_info()),
+                 json.dumps(fingerprint) if fingerprint is not None else None)
+            )
+            session_id = cursor.lastrowid
+            placeholders = ", ".join("?" * (len(HISTORY_FIELDS) + 2))
+            self.connection.executemany(
+                f"INSERT INTO results (session_id, {', '.join(HISTORY_FIELDS)}, samples) "
+                f"VALUES ({placeholders})",
+                [(session_id, *(r.get(field) for field in HISTORY_FIELDS),
+                  json.dumps(r['samples']) if r.get('samples') else None) for r in results]
+            )
+        return session_id
+    
+    def sessions(self, limit=20):
+        """The most recent sessions, newest first, with their result counts."""
+        rows = self.connection.execute(
+            "SELECT s.id, s.recorded_at, s.source, s.label, COUNT(r.id) AS results "
+            "FROM sessions s LEFT JOIN results r ON r.session_id = s.id "
+            "GROUP BY s.id ORDER BY s.id DESC LIMIT ?", (limit,)
+        )
+        return [dict(row) for row in rows]
+    
+    def session(self, session_id):
+        """One session's metadata, or None if there is no such session."""
+        row = self.connection.execute("SELECT * FROM sessions WHERE id = ?",
+                                      (session_id,)).fetchone()
+        if row is None:
+            return None
+        session = dict(row)
+        session['machine'] = json.loads(session['machine']) if session['machine'] else None
+        session['fingerprint'] = (json.loads(session['fingerprint'])
+                                  if session['fingerprint'] else None)
+        return session
+    
+    def latest_session(self):
+        row = self.connection.execute("SELECT MAX(id) FROM sessions").fetchone()
+        return row[0]
+    
+    def results(self, session_id):
+        """A session's results as result dicts, samples included."""
+        rows = self.connection.execute(
+            f"SELECT {', '.join(HISTORY_FIELDS)}, samples FROM results "
+            "WHERE session_id = ? ORDER BY id", (session_id,)
+        )
+        results = []
+        for row in rows:
+            result = dict(row)
+            for field in ('descending', 'verified', 'gc_disabled'):
+                if result[field] is not None:
+                    result[field] = bool(result[field])
+            result['samples'] = json.loads(result['samples']) if result['samples'] else None
+            results.append(result)
+        return results
+    
+    def compare(self, baseline_id, candidate_id, **options):
+        """compare_results() between two recorded sessions."""
+        return compare_results(self.results(baseline_id), self.results(candidate_id), **options)
+
+# ============================================================================
+# MAIN APPLICATION CLASS
+# ============================================================================
+
+class SortingBenchmarkApp:
+    """Main application class for the Sorting Algorithm Stress Test."""
+    
+    def __init__(self, root):
+        self.root = root
+        self.root.title("Sorting Algorithm Stress Test - Prelim Exam")
+        self.root.geometry("1200x800")
+        self.root.configure(bg="#F0F0F0")
+        
+        # Application state
+        self.full_data = ColumnarDataset()
+        self.data_loaded = False
+        self.total_records = 0
+        self.cancel_event = threading.Event()
+        self.sort_thread = None
+        self.is_sorting = False
+        
+        # Background loading state; rows_ready is notified after every chunk
+        self.load_thread = None
+        self.is_loading = False
+        self.rows_loaded = 0
+        self.rows_ready = threading.Condition()
         
         # Configuration variables
         self.selected_algorithm = tk.StringVar(value="Merge Sort")
         self.selected_column = tk.StringVar(value="ID")
+        self.selected_order = tk.StringVar(value="Asc")
+        self.then_by = [(tk.StringVar(value="(none)"), tk.StringVar(value="Asc"))
+                        for _ in range(2)]
         self.selected_size = tk.StringVar(value="1000")
+        self.memory_budget_mb = tk.StringVar(value="64")
+        self.track_memory = tk.BooleanVar(value=False)
+        self.count_operations = tk.BooleanVar(value=False)
+        self.first_page_only = tk.BooleanVar(value=False)
+        self.reuse_sorts = tk.BooleanVar(value=False)
+        self.record_history = tk.BooleanVar(value=True)
+        self.isolate_runs = tk.BooleanVar(value=True)
+        self.time_limit = tk.StringVar(value="0")
+        self.warmup_runs = tk.StringVar(value="0")
+        self.timed_runs = tk.StringVar(value="1")
+        self.disable_gc = tk.BooleanVar(value=False)
         
         # Performance tracking
         self.load_time = 0
+        self.load_source = ""
         self.sort_time = 0
+        self.last_result = None
+        self.scaling_fits = {}
+        self.pending_progress = 0
+        self.progress_queued = False
+        self.pager = None
+        self.pager_source = None
+        self.sort_cache = SortCache()
+        self.fingerprint = None
+        self.indexes = ColumnIndexes(self.full_data)
+        self.history = None
+        self.last_session_id = None
+        self.baseline_session_id = None
+        self.search_column = tk.StringVar(value="LastName")
+        self.search_text = tk.StringVar()
         
         # Color scheme
         self.colors = {
@@ -362,27 +3326,71 @@ class SortingBenchmarkApp:
         # Algorithm selection
         ttk.Label(config_card, text="Algorithm:").grid(row=0, column=0, sticky=tk.W, pady=5)
         algo_combo = ttk.Combobox(config_card, textvariable=self.selected_algorithm,
-                                 values=["Bubble Sort", "Insertion Sort", "Merge Sort"],
+                                 values=list(SORT_ALGORITHMS),
                                  state="readonly", width=20)
         algo_combo.grid(row=0, column=1, sticky=tk.W, pady=5)
         
-        # Column selection
-        ttk.Label(config_card, text="Sort By:").grid(row=1, column=0, sticky=tk.W, pady=5)
-        column_combo = ttk.Combobox(config_card, textvariable=self.selected_column,
-                                   values=["ID", "FirstName", "LastName"],
-                                   state="readonly", width=20)
-        column_combo.grid(row=1, column=1, sticky=tk.W, pady=5)
+        # Column selection: primary column plus up to two tie-breakers
+        order_values = ["Asc", "Desc"]
+        then_values = ["(none)"] + REQUIRED_COLUMNS
+        sort_rows = [("Sort By:", self.selected_column, self.selected_order, REQUIRED_COLUMNS)]
+        sort_rows += [("Then By:", column_var, order_var, then_values)
+                      for column_var, order_var in self.then_by]
+        
+        for row, (label, column_var, order_var, values) in enumerate(sort_rows, start=1):
+            ttk.Label(config_card, text=label).grid(row=row, column=0, sticky=tk.W, pady=5)
+            key_frame = ttk.Frame(config_card)
+            key_frame.grid(row=row, column=1, sticky=tk.W, pady=5)
+            ttk.Combobox(key_frame, textvariable=column_var, values=values,
+                         state="readonly", width=12).pack(side=tk.LEFT)
+            ttk.Combobox(key_frame, textvariable=order_var, values=order_values,
+                         state="readonly", width=5).pack(side=tk.LEFT, padx=(3, 0))
         
         # Dataset size
-        ttk.Label(config_card, text="Dataset Size:").grid(row=2, column=0, sticky=tk.W, pady=5)
+        ttk.Label(config_card, text="Dataset Size:").grid(row=4, column=0, sticky=tk.W, pady=5)
         size_combo = ttk.Combobox(config_card, textvariable=self.selected_size,
                                  values=["100", "1000", "10000", "50000", "100000", "All"],
                                  state="readonly", width=20)
-        size_combo.grid(row=2, column=1, sticky=tk.W, pady=5)
+        size_combo.grid(row=4, column=1, sticky=tk.W, pady=5)
+        
+        # Timing: untimed warmup runs, timed repetitions, GC control
+        ttk.Label(config_card, text="Warmup / Runs:").grid(row=5, column=0, sticky=tk.W, pady=5)
+        runs_frame = ttk.Frame(config_card)
+        runs_frame.grid(row=5, column=1, sticky=tk.W, pady=5)
+        ttk.Spinbox(runs_frame, from_=0, to=20, textvariable=self.warmup_runs,
+                    width=5).pack(side=tk.LEFT)
+        ttk.Spinbox(runs_frame, from_=1, to=100, textvariable=self.timed_runs,
+                    width=5).pack(side=tk.LEFT, padx=(3, 0))
+        
+        # Child-process isolation, with an optional wall-clock limit (0 = none)
+        ttk.Label(config_card, text="Time Limit (s):").grid(row=6, column=0, sticky=tk.W, pady=5)
+        limit_frame = ttk.Frame(config_card)
+        limit_frame.grid(row=6, column=1, sticky=tk.W, pady=5)
+        ttk.Spinbox(limit_frame, from_=0, to=3600, textvariable=self.time_limit,
+                    width=5).pack(side=tk.LEFT)
+        ttk.Checkbutton(limit_frame, text="Run in child process",
+                        variable=self.isolate_runs).pack(side=tk.LEFT, padx=(5, 0))
+        
+        # Peak memory and operation counts (each measured in one extra,
+        # untimed run) and GC control
+        options_frame = ttk.Frame(config_card)
+        options_frame.grid(row=7, column=0, columnspan=2, sticky=tk.W, pady=5)
+        ttk.Checkbutton(options_frame, text="Track peak memory",
+                        variable=self.track_memory).pack(side=tk.LEFT)
+        ttk.Checkbutton(options_frame, text="Count operations",
+                        variable=self.count_operations).pack(side=tk.LEFT, padx=(10, 0))
+        ttk.Checkbutton(options_frame, text="Disable GC",
+                        variable=self.disable_gc).pack(side=tk.LEFT, padx=(10, 0))
+        ttk.Checkbutton(options_frame, text=f"First {PAGE_SIZE} only (partial sort)",
+                        variable=self.first_page_only).pack(side=tk.LEFT, padx=(10, 0))
+        ttk.Checkbutton(options_frame, text="Reuse cached sorts",
+                        variable=self.reuse_sorts).pack(side=tk.LEFT, padx=(10, 0))
+        ttk.Checkbutton(options_frame, text="Record history",
+                        variable=self.record_history).pack(side=tk.LEFT, padx=(10, 0))
         
         # Action buttons
         btn_frame = ttk.Frame(config_card)
-        btn_frame.grid(row=3, column=0, columnspan=2, pady=(10, 0))
+        btn_frame.grid(row=8, column=0, columnspan=2, pady=(10, 0))
         
         self.run_btn = ttk.Button(btn_frame, text="Run Benchmark", 
                                  command=self.start_benchmark, width=15)
@@ -392,6 +3400,23 @@ class SortingBenchmarkApp:
                                     command=self.cancel_benchmark, state=tk.DISABLED, width=15)
         self.cancel_btn.pack(side=tk.LEFT)
         
+        self.sweep_btn = ttk.Button(config_card, text="Scaling Sweep (all algorithms)",
+                                   command=self.start_scaling_sweep)
+        self.sweep_btn.grid(row=9, column=0, columnspan=2, sticky=tk.EW, pady=(5, 0))
+        
+        # External sort of a CSV file that may not fit in memory
+        external_card = ttk.LabelFrame(sidebar, text="External Merge Sort", padding=15)
+        external_card.pack(fill=tk.X, pady=(0, 15))
+        
+        ttk.Label(external_card, text="Memory (MB):").grid(row=0, column=0, sticky=tk.W, pady=5)
+        budget_combo = ttk.Combobox(external_card, textvariable=self.memory_budget_mb,
+                                   values=["16", "64", "256", "1024"], width=20)
+        budget_combo.grid(row=0, column=1, sticky=tk.W, pady=5)
+        
+        self.external_btn = ttk.Button(external_card, text="Sort CSV File...",
+                                      command=self.start_external_sort, width=15)
+        self.external_btn.grid(row=1, column=0, columnspan=2, pady=(10, 0))
+        
         # Info panel
         info_card = ttk.LabelFrame(sidebar, text="Dataset Info", padding=15)
         info_card.pack(fill=tk.X, pady=(0, 15))
@@ -401,12 +3426,16 @@ class SortingBenchmarkApp:
             ("records", "Total Records:"),
             ("loaded", "Data Status:"),
             ("load_time", "Load Time:"),
-            ("file_path", "Data File:")
+            ("file_path", "Data File:"),
+            ("sort_cache", "Sort Cache:")
         ]):
             ttk.Label(info_card, text=label).grid(row=i, column=0, sticky=tk.W, pady=2)
             self.info_labels[key] = ttk.Label(info_card, text="", foreground=self.colors['text_secondary'])
             self.info_labels[key].grid(row=i, column=1, sticky=tk.W, pady=2)
         
+        self.reload_btn = ttk.Button(info_card, text="Reload Data", command=self.reload_data)
+        self.reload_btn.grid(row=5, column=0, columnspan=2, pady=(10, 0))
+        
         # Complexity info
         complexity_card = ttk.LabelFrame(sidebar, text="Algorithm Complexity", padding=15)
         complexity_card.pack(fill=tk.X)
@@ -414,7 +3443,11 @@ class SortingBenchmarkApp:
         complexity_info = [
             ("Bubble Sort:", "O(n²) - Very Slow"),
             ("Insertion Sort:", "O(n²) - Slow"),
-            ("Merge Sort:", "O(n log n) - Fast")
+            ("Merge Sort:", "O(n log n) - Fast"),
+            ("Bottom-Up Merge:", "O(n log n) - Fast"),
+            ("Adaptive Hybrid:", "O(n) to O(n log n) - Fast"),
+            ("Radix Sort:", "O(n·k) - Fast"),
+            ("Parallel Merge:", "O(n log n) - Fast")
         ]
         
         for i, (algo, complexity) in enumerate(complexity_info):
@@ -435,6 +3468,20 @@ class SortingBenchmarkApp:
                                        length=100, mode="determinate")
         self.progress.pack(fill=tk.X, pady=(0, 10))
         
+        # Index search: ID, ID range or name prefix
+        search_frame = ttk.LabelFrame(main_content, text="Search", padding=10)
+        search_frame.pack(fill=tk.X, pady=(0, 10))
+        
+        ttk.Combobox(search_frame, textvariable=self.search_column, values=REQUIRED_COLUMNS,
+                     state="readonly", width=10).pack(side=tk.LEFT)
+        search_entry = ttk.Entry(search_frame, textvariable=self.search_text, width=30)
+        search_entry.pack(side=tk.LEFT, padx=5)
+        search_entry.bind("<Return>", lambda event: self.start_search())
+        self.search_btn = ttk.Button(search_frame, text="Search", command=self.start_search)
+        self.search_btn.pack(side=tk.LEFT)
+        ttk.Label(search_frame, text="ID: 42 or 100-200 · names: prefix (case-sensitive)",
+                  foreground=self.colors['text_secondary']).pack(side=tk.LEFT, padx=10)
+        
         # Results display
         results_frame = ttk.LabelFrame(main_content, text="Benchmark Results", padding=10)
         results_frame.pack(fill=tk.BOTH, expand=True)
@@ -451,6 +3498,16 @@ class SortingBenchmarkApp:
         self.results_text.configure(xscrollcommand=h_scrollbar.set)
         h_scrollbar.pack(fill=tk.X)
         
+        # Paging through a partial sort's order
+        self.next_page_btn = ttk.Button(results_frame, text=f"Next {PAGE_SIZE} Records ▸",
+                                        command=self.show_next_page, state=tk.DISABLED)
+        self.next_page_btn.pack(side=tk.RIGHT, pady=(5, 0))
+        
+        # Later runs are checked for regressions against the chosen baseline
+        self.baseline_btn = ttk.Button(results_frame, text="Set as Baseline",
+                                       command=self.set_baseline, state=tk.DISABLED)
+        self.baseline_btn.pack(side=tk.RIGHT, padx=5, pady=(5, 0))
+        
 
     
     def create_status_bar(self):
@@ -464,94 +3521,189 @@ class SortingBenchmarkApp:
         ttk.Label(status_bar, text=f"Data Path: {DATA_FILE_PATH}").pack(side=tk.RIGHT, padx=5)
     
     def load_data(self):
-        """Load data from CSV file."""
+        """Start loading the CSV file on a background thread."""
         if not os.path.exists(DATA_FILE_PATH):
             self.show_error(f"Data file not found at:\n{DATA_FILE_PATH}\n\n"
                            f"Please place 'generated_data.csv' in the 'data' folder.")
             return
         
+        self.full_data = ColumnarDataset()
+        self.indexes = ColumnIndexes(self.full_data)
+        self.data_loaded = False
+        self.is_loading = True
+        self.rows_loaded = 0
+        self.total_records = 0
+        
+        # Cached sorts of a CSV that has since changed no longer apply
+        self.fingerprint = dataset_fingerprint(DATA_FILE_PATH)
+        self.sort_cache.invalidate(keep=self.fingerprint)
+        self.update_cache_info()
+        
+        self.info_labels['loaded'].config(text="Loading...", foreground=self.colors['warning'])
+        self.info_labels['file_path'].config(text=os.path.basename(DATA_FILE_PATH))
+        self.status_label.config(text="Loading data...")
+        
+        self.load_thread = threading.Thread(target=self.run_data_load, daemon=True)
+        self.load_thread.start()
+    
+    def run_data_load(self):
+        """Load the dataset from the binary cache or the CSV (worker thread)."""
         start_time = time.time()
         
+        def on_chunk(rows, bytes_read, total_bytes):
+            with self.rows_ready:
+                self.rows_loaded = rows
+                self.rows_ready.notify_all()
+            
+            elapsed = time.time() - start_time
+            rate = rows / elapsed if elapsed > 0 else 0
+            percent = bytes_read / total_bytes * 100
+            self.root.after(0, lambda: self.on_load_progress(rows, percent, rate))
+        
         try:
-            with open(DATA_FILE_PATH, 'r', encoding='utf-8') as file:
-                # Check if file is empty
-                if os.path.getsize(DATA_FILE_PATH) == 0:
-                    self.show_error("CSV file is empty.")
-                    return
-                
-                # Read and parse CSV
-                reader = csv.DictReader(file)
-                required_columns = ['ID', 'FirstName', 'LastName']
-                
-                # Validate columns
-                if not all(col in reader.fieldnames for col in required_columns):
-                    missing = [col for col in required_columns if col not in reader.fieldnames]
-                    self.show_error(f"Missing required columns: {', '.join(missing)}")
-                    return
-                
-                # Read all records
-                self.full_data = []
-                for row in reader:
-                    try:
-                        # Convert ID to integer if possible
-                        if 'ID' in row and row['ID'].isdigit():
-                            row['ID'] = int(row['ID'])
-                        self.full_data.append(row)
-                    except Exception as e:
-                        print(f"Warning: Error parsing row: {e}")
-                        continue
-                
-                self.total_records = len(self.full_data)
-                self.data_loaded = True
-                self.load_time = time.time() - start_time
-                
-                # Update UI
-                self.info_labels['records'].config(text=f"{self.total_records:,}")
-                self.info_labels['loaded'].config(text="✓ Loaded", foreground=self.colors['success'])
-                self.info_labels['load_time'].config(text=f"{self.load_time:.3f} seconds")
-                self.info_labels['file_path'].config(text=os.path.basename(DATA_FILE_PATH))
-                
-                self.status_label.config(text=f"Loaded {self.total_records:,} records in {self.load_time:.3f}s")
-                
-
-                
+            dataset, load_source = load_dataset(DATA_FILE_PATH, self.full_data, progress_callback=on_chunk)
         except Exception as e:
-            self.show_error(f"Error loading data: {str(e)}")
+            message = str(e) if isinstance(e, ValueError) else f"Error loading data: {str(e)}"
+            self.root.after(0, lambda: self.on_load_failed(message))
+            return
+        
+        # A cache hit returns a new dataset rather than filling the empty one
+        self.full_data = dataset
+        load_time = time.time() - start_time
+        self.root.after(0, lambda: self.on_load_complete(load_time, load_source))
     
-
+    def reload_data(self):
+        """Re-read the data file, e.g. after it was regenerated or edited."""
+        if self.is_loading or self.is_sorting:
+            return
+        self.next_page_btn.config(state=tk.DISABLED)
+        self.load_data()
+    
+    def update_cache_info(self):
+        stats = self.sort_cache.stats()
+        self.info_labels['sort_cache'].config(
+            text=f"{stats['hits'] + stats['prefix_hits']} hits / {stats['misses']} misses "
+                 f"({stats['extensions']} extended), {stats['bytes'] / (1024 * 1024):.1f} MB"
+        )
+    
+    def on_load_progress(self, rows, percent, rate):
+        """Show streaming progress in the status bar."""
+        self.total_records = rows
+        self.info_labels['records'].config(text=f"{rows:,}")
+        self.info_labels['loaded'].config(text=f"Loading {percent:.0f}%")
+        self.status_label.config(
+            text=f"Loading data... {percent:.1f}% of file, {rows:,} rows ({rate:,.0f} rows/s)"
+        )
+    
+    def on_load_complete(self, load_time, load_source):
+        """Finalize state once the whole dataset is available."""
+        with self.rows_ready:
+            self.is_loading = False
+            self.rows_loaded = len(self.full_data)
+            self.rows_ready.notify_all()
+        
+        self.total_records = len(self.full_data)
+        self.data_loaded = True
+        self.load_time = load_time
+        self.load_source = load_source
+        
+        # Update UI
+        skipped = self.full_data.skipped_rows
+        self.info_labels['records'].config(
+            text=f"{self.total_records:,}" + (f" ({skipped:,} skipped)" if skipped else ""))
+        self.info_labels['loaded'].config(text="✓ Loaded", foreground=self.colors['success'])
+        self.info_labels['load_time'].config(text=f"{self.load_time:.3f}s ({load_source})")
+        
+        if not self.is_sorting:
+            self.status_label.config(
+                text=f"Loaded {self.total_records:,} records in {self.load_time:.3f}s ({load_source})"
+                     + (f", skipped {skipped:,} rows with a missing field or non-integer ID"
+                        if skipped else "")
+            )
+    
+    def on_load_failed(self, message):
+        """Report a loading error and release any waiting benchmark."""
+        with self.rows_ready:
+            self.is_loading = False
+            self.rows_ready.notify_all()
+        self.info_labels['loaded'].config(text="✗ Failed", foreground=self.colors['danger'])
+        self.show_error(message)
+    
+    def wait_for_rows(self, size):
+        """Block until `size` rows are loaded (None = the whole file).
+        
+        Returns the number of rows available, or None if cancelled.
+        """
+        with self.rows_ready:
+            while self.is_loading and (size is None or self.rows_loaded < size):
+                if self.cancel_event.is_set():
+                    return None
+                self.rows_ready.wait(0.1)
+            available = self.rows_loaded
+        return available if size is None else min(size, available)
     
     def start_benchmark(self):
         """Start the benchmarking process."""
-        if not self.data_loaded:
+        if not self.data_loaded and not self.is_loading:
             messagebox.showwarning("No Data", "Please load data first.")
             return
         
         # Get configuration
         algorithm = self.selected_algorithm.get()
-        column = self.selected_column.get()
+        column, descending = self.get_sort_key()
         size_str = self.selected_size.get()
+        try:
+            options = self.get_run_options()
+        except ValueError:
+            messagebox.showerror("Invalid Runs", "Warmup must be 0 or more, Runs at least 1 and the "
+                                 "Time Limit 0 (none) or more. A time limit needs "
+                                 "'Run in child process'.")
+            return
+        if options['top_k'] is not None:
+            algorithm = PARTIAL_SORT_NAME
         
-        # Parse size
+        # Parse size; while loading, sizes beyond the rows read so far wait
+        # for the loader instead of being clamped (None = whole file)
         if size_str == "All":
-            size = self.total_records
+            size = None if self.is_loading else self.total_records
         else:
             try:
                 size = int(size_str)
-                if size > self.total_records:
+                if not self.is_loading and size > self.total_records:
                     size = self.total_records
                     self.selected_size.set(str(size))
             except ValueError:
                 messagebox.showerror("Invalid Size", "Please select a valid dataset size.")
                 return
         
-        # Show warning for O(n²) algorithms with large datasets
-        if algorithm in ["Bubble Sort", "Insertion Sort"] and size > 10000:
-            response = messagebox.askyesno(
-                "Performance Warning",
-                f"{algorithm} with {size:,} records is O(n²) and will be VERY SLOW.\n\n"
-                f"Estimated time could be several minutes or more.\n\n"
-                f"Do you want to continue?"
-            )
+        # Large O(n²) runs get a warning with an ETA; an algorithm without a
+        # fit for this key is calibrated on a short sweep first (worker thread)
+        fit_key = (algorithm, describe_sort_spec(column, descending))
+        if (algorithm in QUADRATIC_ALGORITHMS and size is not None and size > QUADRATIC_SIZE_LIMIT
+                and not self.is_loading and fit_key not in self.scaling_fits):
+            self.start_calibration(algorithm, column, size, descending, options)
+            return
+        self.confirm_benchmark(algorithm, column, size, descending, options)
+    
+    def confirm_benchmark(self, algorithm, column, size, descending, options):
+        """Warn before large O(n²) runs, then start the benchmark thread."""
+        size_text = f"{size:,}" if size is not None else "all"
+        
+        if algorithm in QUADRATIC_ALGORITHMS and (size is None or size > QUADRATIC_SIZE_LIMIT):
+            estimate = None
+            if size is not None and not self.is_loading:
+                estimate = self.estimate_sort_time(algorithm, column, descending, size)
+            if estimate is not None:
+                runs = options['warmup'] + options['repeats']
+                slope, constant, _ = estimate['fit']
+                message = (f"{algorithm} with {size_text} records is O(n²).\n\n"
+                           f"Measured scaling: t(n) ≈ {constant:.3g} · n^{slope:.2f} s\n"
+                           f"Estimated time: {format_duration(estimate['seconds'] * runs)}"
+                           f" for {runs} run(s).\n\n")
+            else:
+                message = (f"{algorithm} with {size_text} records is O(n²) and will be VERY SLOW.\n\n"
+                           f"Estimated time could be several minutes or more.\n\n")
+            response = messagebox.askyesno("Performance Warning", message + "Do you want to continue?")
             if not response:
                 return
         
@@ -561,88 +3713,364 @@ class SortingBenchmarkApp:
         self.progress['value'] = 0
         
         # Update UI
-        self.run_btn.config(state=tk.DISABLED)
-        self.cancel_btn.config(state=tk.NORMAL)
-        self.status_label.config(text=f"Running {algorithm} on {size:,} records...")
+        self.set_running(True)
+        self.status_label.config(text=f"Running {algorithm} on {size_text} records...")
         
         # Clear results
         self.results_text.delete(1.0, tk.END)
         self.results_text.insert(1.0, f"Starting {algorithm} benchmark...\n")
-        self.results_text.insert(tk.END, f"Sorting {size:,} records by '{column}'\n")
+        self.results_text.insert(tk.END, f"Sorting {size_text} records by {describe_sort_spec(column, descending)}\n")
+        if self.is_loading:
+            self.results_text.insert(tk.END, "Waiting for the loader to reach the requested rows...\n")
         self.results_text.insert(tk.END, "-" * 50 + "\n\n")
         
         # Start sorting in separate thread
         self.sort_thread = threading.Thread(
             target=self.run_sort_benchmark,
-            args=(algorithm, column, size),
+            args=(algorithm, column, size, descending, options),
             daemon=True
         )
         self.sort_thread.start()
     
-    def run_sort_benchmark(self, algorithm, column, size):
-        """Run the sorting benchmark in a separate thread."""
-        # Get subset of data
-        data_subset = self.full_data[:size]
+    def get_sort_key(self):
+        """Build the sort key from the Sort By / Then By controls.
         
-        start_time = time.time()
+        Returns (column, descending) for a single column, or
+        (sort_spec, False) when tie-breaker columns are selected.
+        """
+        spec = [(self.selected_column.get(), self.selected_order.get() == "Desc")]
+        for column_var, order_var in self.then_by:
+            column = column_var.get()
+            if column in REQUIRED_COLUMNS and all(column != c for c, _ in spec):
+                spec.append((column, order_var.get() == "Desc"))
         
-        # Select algorithm
-        if algorithm == "Bubble Sort":
-            sorted_data = bubble_sort(
-                data_subset, column,
-                progress_callback=self.update_progress,
-                cancel_event=self.cancel_event
-            )
-        elif algorithm == "Insertion Sort":
-            sorted_data = insertion_sort(
-                data_subset, column,
-                progress_callback=self.update_progress,
-                cancel_event=self.cancel_event
-            )
-        else:  # Merge Sort
-            sorted_data = merge_sort(
-                data_subset, column,
-                progress_callback=self.update_progress,
-                cancel_event=self.cancel_event
-            )
+        if len(spec) == 1:
+            return spec[0]
+        return spec, False
+    
+    def get_run_options(self):
+        """Timing and measurement options for run_single_benchmark(), plus
+        `reuse` for run_cached_benchmark() and `isolate` / `time_limit` for
+        run_isolated_benchmark()."""
+        warmup = int(self.warmup_runs.get())
+        repeats = int(self.timed_runs.get())
+        time_limit = float(self.time_limit.get() or 0)
+        if warmup < 0 or repeats < 1 or time_limit < 0:
+            raise ValueError("invalid run counts")
+        if time_limit and not self.isolate_runs.get():
+            raise ValueError("time limit needs a child process")
+        return dict(warmup=warmup, repeats=repeats,
+                    disable_gc=self.disable_gc.get(),
+                    track_memory=self.track_memory.get(),
+                    count_operations=self.count_operations.get(),
+                    top_k=PAGE_SIZE if self.first_page_only.get() else None,
+                    reuse=self.reuse_sorts.get(),
+                    isolate=self.isolate_runs.get(),
+                    time_limit=time_limit or None)
+    
+    def run_sort_benchmark(self, algorithm, column, size, descending=False, options=None):
+        """Run the sorting benchmark in a separate thread.
+        
+        `column` is a column name or a multi-column sort spec; `options`
+        are passed on to run_single_benchmark().
+        """
+        # Wait until the loader has produced the requested rows
+        size = self.wait_for_rows(size)
+        if size is None:
+            self.root.after(0, self.on_benchmark_cancelled)
+            return
+        
+        # Get subset of data
+        data_subset = self.full_data[:size]
+        
+        options = dict(options or {})
+        runner = run_single_benchmark
+        time_limit = options.pop('time_limit', None)
+        if options.pop('isolate', False):
+            # Cancel and the time limit kill the child process outright
+            runner = lambda *args, **kwargs: run_isolated_benchmark(*args, time_limit=time_limit,
+                                                                    **kwargs)
         
-        end_time = time.time()
-        self.sort_time = end_time - start_time
+        try:
+            if options.get('top_k') is None:
+                # Full sorts go through the permutation cache (and fill it)
+                sorted_data, result = run_cached_benchmark(
+                    self.sort_cache, self.fingerprint, data_subset, algorithm, column, descending,
+                    reuse=options.pop('reuse', False),
+                    runner=runner,
+                    progress_callback=self.update_progress,
+                    cancel_event=self.cancel_event,
+                    **options
+                )
+            else:
+                options.pop('reuse', None)
+                sorted_data, result = runner(
+                    data_subset, algorithm, column, descending,
+                    progress_callback=self.update_progress,
+                    cancel_event=self.cancel_event,
+                    **options
+                )
+        except (BenchmarkTimeout, RuntimeError) as e:
+            message = str(e)
+            self.root.after(0, lambda: self.on_benchmark_failed(message))
+            return
+        except Exception as e:
+            # Anything else must still hand the UI back instead of leaving it running
+            message = f"Benchmark failed: {type(e).__name__}: {e}"
+            self.root.after(0, lambda: self.on_benchmark_failed(message))
+            return
         
         # Update UI in main thread
         if sorted_data is None:
             # Cancelled
             self.root.after(0, self.on_benchmark_cancelled)
         else:
+            self.sort_time = result['sort_time']
+            self.last_result = result
             self.root.after(0, lambda: self.on_benchmark_complete(
-                algorithm, column, size, sorted_data
+                algorithm, column, size, sorted_data, descending
             ))
     
     def update_progress(self, value):
-        """Update progress bar (thread-safe)."""
-        self.root.after(0, lambda: self.progress.configure(value=value))
+        """Update progress bar (thread-safe).
+        
+        Only the latest value is drawn: while an update is queued, newer
+        values replace it instead of adding more callbacks to the Tk queue.
+        """
+        self.pending_progress = value
+        if not self.progress_queued:
+            self.progress_queued = True
+            self.root.after(0, self.flush_progress)
+    
+    def flush_progress(self):
+        self.progress_queued = False
+        self.progress.configure(value=self.pending_progress)
+    
+    def set_running(self, running):
+        """Enable Cancel while a job runs, and the action buttons otherwise."""
+        state = tk.DISABLED if running else tk.NORMAL
+        for button in (self.run_btn, self.sweep_btn, self.external_btn, self.reload_btn,
+                       self.search_btn):
+            button.config(state=state)
+        self.cancel_btn.config(state=tk.NORMAL if running else tk.DISABLED)
+        if running:
+            self.next_page_btn.config(state=tk.DISABLED)
     
     def on_benchmark_cancelled(self):
         """Handle benchmark cancellation."""
         self.is_sorting = False
-        self.run_btn.config(state=tk.NORMAL)
-        self.cancel_btn.config(state=tk.DISABLED)
+        self.set_running(False)
         self.status_label.config(text="Benchmark cancelled")
         self.results_text.insert(tk.END, "\n⚠ Benchmark cancelled by user\n")
     
-    def on_benchmark_complete(self, algorithm, column, size, sorted_data):
+    def on_benchmark_failed(self, message):
+        """Handle a benchmark that timed out, whose child process died or that raised."""
+        self.is_sorting = False
+        self.set_running(False)
+        self.status_label.config(text=f"Benchmark stopped: {message}")
+        self.results_text.insert(tk.END, f"\n⚠ {message}\n")
+    
+    def on_benchmark_complete(self, algorithm, column, size, sorted_data, descending=False):
         """Handle benchmark completion."""
         self.is_sorting = False
         
         # Update UI
-        self.run_btn.config(state=tk.NORMAL)
-        self.cancel_btn.config(state=tk.DISABLED)
+        self.set_running(False)
         self.progress['value'] = 100
         
         # Display results
-        self.display_results(algorithm, column, size, sorted_data)
+        self.display_results(algorithm, column, size, sorted_data, descending)
+        self.update_cache_info()
+        self.record_result(self.last_result)
+        
+        # A full ascending sort of one column doubles as that column's index
+        if (isinstance(column, str) and not descending and algorithm != PARTIAL_SORT_NAME
+                and not self.is_loading and size == len(self.full_data)):
+            self.get_indexes().adopt(column, sorted_data.rows)
+        
+        # A partial sort can be paged through; the pager is built on first use
+        self.pager = None
+        if algorithm == PARTIAL_SORT_NAME:
+            self.pager_source = (size, column, descending)
+            self.next_page_btn.config(state=tk.NORMAL)
+    
+    def record_result(self, result):
+        """Log a measured (not cache-served) result and check it against the baseline."""
+        if not self.record_history.get() or result.get('cache') in ("hit", "prefix hit", "extended"):
+            return
+        try:
+            if self.history is None:
+                self.history = BenchmarkHistory()
+            self.last_session_id = self.history.record([result], "gui", fingerprint=self.fingerprint)
+            baseline = (self.history.results(self.baseline_session_id)
+                        if self.baseline_session_id is not None else None)
+        except sqlite3.Error as e:
+            self.status_label.config(text=f"Could not record history: {e}")
+            return
+        
+        self.baseline_btn.config(state=tk.NORMAL)
+        self.results_text.insert(tk.END, f"\nRecorded as history session #{self.last_session_id}\n")
+        if baseline is not None:
+            comparisons = compare_results(baseline, [result])
+            self.results_text.insert(tk.END, "\nREGRESSION CHECK:\n")
+            self.results_text.insert(tk.END, "-" * 40 + "\n")
+            self.results_text.insert(tk.END, format_comparison(
+                comparisons, f"#{self.baseline_session_id}", f"#{self.last_session_id}") + "\n")
+    
+    def set_baseline(self):
+        """Use the last recorded session as the baseline for later runs."""
+        self.baseline_session_id = self.last_session_id
+        self.status_label.config(text=f"Baseline set to history session #{self.baseline_session_id}")
+    
+    def show_next_page(self):
+        """Append the next page of the last partial sort's order to the results."""
+        if self.is_sorting:
+            return
+        self.cancel_event.clear()
+        self.is_sorting = True
+        self.progress['value'] = 0
+        self.set_running(True)
+        self.status_label.config(text=f"Selecting records {self.pager.page * PAGE_SIZE + 1:,}..."
+                                 if self.pager is not None else "Selecting the next page...")
+        
+        self.sort_thread = threading.Thread(target=self.run_next_page, daemon=True)
+        self.sort_thread.start()
+    
+    def run_next_page(self):
+        """Select the next page; each page is an O(n) pass (worker thread)."""
+        size, column, descending = self.pager_source
+        start_time = time.perf_counter()
+        try:
+            if self.pager is None:
+                self.pager = SortedPager(self.full_data[:size], column, PAGE_SIZE, descending,
+                                         start_page=1, progress_callback=self.update_progress,
+                                         cancel_event=self.cancel_event)
+            records = self.pager.next_page()
+        except Exception as e:
+            message = f"Page selection failed: {type(e).__name__}: {e}"
+            self.root.after(0, lambda: self.on_benchmark_failed(message))
+            return
+        elapsed = time.perf_counter() - start_time
+        self.root.after(0, lambda: self.on_next_page_complete(records, elapsed))
+    
+    def on_next_page_complete(self, records, elapsed):
+        self.is_sorting = False
+        self.set_running(False)
+        
+        if records is None:
+            self.status_label.config(text="Page selection cancelled")
+            self.next_page_btn.config(state=tk.NORMAL)
+            return
+        
+        self.progress['value'] = 100
+        if not records:
+            self.status_label.config(text="No more records")
+            self.results_text.insert(tk.END, "\n(no more records)\n")
+        else:
+            first = (self.pager.page - 1) * PAGE_SIZE + 1
+            self.status_label.config(text=f"Showing records up to {first + len(records) - 1:,}")
+            self.results_text.insert(tk.END, f"\nRECORDS {first:,}-{first + len(records) - 1:,} "
+                                             f"(selected in {elapsed:.4f} seconds):\n")
+            self.results_text.insert(tk.END, "-" * 60 + "\n")
+            self.insert_record_rows(records)
+            self.next_page_btn.config(state=tk.NORMAL)
+        self.results_text.see(tk.END)
+    
+    def get_indexes(self):
+        # A binary cache hit replaces the dataset the indexes were made for
+        if self.indexes.dataset is not self.full_data:
+            self.indexes = ColumnIndexes(self.full_data)
+        return self.indexes
+    
+    def start_search(self):
+        """Look up the search text in the selected column's index."""
+        if self.is_sorting:
+            return
+        if not self.rows_loaded:
+            messagebox.showwarning("No Data", "Please wait for the data to load.")
+            return
+        
+        column = self.search_column.get()
+        text = self.search_text.get().strip()
+        if column == 'ID':
+            try:
+                if '-' in text:
+                    low, high = (int(part) if part.strip() else None
+                                 for part in text.split('-', 1))
+                else:
+                    low = high = int(text)
+            except ValueError:
+                messagebox.showerror("Invalid Search", "Enter an ID such as 42 or a range such as 100-200.")
+                return
+            query = (low, high)
+        elif text:
+            query = text
+        else:
+            messagebox.showerror("Invalid Search", "Enter the start of a name.")
+            return
+        
+        self.cancel_event.clear()
+        self.is_sorting = True
+        self.set_running(True)
+        indexed = self.get_indexes().has_index(column)
+        self.status_label.config(
+            text=f"Searching {column}..." if indexed else f"Building {column} index..."
+        )
+        
+        self.sort_thread = threading.Thread(target=self.run_search, args=(column, query, text),
+                                            daemon=True)
+        self.sort_thread.start()
+    
+    def run_search(self, column, query, text):
+        """Build or extend the index if needed, then query it (worker thread)."""
+        indexes = self.get_indexes()
+        start_time = time.perf_counter()
+        if indexes.index(column, self.update_progress, self.cancel_event) is None:
+            self.root.after(0, self.on_benchmark_cancelled)
+            return
+        index_time = time.perf_counter() - start_time
+        
+        start_time = time.perf_counter()
+        if column == 'ID':
+            matches = indexes.id_range(*query)
+        else:
+            matches = indexes.prefix_search(column, query)
+        query_time = time.perf_counter() - start_time
+        
+        self.root.after(0, lambda: self.on_search_complete(column, text, matches,
+                                                            index_time, query_time))
+    
+    def on_search_complete(self, column, text, matches, index_time, query_time):
+        self.is_sorting = False
+        self.set_running(False)
+        self.progress['value'] = 100
+        self.status_label.config(text=f"{len(matches):,} matches for {column} '{text}'")
+        
+        self.results_text.delete(1.0, tk.END)
+        self.results_text.insert(tk.END, "=" * 60 + "\n")
+        self.results_text.insert(tk.END, f"SEARCH: {column} '{text}'\n")
+        self.results_text.insert(tk.END, "=" * 60 + "\n\n")
+        self.results_text.insert(tk.END, f"Matches:      {len(matches):,} of {len(self.indexes.dataset):,} records\n")
+        self.results_text.insert(tk.END, f"Query Time:   {query_time * 1000:.3f} ms (binary search, O(log n + k))\n")
+        self.results_text.insert(tk.END, f"Index Update: {index_time:.3f} seconds\n\n")
+        
+        shown = matches[:SEARCH_DISPLAY_LIMIT]
+        self.results_text.insert(tk.END, f"FIRST {len(shown)} MATCHES:\n")
+        self.results_text.insert(tk.END, "-" * 60 + "\n")
+        self.results_text.insert(tk.END, f"{'ID':<10} | {'FirstName':<20} | {'LastName':<20}\n")
+        self.results_text.insert(tk.END, "-" * 60 + "\n")
+        self.insert_record_rows(shown)
+        if len(matches) > len(shown):
+            self.results_text.insert(tk.END, f"... ({len(matches) - len(shown):,} more)\n")
+    
+    def insert_record_rows(self, records):
+        for record in records:
+            id_val = str(record.get('ID', 'N/A'))
+            first = record.get('FirstName', 'N/A')
+            last = record.get('LastName', 'N/A')
+            self.results_text.insert(tk.END, f"{id_val:<10} | {first:<20} | {last:<20}\n")
     
-    def display_results(self, algorithm, column, size, sorted_data):
+    def display_results(self, algorithm, column, size, sorted_data, descending=False):
         """Display benchmark results."""
         # Clear and format results
         self.results_text.delete(1.0, tk.END)
@@ -656,26 +4084,75 @@ class SortingBenchmarkApp:
         self.results_text.insert(tk.END, "CONFIGURATION:\n")
         self.results_text.insert(tk.END, "-" * 40 + "\n")
         self.results_text.insert(tk.END, f"Algorithm:     {algorithm}\n")
-        self.results_text.insert(tk.END, f"Sort Column:   {column}\n")
+        self.results_text.insert(tk.END, f"Sort Column:   {describe_sort_spec(column, descending)}\n")
         self.results_text.insert(tk.END, f"Dataset Size:  {size:,} records\n")
         self.results_text.insert(tk.END, f"Total Records: {self.total_records:,}\n\n")
         
         # Performance summary
         self.results_text.insert(tk.END, "PERFORMANCE:\n")
         self.results_text.insert(tk.END, "-" * 40 + "\n")
-        self.results_text.insert(tk.END, f"Data Load Time:  {self.load_time:.6f} seconds\n")
-        self.results_text.insert(tk.END, f"Sort Time:       {self.sort_time:.6f} seconds\n")
-        self.results_text.insert(tk.END, f"Total Time:      {self.load_time + self.sort_time:.6f} seconds\n\n")
+        self.results_text.insert(tk.END, f"Data Load Time:  {self.load_time:.6f} seconds ({self.load_source})\n")
+        result = self.last_result
+        runs_text = f"median of {result['repeats']} run{'s' if result['repeats'] != 1 else ''}"
+        if result.get('cache') in ("hit", "prefix hit"):
+            runs_text = f"cache {result['cache'].replace('hit', 'hit, no sort performed')}"
+        elif result.get('cache') == "extended":
+            runs_text = "cached shorter sort extended: only new rows sorted, then merged"
+        self.results_text.insert(tk.END, f"Sort Time:       {self.sort_time:.6f} seconds ({runs_text})\n")
+        if result['repeats'] > 1:
+            self.results_text.insert(tk.END, f"  Min / IQR:     {result['min_time']:.6f} / {result['iqr']:.6f} seconds\n")
+        if result['records_per_second']:
+            self.results_text.insert(tk.END, f"Throughput:      {result['records_per_second']:,.0f} records/second\n")
+        self.results_text.insert(tk.END, f"Warmup Runs:     {result['warmup']}"
+                                         f"{' (GC disabled while timing)' if result['gc_disabled'] else ''}\n")
+        self.results_text.insert(tk.END, f"Total Time:      {self.load_time + self.sort_time:.6f} seconds\n")
+        if result['peak_memory'] is not None:
+            self.results_text.insert(tk.END, f"Peak Memory:     {result['peak_memory'] / (1024 * 1024):,.2f} MB "
+                                             f"traced ({result['bytes_per_record'] or 0:,.1f} bytes/record)\n")
+            if result['rss_growth'] is not None:
+                self.results_text.insert(tk.END, f"RSS Growth:      {result['rss_growth'] / (1024 * 1024):,.2f} MB\n")
+        if np is not None and algorithm != NUMPY_SORT_NAME:
+            matched = matches_reference(sorted_data, self.full_data[:size], column, descending)
+            self.results_text.insert(tk.END, f"Reference Check: {'✓ same rows as' if matched else '✗ differs from'} "
+                                             f"NumPy stable argsort\n")
+        self.results_text.insert(tk.END, "\n")
         
         # Algorithm complexity
         self.results_text.insert(tk.END, "COMPLEXITY ANALYSIS:\n")
         self.results_text.insert(tk.END, "-" * 40 + "\n")
-        if algorithm == "Merge Sort":
-            self.results_text.insert(tk.END, f"Theoretical: O(n log n) = {size * math.log2(size):,.0f} operations\n")
-            self.results_text.insert(tk.END, "Status: ✓ Efficient for large datasets\n")
-        else:
+        if algorithm in QUADRATIC_ALGORITHMS:
             self.results_text.insert(tk.END, f"Theoretical: O(n²) = {size**2:,} operations\n")
             self.results_text.insert(tk.END, "Status: ⚠ Inefficient for large datasets\n")
+        elif algorithm in LINEAR_ALGORITHMS:
+            self.results_text.insert(tk.END, f"Theoretical: O(n·k) = {size:,} × k operations "
+                                             f"(k = digits or characters per key)\n")
+            self.results_text.insert(tk.END, "Status: ✓ Efficient for large datasets\n")
+        elif algorithm == PARTIAL_SORT_NAME:
+            self.results_text.insert(tk.END, f"Theoretical: O(n log k) = {size * math.log2(max(result['top_k'], 2)):,.0f} "
+                                             f"operations (k = {result['top_k']})\n")
+            self.results_text.insert(tk.END, "Status: ✓ Only the requested records are ordered\n")
+        else:
+            self.results_text.insert(tk.END, f"Theoretical: O(n log n) = {size * math.log2(max(size, 1)):,.0f} operations\n")
+            self.results_text.insert(tk.END, "Status: ✓ Efficient for large datasets\n")
+        if result['comparisons'] is not None:
+            comparisons_text = f"Comparisons: {result['comparisons']:,}"
+            if algorithm not in LINEAR_ALGORITHMS:
+                if algorithm == PARTIAL_SORT_NAME:
+                    estimate = size * math.log2(max(result['top_k'], 2))
+                elif algorithm in QUADRATIC_ALGORITHMS:
+                    estimate = size ** 2
+                else:
+                    estimate = size * math.log2(max(size, 2))
+                comparisons_text += f" ({result['comparisons'] / estimate:.2f}× the theoretical count)"
+            self.results_text.insert(tk.END, comparisons_text + "\n")
+            self.results_text.insert(tk.END, f"Moves:       {result['moves']:,}\n")
+            self.results_text.insert(tk.END, f"Allocations: {result['allocations']:,} buffers\n")
+            self.results_text.insert(tk.END, f"Max Depth:   {result['max_depth']:,}\n")
+        fit = self.scaling_fits.get((algorithm, describe_sort_spec(column, descending)))
+        if fit is not None:
+            self.results_text.insert(tk.END, f"Measured:    t(n) ≈ {fit[1]:.3g} · n^{fit[0]:.2f} s "
+                                             f"(predicted {format_duration(predict_time(fit, size))} "
+                                             f"per run)\n")
         self.results_text.insert(tk.END, "\n")
         
         # Show first 10 sorted records (as required)
@@ -684,19 +4161,18 @@ class SortingBenchmarkApp:
         self.results_text.insert(tk.END, f"{'ID':<10} | {'FirstName':<20} | {'LastName':<20}\n")
         self.results_text.insert(tk.END, "-" * 60 + "\n")
         
-        for i, record in enumerate(sorted_data[:10]):
-            id_val = str(record.get('ID', 'N/A'))
-            first = record.get('FirstName', 'N/A')
-            last = record.get('LastName', 'N/A')
-            self.results_text.insert(tk.END, f"{id_val:<10} | {first:<20} | {last:<20}\n")
+        self.insert_record_rows(sorted_data[:10])
         
         # Footer
         self.results_text.insert(tk.END, "-" * 60 + "\n")
-        if len(sorted_data) > 10:
+        if algorithm == PARTIAL_SORT_NAME:
+            self.results_text.insert(tk.END, f"Only the first {len(sorted_data)} of {size:,} records were "
+                                             f"sorted; use Next for more.\n")
+        elif len(sorted_data) > 10:
             self.results_text.insert(tk.END, f"... and {len(sorted_data) - 10:,} more records.\n")
         
         # Update status
-        efficiency = "✓ Efficient" if algorithm == "Merge Sort" else "⚠ Inefficient"
+        efficiency = "⚠ Inefficient" if algorithm in QUADRATIC_ALGORITHMS else "✓ Efficient"
         self.status_label.config(
             text=f"Completed {algorithm} on {size:,} records in {self.sort_time:.3f}s ({efficiency})"
         )
@@ -704,6 +4180,255 @@ class SortingBenchmarkApp:
         # Auto-scroll to top
         self.results_text.see(1.0)
     
+    def estimate_sort_time(self, algorithm, column, descending, size):
+        """Predicted seconds per run from the cached scaling fit.
+        
+        Fits are cached per algorithm and sort key, by a scaling sweep or
+        start_calibration(). Returns a dict with the fit and the predicted
+        seconds, or None if there is no fit yet.
+        """
+        fit = self.scaling_fits.get((algorithm, describe_sort_spec(column, descending)))
+        if fit is None:
+            return None
+        return {'fit': fit, 'seconds': predict_time(fit, size)}
+    
+    def start_calibration(self, algorithm, column, size, descending, options):
+        """Fit `algorithm` on a short sweep before warning about its run time."""
+        self.cancel_event.clear()
+        self.is_sorting = True
+        self.progress['value'] = 0
+        self.set_running(True)
+        self.status_label.config(text=f"Calibrating {algorithm}...")
+        
+        self.sort_thread = threading.Thread(
+            target=self.run_calibration,
+            args=(algorithm, column, size, descending, options),
+            daemon=True
+        )
+        self.sort_thread.start()
+    
+    def run_calibration(self, algorithm, column, size, descending, options):
+        """Run the calibration sweep (worker thread)."""
+        try:
+            sweep = run_scaling_sweep(self.full_data, algorithm, column, descending,
+                                      max_size=size, time_budget=CALIBRATION_TIME_BUDGET,
+                                      repeats=1, cancel_event=self.cancel_event,
+                                      progress_callback=self.update_progress)
+        except Exception as e:
+            message = f"Calibration failed: {e}"
+            self.root.after(0, lambda: self.on_benchmark_failed(message))
+            return
+        
+        if sweep is None:
+            self.root.after(0, self.on_benchmark_cancelled)
+        else:
+            self.root.after(0, lambda: self.on_calibration_complete(
+                sweep, algorithm, column, size, descending, options))
+    
+    def on_calibration_complete(self, sweep, algorithm, column, size, descending, options):
+        """Cache the calibration fit and continue with the benchmark."""
+        self.is_sorting = False
+        self.set_running(False)
+        self.progress['value'] = 0
+        if sweep['slope'] is not None:
+            self.scaling_fits[(algorithm, sweep['sort_key'])] = (
+                sweep['slope'], sweep['constant'], sweep['r_squared'])
+        self.status_label.config(text=f"Calibrated {algorithm}")
+        self.confirm_benchmark(algorithm, column, size, descending, options)
+    
+    def start_scaling_sweep(self):
+        """Fit the growth of every algorithm over a geometric ladder of sizes."""
+        if not self.data_loaded:
+            messagebox.showwarning("No Data", "Please wait for the data to finish loading.")
+            return
+        
+        column, descending = self.get_sort_key()
+        size_str = self.selected_size.get()
+        size = self.total_records if size_str == "All" else min(int(size_str), self.total_records)
+        
+        self.cancel_event.clear()
+        self.is_sorting = True
+        self.progress['value'] = 0
+        self.set_running(True)
+        self.status_label.config(text=f"Running scaling sweep up to {size:,} records...")
+        
+        self.results_text.delete(1.0, tk.END)
+        self.results_text.insert(1.0, f"Scaling sweep by {describe_sort_spec(column, descending)}, "
+                                      f"target size {size:,}\n")
+        self.results_text.insert(tk.END, f"Each algorithm gets about {SCALING_TIME_BUDGET:.0f} s; "
+                                         f"larger sizes are predicted, not measured.\n")
+        self.results_text.insert(tk.END, "-" * 50 + "\n\n")
+        
+        self.sort_thread = threading.Thread(
+            target=self.run_scaling_sweeps,
+            args=(column, descending, size),
+            daemon=True
+        )
+        self.sort_thread.start()
+    
+    def run_scaling_sweeps(self, column, descending, size):
+        """Run a scaling sweep per algorithm (worker thread)."""
+        sweeps = []
+        algorithms = list(SORT_ALGORITHMS)
+        for number, algorithm in enumerate(algorithms):
+            self.root.after(0, lambda a=algorithm: self.status_label.config(text=f"Sweeping {a}..."))
+            sweep = run_scaling_sweep(
+                self.full_data, algorithm, column, descending, max_size=size,
+                cancel_event=self.cancel_event,
+                progress_callback=lambda value, n=number: self.update_progress(
+                    (n + value / 100) / len(algorithms) * 100)
+            )
+            if sweep is None:
+                self.root.after(0, self.on_benchmark_cancelled)
+                return
+            sweeps.append(sweep)
+        self.root.after(0, lambda: self.on_scaling_sweep_complete(sweeps, size))
+    
+    def on_scaling_sweep_complete(self, sweeps, size):
+        """Show the fitted exponents and predictions of a scaling sweep."""
+        self.is_sorting = False
+        self.set_running(False)
+        self.progress['value'] = 100
+        
+        for sweep in sweeps:
+            if sweep['slope'] is not None:
+                self.scaling_fits[(sweep['algorithm'], sweep['sort_key'])] = (
+                    sweep['slope'], sweep['constant'], sweep['r_squared'])
+        
+        self.results_text.delete(1.0, tk.END)
+        self.results_text.insert(1.0, "=" * 78 + "\n")
+        self.results_text.insert(tk.END, "SCALING SWEEP - t(n) ≈ c · n^b\n")
+        self.results_text.insert(tk.END, "=" * 78 + "\n\n")
+        self.results_text.insert(tk.END, f"Sort Column: {sweeps[0]['sort_key']}\n\n")
+        self.results_text.insert(tk.END, f"{'Algorithm':<26} {'Sizes':>9} {'b':>5} {'exp.':>5} "
+                                         f"{'c':>9} {'R²':>6} {f't({size:,})':>12}\n")
+        self.results_text.insert(tk.END, "-" * 78 + "\n")
+        
+        unexpected = []
+        for sweep in sweeps:
+            points = sweep['points']
+            sizes_text = f"≤{points[-1][0]:,}"
+            if sweep['slope'] is None:
+                self.results_text.insert(tk.END, f"{sweep['algorithm']:<26} {sizes_text:>9}   (too few sizes to fit)\n")
+                continue
+            status = "✓" if sweep['scales_as_expected'] else "⚠"
+            if not sweep['scales_as_expected']:
+                unexpected.append(sweep['algorithm'])
+            self.results_text.insert(
+                tk.END,
+                f"{sweep['algorithm']:<26} {sizes_text:>9} {sweep['slope']:>5.2f} "
+                f"{sweep['expected_slope']:>5.1f} {sweep['constant']:>9.2e} {sweep['r_squared']:>6.3f} "
+                f"{format_duration(sweep['predicted_time']):>12} {status}\n"
+            )
+        
+        self.results_text.insert(tk.END, "-" * 78 + "\n")
+        self.results_text.insert(tk.END, "b = measured log-log slope, exp. = slope implied by the "
+                                         "algorithm's complexity.\n")
+        if unexpected:
+            self.results_text.insert(tk.END, f"\n⚠ Not scaling as expected: {', '.join(unexpected)}\n")
+        self.status_label.config(text=f"Scaling sweep complete ({len(sweeps)} algorithms)")
+        self.results_text.see(1.0)
+    
+    def start_external_sort(self):
+        """Sort a CSV file on disk by the selected column within a memory budget."""
+        try:
+            budget = int(float(self.memory_budget_mb.get()) * 1024 * 1024)
+            if budget <= 0:
+                raise ValueError
+        except ValueError:
+            messagebox.showerror("Invalid Budget", "Please enter a positive memory budget in MB.")
+            return
+        
+        input_path = filedialog.askopenfilename(
+            title="CSV file to sort", initialdir=DATA_DIR,
+            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
+        )
+        if not input_path:
+            return
+        column = self.selected_column.get()
+        descending = self.selected_order.get() == "Desc"
+        output_path = filedialog.asksaveasfilename(
+            title="Save sorted CSV as", initialdir=os.path.dirname(input_path),
+            initialfile=f"sorted_by_{column}.csv", defaultextension=".csv",
+            filetypes=[("CSV files", "*.csv")]
+        )
+        if not output_path:
+            return
+        if os.path.abspath(output_path) == os.path.abspath(input_path):
+            messagebox.showerror("Invalid Output", "The output file must differ from the input file.")
+            return
+        
+        # Reset state
+        self.cancel_event.clear()
+        self.is_sorting = True
+        self.progress['value'] = 0
+        
+        # Update UI
+        self.set_running(True)
+        self.status_label.config(text=f"External sort of {os.path.basename(input_path)} by '{column}'...")
+        
+        self.results_text.delete(1.0, tk.END)
+        self.results_text.insert(1.0, "Starting External Merge Sort...\n")
+        self.results_text.insert(tk.END, f"Input:         {input_path}\n")
+        self.results_text.insert(tk.END, f"Output:        {output_path}\n")
+        self.results_text.insert(tk.END, f"Memory Budget: {budget / (1024 * 1024):,.0f} MB\n")
+        self.results_text.insert(tk.END, "-" * 50 + "\n\n")
+        
+        self.sort_thread = threading.Thread(
+            target=self.run_external_sort,
+            args=(input_path, output_path, column, descending, budget),
+            daemon=True
+        )
+        self.sort_thread.start()
+    
+    def run_external_sort(self, input_path, output_path, column, descending, budget):
+        """Run the external merge sort in a separate thread."""
+        start_time = time.time()
+        try:
+            stats = external_merge_sort(
+                input_path, output_path, column, descending,
+                memory_budget=budget,
+                progress_callback=self.update_progress,
+                cancel_event=self.cancel_event
+            )
+        except Exception as e:
+            message = f"External sort failed: {str(e)}"
+            self.root.after(0, lambda: self.on_external_sort_failed(message))
+            return
+        elapsed = time.time() - start_time
+        
+        if stats is None:
+            self.root.after(0, self.on_benchmark_cancelled)
+        else:
+            self.root.after(0, lambda: self.on_external_sort_complete(output_path, column, stats, elapsed))
+    
+    def on_external_sort_complete(self, output_path, column, stats, elapsed):
+        """Show the external sort summary."""
+        self.is_sorting = False
+        self.set_running(False)
+        self.progress['value'] = 100
+        
+        self.results_text.insert(tk.END, "EXTERNAL MERGE SORT RESULTS:\n")
+        self.results_text.insert(tk.END, "-" * 40 + "\n")
+        self.results_text.insert(tk.END, f"Sort Column:   {column}\n")
+        self.results_text.insert(tk.END, f"Rows Sorted:   {stats['rows']:,}\n")
+        if stats['skipped_rows']:
+            self.results_text.insert(tk.END, f"Rows Skipped:  {stats['skipped_rows']:,} "
+                                             f"(missing field or non-integer ID)\n")
+        self.results_text.insert(tk.END, f"Sorted Runs:   {stats['runs']:,}\n")
+        self.results_text.insert(tk.END, f"Merge Passes:  {stats['merge_passes']} (fan-in {stats['fan_in']})\n")
+        self.results_text.insert(tk.END, f"Sort Time:     {elapsed:.6f} seconds\n")
+        self.results_text.insert(tk.END, f"\nSorted file written to:\n{output_path}\n")
+        
+        self.status_label.config(text=f"External sort of {stats['rows']:,} rows done in {elapsed:.3f}s")
+    
+    def on_external_sort_failed(self, message):
+        """Handle an error raised by the external sort."""
+        self.is_sorting = False
+        self.set_running(False)
+        messagebox.showerror("Error", message)
+        self.status_label.config(text="External sort failed")
+    
     def cancel_benchmark(self):
         """Cancel the running benchmark."""
         if self.is_sorting:
@@ -715,6 +4440,132 @@ class SortingBenchmarkApp:
         messagebox.showerror("Error", message)
         self.status_label.config(text="Error loading data")
 
+# ============================================================================
+# SYNTHETIC DATA - Seeded generator with adversarial distributions
+# ============================================================================
+
+DISTRIBUTIONS = ("random", "sorted", "reversed", "nearly-sorted", "organ-pipe",
+                 "few-unique", "zipf")
+GENERATOR_BATCH_ROWS = 65536   # Rows per writerows() call
+SYNTHETIC_DEFAULT_ROWS = 100000
+SYNTHETIC_ID_BASE = 1000000    # Generated IDs are 7-digit, like the shipped dataset
+FEW_UNIQUE_VALUES = 10         # Default distinct keys for "few-unique"
+ZIPF_EXPONENT = 1.1            # Default skew of "zipf" surnames
+
+FIRST_NAMES = ["James", "Mary", "John", "Patricia", "Robert", "Jennifer", "Michael", "Linda",
+               "William", "Elizabeth", "David", "Barbara", "Richard", "Susan", "Joseph",
+               "Jessica", "Thomas", "Sarah", "Charles", "Karen", "Christopher", "Nancy",
+               "Daniel", "Lisa", "Matthew", "Betty", "Anthony", "Margaret", "Mark", "Sandra",
+               "Paul", "Ashley", "Steven", "Kimberly", "Andrew", "Emily", "Joshua", "Donna",
+               "Kenneth", "Michelle", "Kevin", "Carol", "Brian", "Amanda", "George", "Melissa"]
+
+# Surnames are stem + ending combinations, about 900 distinct values
+_SURNAME_STEMS = ["Abe", "Ash", "Bar", "Black", "Brad", "Brook", "Cal", "Carl", "Cole", "Dal",
+                  "Dun", "East", "Ed", "Fair", "Fern", "Gar", "Gold", "Hal", "Hart", "Hol",
+                  "Ing", "Jar", "Ken", "King", "Lang", "Lind", "Mad", "Mar", "Mill", "Nor",
+                  "Oak", "Pal", "Pem", "Rad", "Red", "Ros", "Sal", "Stan", "Thorn", "Wal"]
+_SURNAME_ENDINGS = ["", "berg", "by", "den", "er", "field", "ford", "ham", "ley", "man", "more",
+                    "ner", "rick", "ridge", "s", "son", "stead", "ston", "ton", "ville", "well",
+                    "wood"]
+SURNAMES = [stem + ending for stem in _SURNAME_STEMS for ending in _SURNAME_ENDINGS]
+
+def _sorted_names(names):
+    distinct = list(dict.fromkeys(names))
+    return [distinct[i] for i in _merge_sort_order(distinct, False, ExecutionControl())]
+
+def synthetic_batches(rows, distribution="random", seed=0, swaps=None, unique_values=None,
+                      zipf_exponent=ZIPF_EXPONENT, batch_rows=GENERATOR_BATCH_ROWS):
+    """Yield (ids, first_names, last_names) lists of up to `batch_rows` rows.
+    
+    The same arguments always give the same records. In the ordered
+    distributions a row's rank sets its ID and picks both names from the
+    sorted name lists, so every column has the same shape:
+    
+    - "sorted" / "reversed": ranks 0..n-1 ascending or descending
+    - "nearly-sorted": sorted, then `swaps` random position swaps (default n/100)
+    - "organ-pipe": even ranks ascending, then odd ranks descending
+    - "few-unique": `unique_values` (default 10) distinct keys, heavy duplicates
+    - "zipf": random IDs and first names, surnames Zipf-distributed
+    - "random": uniform random IDs (duplicates possible) and names
+    """
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError(f"Unknown distribution: {distribution} (choose from {', '.join(DISTRIBUTIONS)})")
+    rng = random.Random(seed)
+    n = max(rows, 1)
+    first_sorted, last_sorted = _sorted_names(FIRST_NAMES), _sorted_names(SURNAMES)
+    
+    swapped = {}
+    if distribution == "nearly-sorted":
+        for _ in range(n // 100 if swaps is None else swaps):
+            a, b = rng.randrange(n), rng.randrange(n)
+            swapped[a], swapped[b] = swapped.get(b, b), swapped.get(a, a)
+    unique_values = unique_values or FEW_UNIQUE_VALUES
+    id_range = range(SYNTHETIC_ID_BASE, 10 * SYNTHETIC_ID_BASE)
+    if distribution == "zipf":
+        # Shuffled so the most frequent surnames are not simply the first alphabetically
+        zipf_names = list(last_sorted)
+        rng.shuffle(zipf_names)
+        cum_weights = list(itertools.accumulate(1 / rank ** zipf_exponent
+                                                for rank in range(1, len(zipf_names) + 1)))
+    
+    for start in range(0, rows, batch_rows):
+        positions = range(start, min(start + batch_rows, rows))
+        
+        if distribution in ("random", "zipf"):
+            ids = rng.choices(id_range, k=len(positions))
+            first_names = rng.choices(first_sorted, k=len(positions))
+            if distribution == "zipf":
+                last_names = rng.choices(zipf_names, cum_weights=cum_weights, k=len(positions))
+            else:
+                last_names = rng.choices(last_sorted, k=len(positions))
+            yield ids, first_names, last_names
+            continue
+        
+        span = n
+        if distribution == "sorted":
+            ranks = positions
+        elif distribution == "reversed":
+            ranks = [n - 1 - p for p in positions]
+        elif distribution == "nearly-sorted":
+            ranks = [swapped.get(p, p) for p in positions]
+        elif distribution == "organ-pipe":
+            ranks = [2 * p if 2 * p < n else 2 * (n - 1 - p) + 1 for p in positions]
+        else:  # few-unique
+            span = unique_values
+            ranks = rng.choices(range(unique_values), k=len(positions))
+        
+        first_count, last_count = len(first_sorted), len(last_sorted)
+        yield ([SYNTHETIC_ID_BASE + r for r in ranks],
+               [first_sorted[r * first_count // span] for r in ranks],
+               [last_sorted[r * last_count // span] for r in ranks])
+
+def generate_dataset(path, rows, distribution="random", seed=0, progress_callback=None, **options):
+    """Stream `rows` synthetic records to a CSV file with batched writes.
+    
+    `options` (swaps, unique_values, zipf_exponent) go to
+    synthetic_batches(). progress_callback(rows_written) is called after
+    every batch. Returns the number of rows written.
+    """
+    written = 0
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(REQUIRED_COLUMNS)
+        for ids, first_names, last_names in synthetic_batches(rows, distribution, seed, **options):
+            writer.writerows(zip(ids, first_names, last_names))
+            written += len(ids)
+            if progress_callback:
+                progress_callback(written)
+    return written
+
+def synthetic_dataset(rows, distribution="random", seed=0, **options):
+    """The records generate_dataset() would write, as an in-memory ColumnarDataset."""
+    dataset = ColumnarDataset()
+    append = dataset.append
+    for batch in synthetic_batches(rows, distribution, seed, **options):
+        for record_id, first_name, last_name in zip(*batch):
+            append(record_id, first_name, last_name)
+    return dataset
+
 # ============================================================================
 # UTILITY FUNCTIONS
 # ============================================================================
@@ -728,41 +4579,388 @@ def generate_sample_data():
     
     print("Generating sample data...")
     
-    # Sample first and last names for generation
-    first_names = ["James", "Mary", "John", "Patricia", "Robert", "Jennifer", 
-                   "Michael", "Linda", "William", "Elizabeth", "David", "Barbara",
-                   "Richard", "Susan", "Joseph", "Jessica", "Thomas", "Sarah",
-                   "Charles", "Karen", "Christopher", "Nancy", "Daniel", "Lisa"]
-    
-    last_names = ["Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia",
-                  "Miller", "Davis", "Rodriguez", "Martinez", "Hernandez", "Lopez",
-                  "Gonzalez", "Wilson", "Anderson", "Thomas", "Taylor", "Moore",
-                  "Jackson", "Martin", "Lee", "Perez", "Thompson", "White"]
-    
     try:
-        with open(sample_file, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=['ID', 'FirstName', 'LastName'])
-            writer.writeheader()
-            
-            for i in range(1, 10001):  # Generate 10,000 sample records
-                writer.writerow({
-                    'ID': i,
-                    'FirstName': first_names[i % len(first_names)],
-                    'LastName': last_names[i % len(last_names)]
-                })
-        
-        print(f"Generated sample data with 10,000 records at: {sample_file}")
+        rows = generate_dataset(sample_file, 10000, "random", seed=0)
+        print(f"Generated sample data with {rows:,} records at: {sample_file}")
         print("You can use this for testing, or replace with your own generated_data.csv")
         
     except Exception as e:
         print(f"Error generating sample data: {e}")
 
+# ============================================================================
+# HEADLESS BENCHMARK RUNNER - Command-line benchmark matrix
+# ============================================================================
+
+RESULT_FIELDS = ['algorithm', 'sort_key', 'descending', 'size', 'status', 'error', 'verified',
+                 'reference_match', 'top_k', 'sort_time', 'min_time', 'iqr', 'repeats', 'warmup', 'gc_disabled',
+                 'records_per_second', 'peak_memory', 'bytes_per_record', 'rss_growth',
+                 'comparisons', 'moves', 'allocations', 'max_depth']
+
+SCALING_FIELDS = ['algorithm', 'sort_key', 'target_size', 'sizes_measured', 'slope',
+                  'expected_slope', 'constant', 'r_squared', 'predicted_time',
+                  'scales_as_expected']
+
+def algorithm_slug(name):
+    """Command-line name of an algorithm, e.g. "Merge Sort (Bottom-Up)" -> "merge-bottom-up"."""
+    slug = name.lower().replace(" sort", "").replace("(", "").replace(")", "")
+    return "-".join(slug.split())
+
+def resolve_algorithm(name):
+    """Accept an algorithm's display name or slug (case-insensitive)."""
+    wanted = name.strip().lower()
+    for algorithm in SORT_ALGORITHMS:
+        if wanted in (algorithm.lower(), algorithm_slug(algorithm)):
+            return algorithm
+    raise ValueError(f"Unknown algorithm: {name} "
+                     f"(choose from {', '.join(algorithm_slug(a) for a in SORT_ALGORITHMS)})")
+
+def run_benchmark_matrix(dataset, algorithms, keys, sizes, directions,
+                         max_quadratic_size=QUADRATIC_SIZE_LIMIT, time_limit=None,
+                         log=print, **options):
+    """Run every algorithm × key × size × direction combination on `dataset`.
+    
+    `keys` are column names or sort specs; a size of None means the whole
+    dataset. O(n²) algorithms above `max_quadratic_size` are recorded as
+    skipped. Every sorted output is checked with verify_sorted() and, when
+    NumPy is installed, against a stable reference sort. `options`
+    (warmup, repeats, ...) are passed on to run_single_benchmark(). With a
+    time_limit, each combination runs in a child process through
+    run_isolated_benchmark() and is recorded as timed out if it overruns,
+    or as an error if the child dies (crash, out of memory).
+    """
+    sizes = list(dict.fromkeys(len(dataset) if s is None else min(s, len(dataset)) for s in sizes))
+    combos = [(a, k, s, d) for a in algorithms for k in keys for s in sizes for d in directions]
+    results = []
+    
+    for number, (algorithm, key, size, descending) in enumerate(combos, start=1):
+        label = f"[{number}/{len(combos)}] {algorithm} | {describe_sort_spec(key, descending)} | {size:,} rows"
+        
+        if algorithm in QUADRATIC_ALGORITHMS and size > max_quadratic_size:
+            results.append({'algorithm': algorithm, 'sort_key': describe_sort_spec(key, descending),
+                            'descending': descending, 'size': size, 'status': 'skipped'})
+            log(f"{label}: skipped (O(n²) above {max_quadratic_size:,} rows)")
+            continue
+        
+        try:
+            if time_limit:
+                sorted_data, result = run_isolated_benchmark(dataset[:size], algorithm, key,
+                                                             descending, time_limit=time_limit,
+                                                             **options)
+            else:
+                sorted_data, result = run_single_benchmark(dataset[:size], algorithm, key,
+                                                           descending, **options)
+        except BenchmarkTimeout:
+            results.append({'algorithm': algorithm, 'sort_key': describe_sort_spec(key, descending),
+                            'descending': descending, 'size': size, 'status': 'timeout'})
+            log(f"{label}: timed out after {time_limit:g}s")
+            continue
+        except RuntimeError as e:
+            results.append({'algorithm': algorithm, 'sort_key': describe_sort_spec(key, descending),
+                            'descending': descending, 'size': size, 'status': 'error',
+                            'error': str(e)})
+            log(f"{label}: error: {e}")
+            continue
+        result['verified'] = verify_sorted(sorted_data, key, descending)
+        result['reference_match'] = matches_reference(sorted_data, dataset[:size], key, descending)
+        result['status'] = ('ok' if result['verified'] and result['reference_match'] is not False
+                            else 'failed')
+        results.append(result)
+        log(f"{label}: median {result['sort_time']:.6f}s, min {result['min_time']:.6f}s, "
+            f"IQR {result['iqr']:.6f}s ({result['records_per_second'] or 0:,.0f} records/s) "
+            f"{'✓' if result['verified'] else '✗ NOT SORTED'}"
+            f"{' ✗ DIFFERS FROM REFERENCE' if result['reference_match'] is False else ''}")
+        if result['peak_memory'] is not None:
+            rss_text = (f", RSS +{result['rss_growth'] / (1024 * 1024):,.2f} MB"
+                        if result['rss_growth'] is not None else "")
+            log(f"    peak {result['peak_memory'] / (1024 * 1024):,.2f} MB traced "
+                f"({result['bytes_per_record']:,.1f} bytes/record){rss_text}")
+        if result['comparisons'] is not None:
+            log(f"    {result['comparisons']:,} comparisons, {result['moves']:,} moves, "
+                f"{result['allocations']:,} allocations, max depth {result['max_depth']}")
+    
+    return results
+
+def run_scaling_matrix(dataset, algorithms, keys, directions, max_size=None,
+                       time_budget=SCALING_TIME_BUDGET, log=print):
+    """Run a scaling sweep for every algorithm × key × direction combination."""
+    combos = [(a, k, d) for a in algorithms for k in keys for d in directions]
+    sweeps = []
+    
+    for number, (algorithm, key, descending) in enumerate(combos, start=1):
+        sweep = run_scaling_sweep(dataset, algorithm, key, descending,
+                                  max_size=max_size, time_budget=time_budget)
+        sweep['sizes_measured'] = len(sweep['points'])
+        sweeps.append(sweep)
+        label = f"[{number}/{len(combos)}] {algorithm} | {sweep['sort_key']}"
+        if sweep['slope'] is None:
+            log(f"{label}: too few sizes to fit")
+            continue
+        log(f"{label}: t(n) ≈ {sweep['constant']:.3g} · n^{sweep['slope']:.2f} "
+            f"(expected n^{sweep['expected_slope']:.0f}, R² {sweep['r_squared']:.3f}), "
+            f"predicted {format_duration(sweep['predicted_time'])} for {sweep['target_size']:,} rows "
+            f"{'✓' if sweep['scales_as_expected'] else '⚠ unexpected scaling'}")
+    
+    return sweeps
+
+def write_results_json(path, metadata, results):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(dict(metadata, results=results), f, indent=2, ensure_ascii=False)
+
+def write_results_csv(path, metadata, results, fields=RESULT_FIELDS):
+    """Write one row per result; run metadata is repeated on every row."""
+    meta_fields = list(metadata)
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=meta_fields + fields, extrasaction='ignore')
+        writer.writeheader()
+        for result in results:
+            writer.writerow(dict(metadata, **result))
+
+def machine_info():
+    """Describe the machine a benchmark ran on."""
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count()
+    }
+
+def _split_list(text, separator=","):
+    return [part.strip() for part in text.split(separator) if part.strip()]
+
+def synthetic_options(args):
+    return dict(swaps=args.swaps, unique_values=args.unique_values)
+
+def run_generate(args):
+    """Entry point for --generate: write a seeded synthetic CSV and exit."""
+    if args.generate < 1:
+        print("Error: --generate needs at least 1 row", file=sys.stderr)
+        return 2
+    distribution = args.distribution or "random"
+    output = args.generate_output or os.path.join(
+        DATA_DIR, f"synthetic_{distribution}_{args.generate}_seed{args.seed}.csv")
+    
+    start_time = time.perf_counter()
+    def report(rows):
+        print(f"\r{rows:,} / {args.generate:,} rows", end="", flush=True)
+    rows = generate_dataset(output, args.generate, distribution, args.seed,
+                            progress_callback=report, **synthetic_options(args))
+    elapsed = time.perf_counter() - start_time
+    print(f"\nWrote {rows:,} {distribution} rows (seed {args.seed}) to {output} in {elapsed:.2f}s")
+    return 0
+
+def run_headless(args):
+    """Entry point for --headless: run the benchmark matrix and export results.
+    
+    Returns the process exit code (1 if any sorted output failed verification
+    or any configuration regressed against --baseline).
+    """
+    if args.list_history:
+        history = BenchmarkHistory(args.history or HISTORY_PATH)
+        for session in history.sessions():
+            print(f"#{session['id']:<5} {session['recorded_at']}  {session['source']:<9} "
+                  f"{session['results']:>3} results  {session['label'] or ''}")
+        history.close()
+        return 0
+    
+    try:
+        algorithms = [resolve_algorithm(name) for name in _split_list(args.algorithms)]
+        keys = []
+        for text in _split_list(args.columns, ";"):
+            spec = parse_sort_spec(text)
+            keys.append(spec[0][0] if spec == [(spec[0][0], False)] else spec)
+        sizes = [None if s.lower() == "all" else int(s) for s in _split_list(args.sizes)]
+        directions = []
+        for d in _split_list(args.directions):
+            if d.lower() not in ("asc", "desc"):
+                raise ValueError(f"Unknown direction: {d} (use asc or desc)")
+            directions.append(d.lower() == "desc")
+        if args.warmup < 0 or args.repeats < 1:
+            raise ValueError("--warmup must be >= 0 and --repeats >= 1")
+        if args.top_k is not None:
+            if args.top_k < 1:
+                raise ValueError("--top-k must be at least 1")
+            if args.scaling:
+                raise ValueError("--top-k cannot be combined with --scaling")
+            algorithms = [PARTIAL_SORT_NAME]
+        if args.timeout is not None and args.timeout <= 0:
+            raise ValueError("--timeout must be positive")
+        if args.scaling and (args.history or args.baseline):
+            raise ValueError("--history and --baseline cannot be combined with --scaling")
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    
+    history = baseline_id = None
+    if args.history or args.baseline:
+        history = BenchmarkHistory(args.history or HISTORY_PATH)
+        if args.baseline:
+            baseline_id = (history.latest_session() if args.baseline == "latest"
+                           else int(args.baseline) if args.baseline.isdigit() else None)
+            if baseline_id is None or history.session(baseline_id) is None:
+                print(f"Error: No baseline session {args.baseline} in {history.path}",
+                      file=sys.stderr)
+                return 2
+    
+    start_time = time.perf_counter()
+    if args.distribution:
+        # Seeded in-memory data, as large as the largest requested size
+        rows = max([s for s in sizes if s is not None] or [SYNTHETIC_DEFAULT_ROWS])
+        dataset = synthetic_dataset(rows, args.distribution, args.seed, **synthetic_options(args))
+        data_path = f"synthetic:{args.distribution}:seed={args.seed}"
+        fingerprint = (data_path, rows)
+        load_source = "generated"
+    else:
+        data_path = os.path.abspath(args.data)
+        if not os.path.exists(data_path):
+            print(f"Error: Data file not found at {data_path}", file=sys.stderr)
+            return 2
+        try:
+            dataset, load_source = load_dataset(data_path, use_cache=not args.no_cache)
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 2
+        fingerprint = dataset_fingerprint(data_path)
+    load_time = time.perf_counter() - start_time
+    print(f"Loaded {len(dataset):,} records from {data_path} in {load_time:.3f}s ({load_source})")
+    if dataset.skipped_rows:
+        print(f"Skipped {dataset.skipped_rows:,} rows with a missing field or non-integer ID")
+    
+    if args.scaling:
+        max_size = max((len(dataset) if s is None else s) for s in sizes)
+        results = run_scaling_matrix(dataset, algorithms, keys, directions,
+                                     max_size=max_size, time_budget=args.scaling_budget)
+    else:
+        results = run_benchmark_matrix(dataset, algorithms, keys, sizes, directions,
+                                       max_quadratic_size=args.max_quadratic_size,
+                                       time_limit=args.timeout,
+                                       warmup=args.warmup, repeats=args.repeats,
+                                       disable_gc=args.disable_gc,
+                                       track_memory=args.track_memory,
+                                       count_operations=args.count_operations,
+                                       top_k=args.top_k)
+    
+    metadata = dict(
+        generated_at=datetime.now().isoformat(timespec='seconds'),
+        data_file=data_path,
+        total_records=len(dataset),
+        skipped_rows=dataset.skipped_rows,
+        load_time=load_time,
+        load_source=load_source,
+        **machine_info()
+    )
+    if args.output:
+        output_format = args.format or ("csv" if args.output.lower().endswith(".csv") else "json")
+        if output_format == "csv":
+            write_results_csv(args.output, metadata, results,
+                              SCALING_FIELDS if args.scaling else RESULT_FIELDS)
+        else:
+            write_results_json(args.output, metadata, results)
+        print(f"Results written to {args.output} ({output_format})")
+    
+    regressed = False
+    if history is not None:
+        if baseline_id is not None:
+            comparisons = compare_results(history.results(baseline_id), results)
+            print(format_comparison(comparisons, f"#{baseline_id}", "this run"))
+            regressed = any(c['verdict'] == "regression" for c in comparisons)
+        if args.history:
+            session_id = history.record(results, "headless", fingerprint=fingerprint,
+                                        label=args.label)
+            print(f"Recorded as session #{session_id} in {history.path}")
+        history.close()
+    
+    return 1 if regressed or any(r.get('status') in ('failed', 'error') for r in results) else 0
+
+def build_arg_parser():
+    parser = argparse.ArgumentParser(
+        description="Sorting Algorithm Stress Test. Starts the GUI unless --headless is given."
+    )
+    parser.add_argument("--headless", action="store_true",
+                        help="run a benchmark matrix without the GUI")
+    parser.add_argument("--data", default=DATA_FILE_PATH,
+                        help="CSV file with ID, FirstName, LastName columns")
+    parser.add_argument("--algorithms", default="merge,radix",
+                        help="comma-separated algorithm names or slugs: "
+                             + ", ".join(algorithm_slug(a) for a in SORT_ALGORITHMS))
+    parser.add_argument("--columns", default="ID;FirstName;LastName",
+                        help="semicolon-separated columns or sort specs, "
+                             "e.g. 'ID;LastName, FirstName, -ID'")
+    parser.add_argument("--sizes", default="1000,10000,100000",
+                        help="comma-separated dataset sizes, or 'all'")
+    parser.add_argument("--directions", default="asc",
+                        help="comma-separated: asc, desc")
+    parser.add_argument("--max-quadratic-size", type=int, default=QUADRATIC_SIZE_LIMIT,
+                        help="skip O(n²) algorithms above this many rows")
+    parser.add_argument("--warmup", type=int, default=1,
+                        help="untimed warmup runs before timing (default 1)")
+    parser.add_argument("--repeats", type=int, default=5,
+                        help="timed runs per combination; the median is reported (default 5)")
+    parser.add_argument("--disable-gc", action="store_true",
+                        help="collect garbage before and disable GC during each timed run")
+    parser.add_argument("--track-memory", action="store_true",
+                        help="record tracemalloc peak, bytes/record and RSS growth "
+                             "in two extra untimed runs")
+    parser.add_argument("--top-k", type=int,
+                        help="time a partial sort of the first K records (O(n log k)) "
+                             "instead of the listed algorithms")
+    parser.add_argument("--timeout", type=float,
+                        help="run each combination in a child process and kill it after this "
+                             "many seconds (recorded with status 'timeout', or 'error' if the "
+                             "child dies)")
+    parser.add_argument("--count-operations", action="store_true",
+                        help="count comparisons, moves, allocations and recursion depth "
+                             "in one extra untimed run")
+    parser.add_argument("--scaling", action="store_true",
+                        help="fit t(n) ≈ c·n^b over a doubling ladder of sizes up to the largest "
+                             "--sizes value and predict its run time, instead of the matrix")
+    parser.add_argument("--scaling-budget", type=float, default=SCALING_TIME_BUDGET,
+                        help="seconds of sorting per sweep before larger sizes are only predicted "
+                             f"(default {SCALING_TIME_BUDGET:g})")
+    parser.add_argument("--distribution", choices=DISTRIBUTIONS,
+                        help="benchmark on seeded synthetic data with this distribution "
+                             "instead of --data (or the distribution for --generate)")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="random seed for --distribution / --generate (default 0)")
+    parser.add_argument("--swaps", type=int,
+                        help="position swaps for nearly-sorted data (default rows / 100)")
+    parser.add_argument("--unique-values", type=int,
+                        help=f"distinct keys for few-unique data (default {FEW_UNIQUE_VALUES})")
+    parser.add_argument("--generate", type=int, metavar="ROWS",
+                        help="write ROWS synthetic records to a CSV and exit")
+    parser.add_argument("--generate-output",
+                        help="CSV path for --generate (default: a descriptive name in the data folder)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="always parse the CSV instead of using the binary cache")
+    parser.add_argument("--history", nargs="?", const=HISTORY_PATH,
+                        help="record the results in a SQLite benchmark history "
+                             f"(default {os.path.basename(HISTORY_PATH)} in the data folder)")
+    parser.add_argument("--label", help="label for the session recorded with --history")
+    parser.add_argument("--baseline",
+                        help="history session id (or 'latest') to check this run against; "
+                             "significant slowdowns make the exit code 1")
+    parser.add_argument("--list-history", action="store_true",
+                        help="list recent history sessions and exit")
+    parser.add_argument("--output", help="write results to this .json or .csv file")
+    parser.add_argument("--format", choices=["json", "csv"],
+                        help="output format (default: from the --output extension)")
+    return parser
+
 # ============================================================================
 # MAIN ENTRY POINT
 # ============================================================================
 
-def main():
+def main(argv=None):
     """Main entry point for the application."""
+    args = build_arg_parser().parse_args(argv)
+    if args.generate is not None:
+        sys.exit(run_generate(args))
+    if args.headless:
+        sys.exit(run_headless(args))
+    
+    if tk is None:
+        print("tkinter is not available; use --headless to run benchmarks without the GUI.")
+        return
+    
     # Check if data directory exists and create if needed
     if not os.path.exists(DATA_DIR):
         os.makedirs(DATA_DIR, exist_ok=True)
@@ -805,4 +5003,5 @@ def main():
     root.mainloop()
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # Needed for worker processes in a frozen build
     main()
\ No newline at end of file
@@ -1,5 +1,7 @@
+import argparse
 import time
 import os
+from array import array
 
 def bubble_sort_descending(arr):
     """
@@ -22,7 +24,30 @@ def bubble_sort_descending(arr):
             break
     return arr
 
+def read_numbers(filename):
+    """
+    Reads whitespace-separated integers from a file in one bulk read.
+    Returns them in a typed array ('q' = 64-bit signed integers).
+    """
+    with open(filename, 'rb') as f:
+        # split() without arguments skips blank lines and stray whitespace
+        return array('q', map(int, f.read().split()))
+
+def write_numbers(filename, numbers):
+    """
+    Writes one number per line with a single buffered write.
+    """
+    with open(filename, 'w') as out_f:
+        out_f.write("\n".join(map(str, numbers)))
+        if numbers:
+            out_f.write("\n")
+
 def main():
+    parser = argparse.ArgumentParser(description="Sort dataset.txt in descending order with Bubble Sort.")
+    parser.add_argument("-q", "--quiet", action="store_true",
+                        help="don't print the full sorted list to the console")
+    args = parser.parse_args()
+    
     # --- UPDATE START: Automatically find the file in the script's folder ---
     # Get the directory where this script is currently located
     script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -39,34 +64,38 @@ def main():
     print(f"Reading {filename}...")
     
     try:
-        # Read all lines from the file
-        with open(filename, 'r') as f:
-            # Convert each non-empty line to an integer
-            numbers = [int(line.strip()) for line in f if line.strip()]
+        # Read the whole file at once into a typed array
+        start_time = time.perf_counter()
+        numbers = read_numbers(filename)
+        read_time = time.perf_counter() - start_time
             
         print(f"Successfully loaded {len(numbers)} numbers.")
         print("Sorting... (This may take a moment for large datasets)")
         
-        # Measure time
-        start_time = time.time()
+        # Measure the sort only. It runs on a list: indexing a typed array
+        # creates a new int object on every access, which is much slower
+        numbers = numbers.tolist()
+        start_time = time.perf_counter()
         sorted_numbers = bubble_sort_descending(numbers)
-        end_time = time.time()
+        sort_time = time.perf_counter() - start_time
         
-        time_taken = end_time - start_time
+        # Save to file to make it easier to view
+        # We also save the output to the same folder as the script
+        output_file = os.path.join(script_dir, 'sorted_output.txt')
+        start_time = time.perf_counter()
+        write_numbers(output_file, sorted_numbers)
+        write_time = time.perf_counter() - start_time
         
         # Display Results
         print("\n--- Results ---")
-        print(f"Time Taken: {time_taken:.6f} seconds")
+        print(f"Read Time:  {read_time:.6f} seconds")
+        print(f"Sort Time:  {sort_time:.6f} seconds")
+        print(f"Write Time: {write_time:.6f} seconds")
         print(f"Total Numbers Sorted: {len(sorted_numbers)}")
-        print("Sorted Data (Descending):")
-        print(sorted_numbers)  # This prints ALL numbers
+        if not args.quiet:
+            print("Sorted Data (Descending):")
+            print(sorted_numbers)  # This prints ALL numbers
         
-        # Optional: Save to file to make it easier to view
-        # We also save the output to the same folder as the script
-        output_file = os.path.join(script_dir, 'sorted_output.txt')
-        with open(output_file, 'w') as out_f:
-            for num in sorted_numbers:
-                out_f.write(f"{num}\n")
         print(f"\n(A copy of the sorted results has also been saved to '{output_file}')")
 
     except ValueError:
@@ -1,5 +1,25 @@
+import gc
+import hashlib
+import itertools
+import json
+import math
+import os
+import platform
 import random
+import sqlite3
+import statistics
 import time
+from array import array
+from datetime import datetime
+
+HISTORY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmark_history.sqlite3")
+REGRESSION_ALPHA = 0.05          # one-sided significance level for a slowdown
+REGRESSION_MIN_SLOWDOWN = 0.05   # significant changes under 5% are not flagged
+MANN_WHITNEY_EXACT_LIMIT = 400  # up to this many sample pairs the p-value is exact
+
+DISTRIBUTIONS = ["random", "sorted", "reversed", "nearly-sorted", "organ-pipe", "few-unique", "zipf"]
+FEW_UNIQUE_VALUES = 10
+ZIPF_EXPONENT = 1.1
 
 # ---------------- SORTING ALGORITHMS ---------------- #
 
@@ -54,14 +74,240 @@ def merge_sort(arr):
 
 # ---------------- UTILITY FUNCTIONS ---------------- #
 
-def generate_data(size):
-    return [random.randint(1, size) for _ in range(size)]
+def generate_data(size, distribution="random", seed=None):
+    """Test input of `size` integers; the same size, distribution and seed
+    always give the same list.
+
+    - random: uniform values in 1..size
+    - sorted / reversed: 1..size ascending or descending
+    - nearly-sorted: sorted, then size // 100 random swaps
+    - organ-pipe: odd values ascending, then even values descending
+    - few-unique: only FEW_UNIQUE_VALUES distinct values
+    - zipf: values in 1..size, small ones far more frequent (Zipf)
+    """
+    rng = random.Random(seed)
+    if distribution == "random":
+        return [rng.randint(1, size) for _ in range(size)]
+    if distribution == "sorted":
+        return list(range(1, size + 1))
+    if distribution == "reversed":
+        return list(range(size, 0, -1))
+    if distribution == "nearly-sorted":
+        data = list(range(1, size + 1))
+        for _ in range(size // 100 if size else 0):
+            i, j = rng.randrange(size), rng.randrange(size)
+            data[i], data[j] = data[j], data[i]
+        return data
+    if distribution == "organ-pipe":
+        return [2 * p + 1 if 2 * p < size else 2 * (size - p) for p in range(size)]
+    if distribution == "few-unique":
+        return rng.choices(range(1, FEW_UNIQUE_VALUES + 1), k=size)
+    if distribution == "zipf":
+        cum_weights = list(itertools.accumulate(1 / k ** ZIPF_EXPONENT for k in range(1, size + 1)))
+        return rng.choices(range(1, size + 1), cum_weights=cum_weights, k=size)
+    raise ValueError(f"Unknown distribution: {distribution}")
 
 
 def is_sorted(arr):
     return all(arr[i] <= arr[i + 1] for i in range(len(arr) - 1))
 
 
+# ---------------- TIMING HARNESS ---------------- #
+
+def time_sort(sort_func, data, warmup=1, repeats=5, disable_gc=True):
+    """Sort fresh copies of data: `warmup` untimed runs, then `repeats` timed
+    runs measured with perf_counter_ns. With disable_gc, garbage is collected
+    before each timed run and the collector is off while it runs.
+    Returns (sorted copy from the last run, list of run times in seconds)."""
+    times = []
+    arr = data
+    gc_was_enabled = gc.isenabled()
+    try:
+        for run in range(warmup + repeats):
+            arr = data.copy()
+            if disable_gc:
+                gc.collect()
+                gc.disable()
+            start = time.perf_counter_ns()
+            sort_func(arr)
+            elapsed = time.perf_counter_ns() - start
+            if disable_gc and gc_was_enabled:
+                gc.enable()
+            if run >= warmup:
+                times.append(elapsed / 1e9)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return arr, times
+
+
+def summarize(times, size):
+    median = statistics.median(times)
+    if len(times) > 1:
+        q1, _, q3 = statistics.quantiles(times, n=4, method="inclusive")
+    else:
+        q1 = q3 = times[0]
+    return {
+        "median": median,
+        "min": min(times),
+        "iqr": q3 - q1,
+        "throughput": size / median if median > 0 else float("inf"),
+    }
+
+
+def data_fingerprint(data):
+    """Short hash identifying the exact input that was sorted."""
+    return hashlib.sha1(array("q", data).tobytes()).hexdigest()[:16]
+
+
+def machine_info():
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+# ---------------- BENCHMARK HISTORY ---------------- #
+
+def open_history(path=HISTORY_PATH):
+    connection = sqlite3.connect(path)
+    connection.row_factory = sqlite3.Row
+    with connection:
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS runs (id INTEGER PRIMARY KEY, recorded_at TEXT, "
+            "algorithm TEXT, size INTEGER, warmup INTEGER, repeats INTEGER, median REAL, "
+            "min REAL, iqr REAL, throughput REAL, sorted_ok INTEGER, samples TEXT, "
+            "machine TEXT, fingerprint TEXT)"
+        )
+    return connection
+
+
+def record_run(connection, algorithm, size, warmup, times, stats, sorted_ok, fingerprint):
+    """Store one benchmark run and return its id."""
+    with connection:
+        cursor = connection.execute(
+            "INSERT INTO runs (recorded_at, algorithm, size, warmup, repeats, median, min, iqr, "
+            "throughput, sorted_ok, samples, machine, fingerprint) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (datetime.now().isoformat(timespec="seconds"), algorithm, size, warmup, len(times),
+             stats["median"], stats["min"], stats["iqr"], stats["throughput"], sorted_ok,
+             json.dumps(times), json.dumps(machine_info()), fingerprint),
+        )
+    return cursor.lastrowid
+
+
+def earlier_runs(connection, algorithm, size, distribution, before_id):
+    """Earlier runs with the same algorithm, size and input distribution, newest first."""
+    return connection.execute(
+        "SELECT id, recorded_at, median, repeats FROM runs "
+        "WHERE algorithm = ? AND size = ? AND fingerprint LIKE ? AND id < ? "
+        "ORDER BY id DESC LIMIT 5",
+        (algorithm, size, f"{distribution}:%", before_id),
+    ).fetchall()
+
+
+def mann_whitney_p(baseline, candidate):
+    """One-sided p-value that `candidate` times tend to be larger than `baseline`.
+
+    Mann-Whitney U test; it makes no assumption about the shape of the
+    timing distribution. Up to MANN_WHITNEY_EXACT_LIMIT pairs
+    (n_base · n_cand) the p-value is exact, counted over every way of
+    splitting the pooled ranks, so 3 runs a side can never score below
+    1/C(6, 3) = 0.05. Larger samples use the normal approximation with tie
+    and continuity corrections. Returns None with fewer than two samples
+    on either side.
+
+    PRELIM-EXAM/src/main.py and PRELIM-LAB-WORK-2/main.py keep identical
+    copies of this function on purpose: both scripts are standalone.
+    """
+    n_base, n_cand = len(baseline), len(candidate)
+    if n_base < 2 or n_cand < 2:
+        return None
+
+    # Doubled average ranks over the pooled samples: ties share their mean
+    # rank, and doubling keeps those means whole for the exact count
+    pooled = sorted([(value, 0) for value in baseline] + [(value, 1) for value in candidate])
+    n = len(pooled)
+    ranks = []
+    tie_term = 0
+    i = 0
+    while i < n:
+        j = i
+        while j + 1 < n and pooled[j + 1][0] == pooled[i][0]:
+            j += 1
+        ties = j - i + 1
+        tie_term += ties ** 3 - ties
+        ranks.extend([i + j + 2] * ties)
+        i = j + 1
+    rank_sum = sum(rank for rank, (_, side) in zip(ranks, pooled) if side)
+
+    if n_base * n_cand <= MANN_WHITNEY_EXACT_LIMIT:
+        return _rank_sum_tail(ranks, n_cand, rank_sum)
+
+    u = rank_sum / 2 - n_cand * (n_cand + 1) / 2
+    mean = n_base * n_cand / 2
+    variance = n_base * n_cand / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (u - mean - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def _rank_sum_tail(ranks, size, observed):
+    """Share of the ways to pick `size` of `ranks` whose sum is `observed` or more."""
+    total = sum(ranks)
+    upper = size <= len(ranks) - size
+    if not upper:
+        # Count the smaller complement, whose sum is then at most total - observed
+        size, observed = len(ranks) - size, total - observed
+
+    # counts[k][s]: number of k-rank subsets summing to s
+    counts = [{0: 1}] + [{} for _ in range(size)]
+    for rank in ranks:
+        for k in range(size, 0, -1):
+            target = counts[k]
+            for s, ways in counts[k - 1].items():
+                target[s + rank] = target.get(s + rank, 0) + ways
+
+    hits = sum(ways for s, ways in counts[size].items()
+               if (s >= observed if upper else s <= observed))
+    return hits / math.comb(len(ranks), size)
+
+
+def compare_with_baseline(connection, baseline_id, times, median):
+    """Print whether this run is significantly slower than run `baseline_id`."""
+    row = connection.execute("SELECT median, samples FROM runs WHERE id = ?", (baseline_id,)).fetchone()
+    if row is None:
+        print(f"No run #{baseline_id} in the history.")
+        return
+    baseline = json.loads(row["samples"])
+    change = median / row["median"] - 1
+    p_slower = mann_whitney_p(baseline, times)
+    p_faster = mann_whitney_p(times, baseline)
+
+    print(f"\n--- COMPARED WITH RUN #{baseline_id} ---")
+    print(f"Baseline Median: {row['median']:.6f} seconds")
+    print(f"Change: {change:+.1%}")
+    if p_slower is None:
+        print("Verdict: not enough runs for a significance test (use at least 2 on both sides)")
+    elif p_slower < REGRESSION_ALPHA and change >= REGRESSION_MIN_SLOWDOWN:
+        print(f"Verdict: REGRESSION - significantly slower (p={p_slower:.3f})")
+    elif p_faster < REGRESSION_ALPHA and change <= -REGRESSION_MIN_SLOWDOWN:
+        print(f"Verdict: improvement - significantly faster (p={p_faster:.3f})")
+    elif min(p_slower, p_faster) < REGRESSION_ALPHA:
+        print(f"Verdict: significant but under {REGRESSION_MIN_SLOWDOWN:.0%}, not flagged "
+              f"(p={min(p_slower, p_faster):.3f})")
+    else:
+        print(f"Verdict: no significant change (p={min(p_slower, p_faster):.3f})")
+
+
+def read_int(prompt, default):
+    text = input(prompt).strip()
+    return int(text) if text else default
+
+
 # ---------------- MAIN PROGRAM ---------------- #
 
 def main():
@@ -78,31 +324,83 @@ def main():
         print("Invalid input. Please enter a number.")
         return
 
-    data = generate_data(size)
-    data_to_sort = data.copy()
+    print("Input: " + ", ".join(f"[{i}] {name}" for i, name in enumerate(DISTRIBUTIONS, start=1)))
+    while True:
+        try:
+            number = read_int("Select input distribution [1]: ", 1)
+        except ValueError:
+            number = 0
+        if 1 <= number <= len(DISTRIBUTIONS):
+            break
+        print(f"Invalid input. Pick a distribution from 1 to {len(DISTRIBUTIONS)}.")
+    distribution = DISTRIBUTIONS[number - 1]
+
+    try:
+        seed = read_int("Random seed [new]: ", random.randrange(2 ** 32))
+    except ValueError:
+        print("Invalid input. The seed must be a whole number.")
+        return
 
-    start = time.perf_counter()
+    try:
+        repeats = read_int("Timed runs [5]: ", 5)
+        warmup = read_int("Warmup runs [1]: ", 1)
+        if repeats < 1 or warmup < 0:
+            raise ValueError
+    except ValueError:
+        print("Invalid input. Runs must be at least 1 and warmup at least 0.")
+        return
 
     if choice == "1":
-        bubble_sort(data_to_sort)
+        sort_func = bubble_sort
         algorithm = "Bubble Sort"
     elif choice == "2":
-        insertion_sort(data_to_sort)
+        sort_func = insertion_sort
         algorithm = "Insertion Sort"
     elif choice == "3":
-        merge_sort(data_to_sort)
+        sort_func = merge_sort
         algorithm = "Merge Sort"
     else:
         print("Invalid algorithm selection.")
         return
 
-    end = time.perf_counter()
+    data = generate_data(size, distribution, seed)
+    data_to_sort, times = time_sort(sort_func, data, warmup=warmup, repeats=repeats)
+    stats = summarize(times, size)
 
     print("\n--- RESULTS ---")
     print(f"Algorithm Used: {algorithm}")
     print(f"Dataset Size: {size}")
-    print(f"Execution Time: {end - start:.6f} seconds")
-    print(f"Sorted Correctly: {is_sorted(data_to_sort)}")
+    print(f"Input: {distribution} (seed {seed})")
+    print(f"Execution Time: {stats['median']:.6f} seconds (median of {repeats} runs, {warmup} warmup)")
+    print(f"Min Time: {stats['min']:.6f} seconds")
+    print(f"IQR: {stats['iqr']:.6f} seconds")
+    print(f"Throughput: {stats['throughput']:,.0f} records/second")
+    sorted_ok = is_sorted(data_to_sort)
+    print(f"Sorted Correctly: {sorted_ok}")
+
+    try:
+        connection = open_history()
+        run_id = record_run(connection, algorithm, size, warmup, times, stats, sorted_ok,
+                            f"{distribution}:seed={seed}:{data_fingerprint(data)}")
+    except sqlite3.Error as e:
+        print(f"Could not record history: {e}")
+        return
+    print(f"Recorded as run #{run_id} in {HISTORY_PATH}")
+
+    previous = earlier_runs(connection, algorithm, size, distribution, run_id)
+    if previous:
+        print(f"\nEarlier {algorithm} runs on {size} {distribution} records:")
+        for row in previous:
+            print(f"  #{row['id']}  {row['recorded_at']}  median {row['median']:.6f}s ({row['repeats']} runs)")
+        try:
+            baseline_id = read_int(f"Baseline run to compare with [{previous[0]['id']}, 0 to skip]: ",
+                                   previous[0]["id"])
+        except ValueError:
+            print("Invalid input. Skipping the comparison.")
+            baseline_id = 0
+        if baseline_id:
+            compare_with_baseline(connection, baseline_id, times, stats["median"])
+    connection.close()
 
 
 if __name__ == "__main__":